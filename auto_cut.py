@@ -0,0 +1,138 @@
+# ================================================================
+#  DURAKLAMA KESME MODÜLÜ (auto_cut.py)
+#  ================================================================
+#  Kafe molaları, trafik ışıkları gibi duraklamalar render edilmez:
+#
+#  - Telemetri taranır: hız eşiği + histerezis (durma / yeniden
+#    hareket eşikleri ayrı) ve GPX boşlukları (otomatik duraklatma)
+#  - Kısa duraklamalar korunur, uzunlar kenarlarda biraz pay
+#    bırakılarak kesilir
+#  - Kalan aralıklar çıkış frame'lerine eşlenir; kesilen kısımlar
+#    hiç çözülmez (decoder ileri seek eder)
+#  - HUD süresi video saati yerine hareket süresini gösterir
+#  ================================================================
+
+import math
+
+import numpy as np
+
+from config import AUTO_CUT_CONFIG
+
+
+# Telemetry scan rate used by the classifier (samples per second)
+_SCAN_HZ = 2.0
+
+
+def auto_cut_enabled():
+    """True if stopped footage should be cut from the render."""
+    return bool(AUTO_CUT_CONFIG.get('enabled', False))
+
+
+# ================================================================
+#  HAREKET / DURMA SINIFLANDIRMA
+#  ================================================================
+
+def classify_stopped(speed, seg_seconds, stop_kmh, resume_kmh, gap_seconds):
+    """
+    Boolean 'stopped' flag per telemetry sample.
+
+    Riding switches to stopped below `stop_kmh` and back to moving only
+    above `resume_kmh`, so GPS jitter around one threshold does not flicker.
+    A GPX segment longer than `gap_seconds` (device auto-pause) is stopped.
+    Samples outside the GPX track (NaN `seg_seconds`) count as moving, so
+    footage without telemetry is never cut.
+    """
+    stopped = np.zeros(len(speed), dtype=bool)
+    moving = True
+    for i in range(len(speed)):
+        if np.isnan(seg_seconds[i]):
+            moving = True
+            continue
+        if seg_seconds[i] > gap_seconds:
+            moving = False
+        elif moving and speed[i] < stop_kmh:
+            moving = False
+        elif not moving and speed[i] > resume_kmh:
+            moving = True
+        stopped[i] = not moving
+    return stopped
+
+
+def find_stops(data_handler, video_duration):
+    """
+    Return the [(t0, t1)] video-time intervals to cut over the whole video,
+    following AUTO_CUT_CONFIG.
+    """
+    times = np.arange(int(math.ceil(video_duration * _SCAN_HZ))) / _SCAN_HZ
+    if len(times) == 0:
+        return []
+    batch = data_handler.get_data_batch(times)
+    stopped = classify_stopped(batch['speed'], batch['seg_seconds'],
+                               float(AUTO_CUT_CONFIG.get('stop_speed_kmh', 3.0)),
+                               float(AUTO_CUT_CONFIG.get('resume_speed_kmh', 6.0)),
+                               float(AUTO_CUT_CONFIG.get('gap_seconds', 10)))
+
+    min_stop = float(AUTO_CUT_CONFIG.get('min_stop_seconds', 10))
+    pad = float(AUTO_CUT_CONFIG.get('pad_seconds', 1.0))
+    step = 1.0 / _SCAN_HZ
+    # Run borders of the stopped flag: starts at rising, ends at falling edges
+    edges = np.diff(np.concatenate(([0], stopped.astype(np.int8), [0])))
+    cuts = []
+    for i0, i1 in zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)):
+        t0 = times[i0]
+        t1 = min(video_duration, times[i1 - 1] + step)
+        if t1 - t0 < min_stop:
+            continue
+        # Keep a little footage on each side that borders riding
+        if t0 > 0:
+            t0 += pad
+        if t1 < video_duration:
+            t1 -= pad
+        if t1 > t0:
+            cuts.append((float(t0), float(t1)))
+    return cuts
+
+
+# ================================================================
+#  ÇIKIŞ ZAMAN ÇİZELGESİ
+#  ================================================================
+
+class MovingTimeline:
+    """
+    Output frame → source frame map of a render window with stops removed.
+
+    `frames[k]` is the window-relative source frame index (as used by
+    FrameSource) of output frame k. `moving_time(t)` is the riding time at
+    video time `t`: the video clock minus every cut before it.
+    """
+
+    def __init__(self, cuts, start_offset, duration, fps):
+        self.cuts = list(cuts)
+        self.start_offset = start_offset
+        total = int(duration * fps)
+        src_t = start_offset + np.arange(total) / fps
+        keep = np.ones(total, dtype=bool)
+        for t0, t1 in self.cuts:
+            keep &= ~((src_t >= t0) & (src_t < t1))
+        self.frames = np.flatnonzero(keep)
+        self.cut_frames = total - len(self.frames)
+
+    def __len__(self):
+        return len(self.frames)
+
+    def moving_time(self, t):
+        removed = sum(max(0.0, min(t, t1) - t0) for t0, t1 in self.cuts if t0 < t)
+        return t - removed
+
+
+def plan_moving_timeline(data_handler, video_duration, start_offset, duration, fps):
+    """Classify the video and return the MovingTimeline of the render window."""
+    cuts = find_stops(data_handler, video_duration)
+    timeline = MovingTimeline(cuts, start_offset, duration, fps)
+    window_end = start_offset + duration
+    in_window = [(t0, t1) for t0, t1 in cuts if t1 > start_offset and t0 < window_end]
+    print(f"\n⏸️  Auto-cut: {len(in_window)} stop(s) removed, "
+          f"{timeline.cut_frames / fps:.0f}s of {duration:.0f}s skipped")
+    for t0, t1 in in_window:
+        print(f"     - {int(t0 // 3600)}:{int(t0 // 60) % 60:02d}:{int(t0) % 60:02d}  ({t1 - t0:.0f}s)")
+    return timeline
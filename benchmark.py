@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+# ================================================================
+#  PERFORMANS ÖLÇÜM (BENCHMARK) MODÜLÜ (benchmark.py)
+#  ================================================================
+#  Bir değişikliğin VeloMetrics'i hızlandırıp hızlandırmadığını
+#  tekrarlanabilir şekilde ölçer:
+#
+#  - Sentetik GPX üretir (uzunluk, örnekleme sıklığı, HR/kadans
+#    seçilebilir; sabit tohum = her seferinde aynı iz)
+#  - Sentetik test videosu üretir (ffmpeg testsrc2; 720p/1080p/4K)
+#  - Aşamaları ayrı ayrı ölçer: GPX parse, get_data, get_data_batch,
+#    decode, render_unified_hud (ve widget başına), birleştirme,
+#    encode, uçtan uca serial render FPS'i
+#  - Sonuçları JSON'a yazar; önceki bir sonuçla karşılaştırıp eşik
+#    üstündeki yavaşlamaları raporlar (çıkış kodu 1)
+#
+#  Kullanım:  python benchmark.py --size 1080p --out bench.json
+#             python benchmark.py --baseline bench.json --threshold 0.15
+#  ================================================================
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+
+import cv2
+import numpy as np
+
+from config import ZAMAN_OFFSET_SANIYE, HUD_CONFIG
+from ffmpeg_utils import run_ffmpeg, FrameReader, FrameWriter
+from hud_kernels import pixel_kernel_backend
+
+
+VIDEO_SIZES = {
+    '720p': (1280, 720),
+    '1080p': (1920, 1080),
+    '4k': (3840, 2160),
+}
+
+# Stage metrics compared against a baseline: lower is better
+_TIMED_KEYS = ('per_call_ms',)
+
+
+# ================================================================
+#  SENTETİK GİRDİLER
+#  ================================================================
+
+def write_synthetic_gpx(path, minutes=60, sample_hz=1.0, hr=True, cad=True, seed=1):
+    """
+    Write a deterministic GPX ride: a wandering route with rolling hills,
+    speed between ~15 and ~45 km/h, and optional heart rate / cadence.
+    Returns the number of track points.
+    """
+    rng = np.random.RandomState(seed)
+    n = max(2, int(minutes * 60 * sample_hz))
+    dt = 1.0 / sample_hz
+    t = np.arange(n) * dt
+    speed = 30 + 12 * np.sin(t / 97.0) + np.cumsum(rng.normal(0, 0.15, n)).clip(-4, 4)   # km/h
+    heading = np.cumsum(rng.normal(0, 0.02, n)) + 0.3 * np.sin(t / 211.0)
+    step = speed / 3.6 * dt
+    north = np.cumsum(step * np.cos(heading))
+    east = np.cumsum(step * np.sin(heading))
+    lat0, lon0 = 41.0, 29.0
+    lat = lat0 + north / 111320.0
+    lon = lon0 + east / (111320.0 * math.cos(math.radians(lat0)))
+    ele = 120 + 40 * np.sin(t / 300.0) + 8 * np.sin(t / 41.0)
+    heart = (135 + 20 * np.sin(t / 150.0) + rng.normal(0, 1.5, n)).astype(int)
+    cadence = (85 + 8 * np.sin(t / 60.0) + rng.normal(0, 2, n)).astype(int)
+
+    start = datetime(2025, 1, 1, 8, 0, 0, tzinfo=timezone.utc)
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>',
+             '<gpx version="1.1" creator="VeloMetrics benchmark" xmlns="http://www.topografix.com/GPX/1/1" '
+             'xmlns:gpxtpx="http://www.garmin.com/xmlschemas/TrackPointExtension/v1"><trk><trkseg>']
+    for i in range(n):
+        when = (start + timedelta(seconds=float(t[i]))).strftime('%Y-%m-%dT%H:%M:%S.%fZ')
+        ext = ''
+        if hr or cad:
+            ext = ('<extensions><gpxtpx:TrackPointExtension>'
+                   + (f'<gpxtpx:hr>{heart[i]}</gpxtpx:hr>' if hr else '')
+                   + (f'<gpxtpx:cad>{cadence[i]}</gpxtpx:cad>' if cad else '')
+                   + '</gpxtpx:TrackPointExtension></extensions>')
+        parts.append(f'<trkpt lat="{lat[i]:.7f}" lon="{lon[i]:.7f}"><ele>{ele[i]:.1f}</ele>'
+                     f'<time>{when}</time>{ext}</trkpt>')
+    parts.append('</trkseg></trk></gpx>')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(parts))
+    return n
+
+
+def make_synthetic_video(path, size, seconds=10, fps=30):
+    """Encode an ffmpeg `testsrc2` clip (moving pattern, 2 s GOP) to `path`."""
+    W, H = size
+    run_ffmpeg(['-f', 'lavfi', '-i', f"testsrc2=size={W}x{H}:rate={fps}", '-t', f"{seconds}",
+                '-c:v', 'libx264', '-preset', 'ultrafast', '-g', str(int(fps * 2)),
+                '-pix_fmt', 'yuv420p', path])
+
+
+# ================================================================
+#  ÖLÇÜM YARDIMCILARI
+#  ================================================================
+
+def _stage(seconds, calls):
+    return {
+        'seconds': round(seconds, 6),
+        'calls': int(calls),
+        'per_call_ms': round(seconds * 1000.0 / max(1, calls), 4),
+    }
+
+
+def time_calls(fn, args_list, repeat=1):
+    """Best-of-`repeat` wall time of calling fn(*args) for every args tuple."""
+    best = float('inf')
+    for _ in range(max(1, repeat)):
+        t0 = time.perf_counter()
+        for args in args_list:
+            fn(*args)
+        best = min(best, time.perf_counter() - t0)
+    return _stage(best, len(args_list))
+
+
+# ================================================================
+#  AŞAMALAR
+#  ================================================================
+
+def run_benchmark(video_path, gpx_path, size, fps, frames, hud_samples, repeat, output_dir):
+    """Time every stage and return the results dict (see module header)."""
+    from data_handler import DataHandler, telemetry_row
+    from hud_layout import render_unified_hud, collect_widget_jobs
+    from video_renderer import blend_hud, get_encoder_settings
+    from utils import clear_gradient_cache
+
+    W, H = size
+    results = {}
+    times = [n / fps for n in range(frames)]
+
+    # GPX parse (DataHandler construction: parse + per-point precomputation)
+    t0 = time.perf_counter()
+    data_handler = DataHandler(gpx_path)
+    results['parse'] = _stage(time.perf_counter() - t0, 1)
+    results['parse']['points'] = len(data_handler.points)
+
+    # Sequential get_data over the frame times (fresh handler each repeat: power smoothing is stateful)
+    best = float('inf')
+    for _ in range(max(1, repeat)):
+        handler = data_handler.fork()
+        t0 = time.perf_counter()
+        for t in times:
+            handler.get_data(t)
+        best = min(best, time.perf_counter() - t0)
+    results['get_data'] = _stage(best, len(times))
+    # One batched call for all frame times, reported per frame like get_data
+    batch = time_calls(data_handler.get_data_batch, [(times,)], repeat)
+    results['get_data_batch'] = _stage(batch['seconds'], len(times))
+
+    # Decode to BGR (ffmpeg → Python pipe)
+    t0 = time.perf_counter()
+    decoded = []
+    with FrameReader(video_path, size, 0.0, frames) as reader:
+        while True:
+            frame = reader.read()
+            if frame is None:
+                break
+            decoded.append(frame)
+    results['decode'] = _stage(time.perf_counter() - t0, len(decoded))
+    if not decoded:
+        raise RuntimeError(f"could not decode {video_path}")
+
+    # HUD drawing at evenly spaced times (every call is a full redraw)
+    telemetry = data_handler.get_data_batch(times)
+    idx = np.linspace(0, len(times) - 1, max(1, hud_samples)).astype(int)
+    hud_args = [(decoded[0], telemetry_row(telemetry, i), data_handler, times[i]) for i in idx]
+    render_unified_hud(*hud_args[0])   # warm up layout caches
+    results['hud'] = time_calls(render_unified_hud, hud_args, repeat)
+
+    # Per-widget draw time (same layout as the HUD above, drawn one by one)
+    hud_scale = max(0.25, min(1.0, float(HUD_CONFIG.get('hud_downscale', 1.0))))
+    rW, rH = max(1, int(W * hud_scale)), max(1, int(H * hud_scale))
+    widgets = {}
+    for _, data, handler, t in hud_args:
+        canvas = np.zeros((rH, rW, 3), dtype=np.uint8)
+        for name, _, draw in collect_widget_jobs(rW, rH, data, handler, t, hud_scale):
+            t0 = time.perf_counter()
+            draw(canvas)
+            widgets[name] = widgets.get(name, 0.0) + time.perf_counter() - t0
+    results['widgets'] = {name: _stage(total, len(hud_args)) for name, total in sorted(widgets.items())}
+
+    # Composite (HUD blend onto source frames)
+    hud_bgr, hud_alpha = render_unified_hud(*hud_args[0])
+    results['composite'] = time_calls(blend_hud, [(f, hud_bgr, hud_alpha) for f in decoded], repeat)
+
+    # Encode (raw BGR pipe into libx264 with the configured preset)
+    preset, threads = get_encoder_settings()
+    enc_path = os.path.join(output_dir, 'bench_encode.mp4')
+    t0 = time.perf_counter()
+    with FrameWriter(enc_path, size, fps, preset=preset, threads=threads) as writer:
+        for frame in decoded:
+            writer.write(frame)
+    results['encode'] = _stage(time.perf_counter() - t0, len(decoded))
+    clear_gradient_cache()
+
+    results['end_to_end'] = end_to_end(video_path, data_handler, frames / float(fps),
+                                       os.path.join(output_dir, 'bench_render.mp4'))
+    return results
+
+
+def end_to_end(video_path, data_handler, seconds, output_file):
+    """Serial render of the first `seconds` of the video; returns its stage plus fps."""
+    from moviepy import VideoFileClip
+    import video_renderer
+
+    saved = (video_renderer.DEMO_MODU, video_renderer.DEMO_START_SECONDS, video_renderer.DEMO_MODE_SECONDS)
+    video_renderer.DEMO_MODU, video_renderer.DEMO_START_SECONDS, video_renderer.DEMO_MODE_SECONDS = \
+        True, 0, seconds
+    clip = VideoFileClip(video_path, audio=False)
+    frames = int(min(seconds, clip.duration) * clip.fps)
+    try:
+        t0 = time.perf_counter()
+        video_renderer.render_video(clip, data_handler.fork(), output_file)
+        elapsed = time.perf_counter() - t0
+    finally:
+        (video_renderer.DEMO_MODU, video_renderer.DEMO_START_SECONDS,
+         video_renderer.DEMO_MODE_SECONDS) = saved
+    stage = _stage(elapsed, frames)
+    stage['fps'] = round(frames / elapsed, 3) if elapsed > 0 else None
+    return stage
+
+
+# ================================================================
+#  KARŞILAŞTIRMA
+#  ================================================================
+
+def _flatten(stages, prefix=''):
+    for name, value in stages.items():
+        if isinstance(value, dict) and 'per_call_ms' not in value:
+            yield from _flatten(value, f"{prefix}{name}.")
+        elif isinstance(value, dict):
+            yield f"{prefix}{name}", value
+
+
+def compare_results(current, baseline, threshold):
+    """
+    Return [(stage, baseline_ms, current_ms, ratio)] for every stage whose
+    per-call time grew by more than `threshold` (0.15 = 15 %), and for an
+    end-to-end fps drop of the same size.
+    """
+    base = dict(_flatten(baseline.get('stages', {})))
+    regressions = []
+    for name, stage in _flatten(current.get('stages', {})):
+        old = base.get(name)
+        if not old:
+            continue
+        for key in _TIMED_KEYS:
+            if old.get(key) and stage.get(key) and stage[key] > old[key] * (1.0 + threshold):
+                regressions.append((f"{name}.{key}", old[key], stage[key], stage[key] / old[key]))
+        if old.get('fps') and stage.get('fps') and stage['fps'] < old['fps'] * (1.0 - threshold):
+            regressions.append((f"{name}.fps", old['fps'], stage['fps'], stage['fps'] / old['fps']))
+    return regressions
+
+
+def _meta(args, size, track_points):
+    return {
+        'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'size': list(size),
+        'fps': args.fps,
+        'frames': int(args.seconds * args.fps),
+        'track_minutes': args.track_minutes,
+        'track_hz': args.track_hz,
+        'track_points': track_points,
+        'hr': not args.no_hr,
+        'cad': not args.no_cad,
+        'repeat': args.repeat,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'opencv': cv2.__version__,
+        'pixel_kernels': pixel_kernel_backend(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+    }
+
+
+# ================================================================
+#  MAIN
+#  ================================================================
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="VeloMetrics stage benchmark")
+    parser.add_argument('--size', choices=sorted(VIDEO_SIZES), default='1080p')
+    parser.add_argument('--seconds', type=float, default=10, help="synthetic video length")
+    parser.add_argument('--fps', type=int, default=30)
+    parser.add_argument('--track-minutes', type=float, default=60, help="synthetic GPX length")
+    parser.add_argument('--track-hz', type=float, default=1.0, help="GPX samples per second")
+    parser.add_argument('--no-hr', action='store_true', help="GPX without heart rate")
+    parser.add_argument('--no-cad', action='store_true', help="GPX without cadence")
+    parser.add_argument('--hud-samples', type=int, default=20, help="full HUD redraws to time")
+    parser.add_argument('--repeat', type=int, default=3, help="best-of-N for the cheap stages")
+    parser.add_argument('--workdir', default='bench_data', help="synthetic inputs and scratch outputs")
+    parser.add_argument('--out', default=None, help="write results JSON here")
+    parser.add_argument('--baseline', default=None, help="results JSON to compare against")
+    parser.add_argument('--threshold', type=float, default=0.15, help="allowed slowdown (0.15 = 15%%)")
+    args = parser.parse_args(argv)
+
+    size = VIDEO_SIZES[args.size]
+    os.makedirs(args.workdir, exist_ok=True)
+    # Make sure the whole synthetic video falls on the track at the configured offset
+    minutes = max(args.track_minutes, (ZAMAN_OFFSET_SANIYE + args.seconds + 60) / 60.0)
+    gpx_path = os.path.join(args.workdir,
+                            f"track_{minutes:g}m_{args.track_hz:g}hz{'' if not args.no_hr else '_nohr'}"
+                            f"{'' if not args.no_cad else '_nocad'}.gpx")
+    video_path = os.path.join(args.workdir, f"testsrc_{args.size}_{args.seconds:g}s_{args.fps}fps.mp4")
+
+    if not os.path.exists(gpx_path):
+        print(f"\n🧪 Generating synthetic GPX: {gpx_path}")
+        write_synthetic_gpx(gpx_path, minutes, args.track_hz, not args.no_hr, not args.no_cad)
+    if not os.path.exists(video_path):
+        print(f"🧪 Generating synthetic video: {video_path}")
+        make_synthetic_video(video_path, size, args.seconds, args.fps)
+
+    frames = int(args.seconds * args.fps)
+    print(f"\n⏱️  Benchmarking {args.size} ({size[0]}x{size[1]}), {frames} frames...")
+    stages = run_benchmark(video_path, gpx_path, size, args.fps, frames, args.hud_samples,
+                           args.repeat, args.workdir)
+    results = {'meta': _meta(args, size, stages['parse']['points']), 'stages': stages}
+
+    print(f"\n📊 Results (ms per call):")
+    for name, stage in _flatten(stages):
+        fps = f"  ({stage['fps']:.1f} fps)" if stage.get('fps') else ''
+        print(f"   • {name:<32} {stage['per_call_ms']:>10.3f}{fps}")
+
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+        print(f"\n💾 Results: {args.out}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for name, old, new, ratio in regressions:
+                print(f"   • {name}: {old:.3f} → {new:.3f} ({ratio:.2f}×)")
+            return 1
+        print(f"\n✅ No regression over {args.threshold:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,68 @@
+# ================================================================
+#  FFMPEG TARAFINDA BİRLEŞTİRME RENDER MODÜLÜ (composite_render.py)
+#  ================================================================
+#  Kaynak pikseller Python'a hiç gelmez:
+#
+#  - ffmpeg kaynak videoyu kendisi çözer, HUD katmanını `overlay`
+#    filtresiyle üstüne bindirir ve kodlar (hepsi native kodda)
+#  - Python sadece HUD'u çizer: hud_update_rate anlarında, boş bir
+#    tuvale, alfa kanallı (BGRA) ve zaman damgalı olarak borudan
+#    gönderir; değişmeyen HUD tekrar gönderilmez
+#  - Frame başına çözme / renk dönüşümü / harmanlama maliyeti
+#    Python sürecinden tamamen kalkar
+#  ================================================================
+
+from config import HUD_CONFIG
+from ffmpeg_utils import FrameWriter
+from overlay_render import distinct_hud_layers
+from utils import clear_gradient_cache
+from video_renderer import resolve_render_window, get_encoder_settings
+
+
+def render_video_composite(clip, data_handler, output_file):
+    """
+    Render with ffmpeg decoding and compositing the source; Python only
+    draws the HUD layer.
+
+    Args:
+        clip: MoviePy VideoFileClip object (only size/fps/filename are used)
+        data_handler: DataHandler object
+        output_file: Output video file
+    """
+    if not HUD_CONFIG.get('unified_hud', True):
+        raise RuntimeError("composite render needs HUD_CONFIG['unified_hud'] = True")
+
+    W, H = int(clip.size[0]), int(clip.size[1])
+    start_offset, duration = resolve_render_window(clip)
+    fps = clip.fps
+    video_path = clip.filename
+    clip.close()
+    total_frames = int(duration * fps)
+    ff_preset, ff_threads = get_encoder_settings()
+
+    print(f"\n📝 Opening output video:")
+    print(f"   • File: {output_file}")
+    print(f"   • Resolution: {W}x{H}")
+    print(f"   • FPS: {fps} (HUD redrawn at {HUD_CONFIG.get('hud_update_rate') or fps} Hz)")
+    print(f"   • Codec: libx264 {ff_preset} (decode + overlay + encode in ffmpeg)")
+
+    print("\n📈 Interpolating telemetry at frame times...")
+    times = [n / fps + start_offset for n in range(total_frames)]
+    telemetry = data_handler.get_data_batch(times)
+
+    print("\n▶️  Starting composite render (source frames stay in ffmpeg)...\n")
+
+    stats = {}
+    try:
+        with FrameWriter(output_file, (W, H), fps, preset=ff_preset, threads=ff_threads, pix_fmt_in='bgra',
+                         extra_args=['-frames:v', str(total_frames)], timestamps=True,
+                         background=(video_path, start_offset, total_frames / fps)) as writer:
+            for n, layer in distinct_hud_layers((W, H), times, telemetry, data_handler, stats):
+                writer.write(layer, n / fps)
+    finally:
+        clear_gradient_cache()
+
+    print(f"\n✅ RENDER COMPLETE!")
+    print(f"   • {total_frames} frames, {stats['drawn']} HUD draws, {stats['written']} HUD frames sent")
+    print(f"   • Duration: {total_frames / fps:.1f}s")
+    print(f"   • File: {output_file}")
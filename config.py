@@ -46,8 +46,9 @@ SELECTED_THEME = 'classic'  # Tema adını buraya yaz / Write theme name here
 
 # Seçilen temayı yükle / Load selected theme
 current_theme = get_theme(SELECTED_THEME)
-COLORS = current_theme['colors']
-OPACITY = current_theme['opacity']
+# Kopyalar: tema tabloları (THEMES) render sırasında değişmez / Copies: THEMES stays untouched while rendering
+COLORS = dict(current_theme['colors'])
+OPACITY = dict(current_theme['opacity'])
 PANEL_BG_ENABLED = current_theme['panel_bg_enabled']
 CURVE_ENABLED = current_theme.get('curve_enabled', True)
 FONT_STYLE = current_theme.get('font_style', 'modern')
@@ -200,12 +201,20 @@ FONT_CONFIG = {
     'outline_color': (0, 0, 0),     # Kontur rengi (BGR) / Outline color (BGR)
     'outline_strength': 0.3,        # Kontur kalınlığı / Outline thickness
 
+    # Gölge / Shadow
+    'shadow_enabled': False,        # Gölge çiz / Draw drop shadow
+    'shadow_color': (0, 0, 0),      # Gölge rengi (BGR) / Shadow color (BGR)
+    'shadow_offset': (2, 2),        # Gölge kayması (px) / Shadow offset (px)
+
+    # TTF metin önbelleği / TTF text cache
+    'text_cache_entries': 1024,     # Hazır yazı sprite sayısı / Cached string sprites
+
     # Kalite / Quality
     'line_type': 'LINE_AA',         # Anti-aliasing
 }
 
 # İkon ayarları (tema bazlı) / Icon settings (theme-based)
-ICON_CONFIG = theme_icon_config
+ICON_CONFIG = dict(theme_icon_config)
 
 # ==================== 8. EKRAN DÜZENİ ====================
 # ==================== 8. SCREEN LAYOUT ====================
@@ -261,6 +270,197 @@ HUD_CONFIG = {
     'remap_cache_enabled': True,
     'remap_cache_max_entries': 4,
     'distance_cache_max_entries': 4,
+    'widget_workers': None,     # Widget çizim thread sayısı (None = otomatik, 1 = sıralı) / Widget draw threads (None = auto, 1 = sequential)
+    'pixel_kernels': 'auto',    # Alfa/birleştirme geçişleri: 'auto' (numba varsa), 'numba', 'numpy' / Alpha/blend passes: 'auto' (numba if installed), 'numba', 'numpy'
+}
+
+# ==================== 10. RENDER MODU ====================
+# ==================== 10. RENDER MODE ====================
+"""
+⚙️ Render yöntemi / Rendering method
+- 'serial': Tek işlem, klasik render / Single process, classic render
+- 'parallel': Keyframe hizalı parçalar, çok işlemli render + yeniden kodlamasız birleştirme
+              Keyframe-aligned chunks, multi-process render + stream-copy concatenation
+- 'pipeline': Tek işlem, decode → HUD → encode aşamaları ayrı thread'lerde
+              Single process, decode → HUD → encode stages on separate threads
+- 'shm': Paylaşımlı bellek halkası, HUD çizimi ayrı işlemlerde (GIL yok)
+         Shared-memory frame ring, HUD drawing in separate processes (no GIL)
+- 'segmented': Numaralı segmentler + manifest, yarıda kalan render kaldığı yerden devam eder
+               Numbered segments + manifest, an interrupted render resumes where it stopped
+- 'timelapse': Hızlandırılmış video, sadece çıkışa giren frame'ler çözülür
+               Sped-up video, only the frames that are output get decoded
+- 'highlights': Telemetriye göre en ilginç anlar (hız, tırmanış, nabız, güç) tek videoda
+                Most interesting moments by telemetry (speed, climbs, HR, power) in one video
+- 'fanout': Tek decode'dan birden çok çıkış (FANOUT_CONFIG: çözünürlük, kırpma, tema, encoder)
+            Several outputs from one decode (FANOUT_CONFIG: resolution, crop, theme, encoder)
+- 'proxy': Hızlı düşük çözünürlüklü önizleme (düzen kontrolü için)
+           Fast low-resolution preview (for layout checks)
+- 'overlay': Sadece HUD, alfa kanallı ayrı katman (kaynak video çözülmez)
+             HUD only, as a separate alpha layer (source video is not decoded)
+- 'composite': ffmpeg çözer, HUD'u bindirir ve kodlar; Python sadece HUD çizer
+               ffmpeg decodes, overlays the HUD and encodes; Python only draws the HUD
+- 'sidecar': Yeniden kodlama yok: video/ses kopyalanır, telemetri altyazı izi + JSON/CSV
+             No re-encode: video/audio copied, telemetry subtitle tracks + JSON/CSV
+"""
+RENDER_MODES = ('serial', 'parallel', 'pipeline', 'shm', 'segmented', 'timelapse', 'highlights', 'fanout',
+                'proxy', 'overlay', 'composite', 'sidecar')
+RENDER_MODE = 'serial'
+
+# Paralel render ayarları / Parallel render settings
+PARALLEL_CONFIG = {
+    'workers': None,            # İşlem sayısı (None = CPU sayısı) / Process count (None = CPU count)
+    'chunk_seconds': 60,        # Hedef parça süresi (sn) / Target chunk duration (s)
+    'keyframe_align': True,     # Parça sınırlarını keyframe'e hizala / Snap chunk borders to keyframes
+    'keep_chunks': False,       # Geçici parçaları silme / Keep temporary chunk files
+}
+
+# Pipeline render ayarları / Pipeline render settings
+PIPELINE_CONFIG = {
+    'hud_workers': None,        # HUD/birleştirme thread sayısı (None = otomatik) / HUD/composite threads (None = auto)
+    'queue_size': 8,            # Aşamalar arası kuyruk boyu / Queue size between stages
+    'show_stats': True,         # Aşama istatistiklerini yazdır / Print per-stage stats
+}
+
+# Paylaşımlı bellek render ayarları / Shared-memory render settings
+SHM_CONFIG = {
+    'hud_workers': None,        # HUD işlem sayısı (None = otomatik) / HUD process count (None = auto)
+    'ring_slots': 24,           # Halkadaki frame slot sayısı / Frame slots in the ring
+}
+
+# Parçalı (devam ettirilebilir) render ayarları / Segmented (resumable) render settings
+SEGMENT_CONFIG = {
+    'segment_seconds': 120,     # Hedef segment süresi (sn) / Target segment duration (s)
+    'dir': None,                # Segment klasörü (None = çıkışın yanında .vpro_segments) / Segment folder (None = .vpro_segments next to output)
+    'keep_segments': False,     # Bitince segmentleri silme / Keep segments after joining
+}
+
+# Timelapse ayarları / Timelapse settings
+TIMELAPSE_CONFIG = {
+    'speed': 20,                # Hız katsayısı (20 = 20×) / Speed-up factor (20 = 20×)
+    'target_seconds': None,     # Hedef çıkış süresi (sn), verilirse speed yerine / Target output length (s), overrides speed
+    'output_fps': None,         # Çıkış FPS (None = kaynak FPS) / Output FPS (None = source FPS)
+    'method': 'auto',           # 'auto', 'select' (tek decoder + select filtresi) veya 'seek' (frame başına seek) / 'auto', 'select' (one decoder + select filter) or 'seek' (seek per frame)
+}
+
+# Öne çıkanlar (highlight) ayarları / Highlight reel settings
+HIGHLIGHTS_CONFIG = {
+    'target_seconds': 180,      # Hedef toplam süre (sn) / Target reel length (s)
+    'clip_seconds': 12,         # Her anın süresi (sn) / Length of each moment (s)
+    'weights': {                # Kanal ağırlıkları (0 = kullanma) / Channel weights (0 = ignore)
+        'speed': 1.0,           # En yüksek hız / Top speed
+        'climb': 1.0,           # Ortalama pozitif eğim / Mean uphill grade
+        'hr': 1.0,              # Nabız zirvesi / Heart-rate peak
+        'power': 1.0,           # Sprint gücü / Sprint power
+    },
+    'min_gap_seconds': 5,       # Seçilen anlar arası en az boşluk / Minimum gap between picked moments
+    'transition_seconds': 0.5,  # Siyaha geçiş süresi (her uçta) / Fade-to-black length (each end)
+    'scan_hz': 1.0,             # Telemetri tarama sıklığı / Telemetry scan rate
+}
+
+# Çoklu çıkış (fan-out) ayarları / Multi-output (fan-out) settings
+# Her çıkış: CIKTI_DOSYASI + 'suffix'; 'size' (None = kaynak), 'crop' ('9:16' gibi oran, None = size oranı),
+# 'crop_x' (yatay kırpma konumu 0..1), 'theme' (None = SELECTED_THEME), 'codec', 'preset', 'crf'
+# Each output: CIKTI_DOSYASI + 'suffix'; 'size' (None = source), 'crop' (aspect like '9:16', None = aspect of size),
+# 'crop_x' (horizontal crop position 0..1), 'theme' (None = SELECTED_THEME), 'codec', 'preset', 'crf'
+FANOUT_CONFIG = {
+    'outputs': [
+        {'suffix': '_master'},
+        {'suffix': '_1080p', 'size': (1920, 1080), 'preset': 'fast'},
+        {'suffix': '_vertical', 'size': (1080, 1920), 'crop': '9:16', 'theme': 'sport'},
+    ],
+}
+
+# Proxy önizleme ayarları / Proxy preview settings
+PROXY_CONFIG = {
+    'scale': 0.25,              # Çözünürlük oranı (decode sırasında küçültülür) / Resolution factor (downscaled while decoding)
+    'preset': 'ultrafast',      # x264 preset
+    'crf': 32,                  # Düşük bit hızı / Low bitrate
+    'suffix': '_proxy',         # Çıkış dosyası soneki / Output file suffix
+}
+
+# Şeffaf HUD katmanı ayarları / Transparent HUD layer settings
+OVERLAY_CONFIG = {
+    'format': 'prores4444',     # 'prores4444', 'qtrle', 'png' (.mov) veya 'sequence' (PNG + ffconcat) / or 'sequence' (PNG + ffconcat)
+    'suffix': '_overlay',       # Çıkış dosyası/klasörü soneki / Output file/folder suffix
+}
+
+# Telemetri altyazı izi / yan dosya ayarları / Telemetry subtitle track / sidecar settings
+SIDECAR_CONFIG = {
+    'rate_hz': 1.0,             # Saniyedeki telemetri örneği / Telemetry samples per second
+    'container': 'mkv',         # 'mkv' (stilli ASS + WebVTT + JSON eki) veya 'mp4' (mov_text) / or 'mp4' (mov_text)
+    'font_scale': 0.045,        # ASS yazı boyutu (video yüksekliğine oran) / ASS font size (fraction of video height)
+    'suffix': '_telemetry',     # Çıkış dosyası soneki / Output file suffix
+}
+
+# Profil çıkarma (aşama / widget zamanlayıcıları) / Profiling (stage / widget timers)
+PROFILE_CONFIG = {
+    'enabled': False,           # Render sonunda p50/p95/max tablosu / p50/p95/max table after the render
+    'trace_file': None,         # Chrome trace / Perfetto JSON yolu (None = yazma) / Chrome trace / Perfetto JSON path (None = off)
+    'max_trace_events': 200000, # Trace'te tutulacak en fazla olay / Most events kept in the trace
+}
+
+# Makine okunur ilerleme akışı (JSON Lines) / Machine-readable progress stream (JSON Lines)
+PROGRESS_CONFIG = {
+    'path': None,               # Kayıtların ekleneceği dosya (None = kapalı) / File records are appended to (None = off)
+    'fd': None,                 # Veya açık dosya tanımlayıcısı (ör. 3) / Or an open file descriptor (e.g. 3)
+    'interval_seconds': 2.0,    # Kayıt aralığı / Record interval
+}
+
+# Prometheus metrikleri (render çiftliği panoları) / Prometheus metrics (render farm dashboards)
+METRICS_CONFIG = {
+    'port': None,               # /metrics HTTP portu (None = kapalı) / /metrics HTTP port (None = off)
+    'host': '127.0.0.1',        # Dinlenecek adres / Listen address
+    'textfile': None,           # node_exporter textfile collector .prom dosyası / node_exporter textfile collector .prom file
+    'interval_seconds': 10,     # Textfile yazma aralığı / Textfile write interval
+    'linger_seconds': 0,        # Bitişte son değerlerin toplanması için bekleme / Wait at the end so the final values get scraped
+    'job': None,                # job etiketi (None = çıktı dosyası adı) / job label (None = output file name)
+    'ride': None,               # ride etiketi (None = GPX dosyası adı) / ride label (None = GPX file name)
+}
+
+# Derlenmiş tema önbelleği (LUT'lar, font metrikleri, ikon sprite'ları) / Compiled theme cache (LUTs, font metrics, icon sprites)
+THEME_CACHE_CONFIG = {
+    'enabled': True,            # Derlenmiş temayı diske yaz / oku / Write / read compiled themes on disk
+    'dir': None,                # Önbellek klasörü (None = çalışma dizininde .vpro_theme_cache) / Cache folder (None = .vpro_theme_cache in the working directory)
+}
+
+# Değere bağlı ikon sprite önbelleği (hız, eğim, güç, kalp) / Value-dependent icon sprite cache (speed, gradient, power, heart)
+ICON_CACHE_CONFIG = {
+    'enabled': True,            # İkonları sprite olarak önbellekle / Cache icons as sprites
+    'max_entries': 512,         # LRU boyutu / LRU size
+    'speed_step': 0.5,          # Hız ibresi kovası, km/h (0 = tam, piksel bazında) / Speed needle bucket, km/h (0 = exact, per pixel)
+}
+
+# Duraklama kesme (sadece serial render) / Stop auto-cut (serial render only)
+AUTO_CUT_CONFIG = {
+    'enabled': False,           # Durulan kısımları çıkar / Leave out stopped footage
+    'stop_speed_kmh': 3.0,      # Bu hızın altında durmuş sayılır / Below this speed counts as stopped
+    'resume_speed_kmh': 6.0,    # Bu hızın üstünde tekrar hareket (histerezis) / Above this speed moving again (hysteresis)
+    'min_stop_seconds': 10,     # Daha kısa duraklamalar kesilmez / Shorter stops are kept
+    'gap_seconds': 10,          # Bundan uzun GPX boşluğu = durma (oto-duraklatma) / GPX gap longer than this = stopped (auto-pause)
+    'pad_seconds': 1.0,         # Kesimin iki yanında bırakılan süre / Footage kept on each side of a cut
+}
+
+# Ofset tahmini (python offset_estimator.py) / Offset estimation (python offset_estimator.py)
+OFFSET_ESTIMATE_CONFIG = {
+    'sample_hz': 2.0,           # Saniyedeki örnek (çözülen frame) sayısı / Samples (decoded frames) per second
+    'width': 64,                # Hareket sinyali için küçük frame genişliği / Thumbnail width for the motion signal
+    'search_seconds': None,     # ZAMAN_OFFSET_SANIYE ± bu kadar ara (None = tümü) / Search ZAMAN_OFFSET_SANIYE ± this (None = everything)
+    'min_overlap_seconds': 60,  # Video ile GPX'in en az örtüşmesi / Minimum video/GPX overlap
+}
+
+# Kaynak video okuma ayarları / Source video decoding settings
+DECODE_CONFIG = {
+    'fast_seek': True,          # ffmpeg giriş seek'i + hassas kırpma, doğrudan BGR / ffmpeg input seek + exact trim, BGR frames
+    'max_skip_frames': 100,     # Bundan kısa ileri atlamalarda seek yerine oku / Read through forward jumps up to this, seek beyond
+    'vfr': 'auto',              # Kaynak zaman damgalarını izle ('auto' = sadece VFR videoda, True, False) / Follow source timestamps ('auto' = VFR sources only, True, False)
+}
+
+# Çözülmüş frame önbelleği (tema/düzen denemeleri için) / Decoded-frame cache (for theme/layout tuning)
+FRAME_CACHE_CONFIG = {
+    'enabled': False,           # Demo penceresini bir kez çöz, sonra mmap'ten oku / Decode the demo window once, then read from mmap
+    'demo_only': True,          # Sadece demo modunda kullan / Only use in demo mode
+    'dir': None,                # Önbellek klasörü (None = videonun yanında .vpro_frame_cache) / Cache folder (None = .vpro_frame_cache next to the video)
+    'max_mb': 8192,             # Toplam boyut sınırı, eski pencereler silinir (LRU) / Total size cap, oldest windows evicted (LRU)
 }
 
 # ==================== TEMA BİLGİSİ GÖSTER ====================
@@ -289,6 +489,24 @@ def show_current_theme():
         print(f"   ❌ Disabled Widgets: {', '.join(disabled_widgets)}")
     print()
 
+def theme_settings(theme_name):
+    """
+    Temanın belirlediği ayarlar: {config sözlüğü adı: {anahtar: değer}}.
+    Settings a theme controls: {config dict name: {key: value}}.
+    """
+    theme = get_theme(theme_name)
+    fonts = get_font_config(theme.get('font_style', 'modern'))
+    curve = theme.get('curve_enabled', True)
+    font_keys = ('font_family_preferred', 'title_size', 'value_size', 'unit_size', 'small_size',
+                 'title_thickness', 'value_thickness', 'unit_thickness', 'small_thickness')
+    return {
+        'COLORS': dict(theme['colors']),
+        'OPACITY': dict(theme['opacity']),
+        'FONT_CONFIG': {key: fonts[key] for key in font_keys},
+        'ICON_CONFIG': dict(get_icon_style(theme.get('icon_style', 'rounded'))),
+        'HUD_CONFIG': {'curve_enabled': curve, 'curve_strength': 0.03 if curve else 0.0},
+    }
+
 # ==================== DOĞRULAMA ====================
 # ==================== VALIDATION ====================
 def validate_config():
@@ -321,6 +539,10 @@ def validate_config():
         if val <= 0:
             errors.append(f"FONT_CONFIG['{key}'] = {val} (pozitif olmalı / must be positive)")
     
+    # Render modu kontrolü / Render mode check
+    if RENDER_MODE not in RENDER_MODES:
+        errors.append(f"Geçersiz render modu / Invalid render mode: {RENDER_MODE}")
+    
     # Zaman kontrolü / Time check
     if ZAMAN_OFFSET_SANIYE < 0:
         errors.append(f"ZAMAN_OFFSET_SANIYE = {ZAMAN_OFFSET_SANIYE} (negatif olamaz / cannot be negative)")
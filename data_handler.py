@@ -266,7 +266,22 @@ class DataHandler:
         print(f"   • Start: {self.gpx_start}")
         print(f"   • End: {self.points[-1]['t']}")
         print(f"   • Total Distance: {self.total_route_m/1000:.2f} km")
-    
+
+    def fork(self):
+        """
+        Aynı parse edilmiş noktaları paylaşan bağımsız bir görünüm döndür.
+
+        GPX tekrar parse edilmez; sadece güç smoothing geçmişi ayrıdır.
+        Paralel render parçaları her biri kendi görünümünü kullanır.
+
+        Returns:
+            DataHandler: Kendi güç geçmişine sahip kopya
+        """
+        view = object.__new__(DataHandler)
+        view.__dict__.update(self.__dict__)
+        view.power_history = []
+        return view
+
     def get_data(self, t_video):
         """
         Video zamanına göre tüm verileri interpolasyon yap.
@@ -396,6 +411,131 @@ class DataHandler:
         # Fallback (normal olmayacak)
         return {**self.points[0], 'speed': 0, 'grade': 0, 'power': 0, 'progress': 0, 'idx': 0, 'heading': 0}
     
+    def _batch_arrays(self):
+        """
+        get_data_batch için waypoint'lerin NumPy dizilerini (bir kez) hazırla.
+
+        Zamanlar GPX başlangıcına göre tam sayı mikrosaniyedir; timedelta
+        aritmetiğiyle birebir aynı sonucu verir.
+        """
+        arrays = getattr(self, '_arrays', None)
+        if arrays is not None:
+            return arrays
+
+        pts = self.points
+        arrays = {
+            't_us': np.array([(p['t'] - self.gpx_start) // timedelta(microseconds=1) for p in pts], dtype=np.int64),
+            'lat': np.array([p['lat'] for p in pts], dtype=np.float64),
+            'lon': np.array([p['lon'] for p in pts], dtype=np.float64),
+            'ele': np.array([p['ele'] for p in pts], dtype=np.float64),
+            # None ve 0 get_data'da "veri yok" sayılır
+            'hr': np.array([p['hr'] or 0 for p in pts], dtype=np.float64),
+            'cad': np.array([p['cad'] or 0 for p in pts], dtype=np.float64),
+            'cum_dist': np.array([p['cum_dist'] for p in pts], dtype=np.float64),
+            'seg_dist': np.array([p.get('seg_dist', 0.0) for p in pts], dtype=np.float64),
+            'heading': np.array([calculate_heading(pts, i) for i in range(len(pts))], dtype=np.float64),
+        }
+        self._arrays = arrays
+        return arrays
+
+    def get_data_batch(self, t_videos, offset=None):
+        """
+        Çok sayıda video zamanı için get_data'nın toplu (vektörize) karşılığı.
+
+        Her zaman için waypoint araması tek bir searchsorted ile yapılır
+        (get_data her çağrıda listeyi baştan tarar). Sonuçlar, aynı zamanlar
+        yeni bir DataHandler üzerinde sırayla get_data ile sorgulanmış gibidir;
+        güç smoothing'i de bu sıraya göre uygulanır.
+
+        Args:
+            t_videos (sequence): Video zamanları (saniye), render sırasında
+            offset (float): GPX ofseti (None = ZAMAN_OFFSET_SANIYE)
+
+        Returns:
+            dict: Kanal adı → np.ndarray ('t', 'lat', 'lon', 'ele', 'hr', 'cad',
+                  'speed', 'grade', 'power', 'cum_dist', 'progress', 'idx',
+                  'heading', 'seg_seconds'). Eksik hr/cad değerleri NaN'dır;
+                  seg_seconds (içinde bulunulan GPX aralığının süresi) iz
+                  dışında NaN'dır.
+        """
+        from config import POWER_CONFIG
+
+        if offset is None:
+            offset = ZAMAN_OFFSET_SANIYE
+        a = self._batch_arrays()
+        t_videos = np.asarray(t_videos, dtype=np.float64)
+        n_pts = len(self.points)
+        us = timedelta(microseconds=1)
+
+        # timedelta ile aynı mikrosaniye yuvarlaması
+        target = np.array([timedelta(seconds=float(t) + offset) // us for t in t_videos], dtype=np.int64)
+        t_us = a['t_us']
+
+        before = target <= t_us[0]
+        after = (target >= t_us[-1]) & ~before
+        inside = ~(before | after)
+
+        idx = np.clip(np.searchsorted(t_us, target, side='left') - 1, 0, max(0, n_pts - 2))
+        i2 = np.minimum(idx + 1, n_pts - 1)
+        total_sec = (t_us[i2] - t_us[idx]) / 10**6
+        safe_total = np.where(total_sec > 0, total_sec, 1.0)
+        ratio = ((target - t_us[idx]) / 10**6) / safe_total
+
+        out = {'t': t_videos}
+        for key in ('lat', 'lon', 'ele'):
+            out[key] = a[key][idx] + ratio * (a[key][i2] - a[key][idx])
+
+        for key in ('hr', 'cad'):
+            v1, v2 = a[key][idx], a[key][i2]
+            both = np.trunc(v1 + ratio * (v2 - v1))
+            val = np.where((v1 > 0) & (v2 > 0), both, np.where(v1 > 0, v1, v2))
+            out[key] = np.where(val > 0, val, np.nan)
+
+        dist_seg = a['seg_dist'][i2]
+        speed = (dist_seg / safe_total) * 3.6
+        safe_dist = np.where(dist_seg > 5, dist_seg, 1.0)
+        grade = np.where(dist_seg > 5, (a['ele'][i2] - a['ele'][idx]) / safe_dist * 100, 0.0)
+        cur_dist = a['cum_dist'][idx] + dist_seg * ratio
+        if self.total_route_m > 0:
+            progress = (cur_dist / self.total_route_m) * 100
+        else:
+            progress = np.zeros_like(cur_dist)
+
+        out['speed'] = np.where(inside, speed, 0.0)
+        out['grade'] = np.where(inside, grade, 0.0)
+        out['cum_dist'] = np.where(inside, cur_dist, 0.0)
+        out['progress'] = np.where(inside, progress, 0.0)
+        out['idx'] = np.where(inside, idx, 0).astype(np.int64)
+        out['heading'] = np.where(inside, a['heading'][idx], 0.0)
+        out['seg_seconds'] = np.where(inside, total_sec, np.nan)
+
+        # Başlangıç öncesi / bitiş sonrası: ilk/son waypoint değerleri
+        for mask, p_i, prog in ((before, 0, 0.0), (after, n_pts - 1, 100.0)):
+            if not np.any(mask):
+                continue
+            p = self.points[p_i]
+            out['lat'][mask] = p['lat']
+            out['lon'][mask] = p['lon']
+            out['ele'][mask] = p['ele']
+            out['hr'][mask] = p['hr'] if p['hr'] is not None else np.nan
+            out['cad'][mask] = p['cad'] if p['cad'] is not None else np.nan
+            out['cum_dist'][mask] = p['cum_dist']
+            out['progress'][mask] = prog
+            out['idx'][mask] = p_i
+
+        # Güç: get_data ile aynı fizik ve aynı sıralı moving average
+        power = np.zeros(len(t_videos), dtype=np.float64)
+        history = []
+        window_size = POWER_CONFIG['smoothing_window']
+        for j in np.flatnonzero(inside):
+            raw = calculate_power(float(out['speed'][j]), float(out['grade'][j]))
+            history.append(max(POWER_CONFIG['min_power'], min(POWER_CONFIG['max_power'], raw)))
+            if len(history) > window_size:
+                history = history[-window_size:]
+            power[j] = sum(history) / len(history)
+        out['power'] = power
+        return out
+
     def get_elevation_range(self, idx, range_points):
         """
         Mevcut konumdan öncesindeki/sonrasındaki elevasyonu getir.
@@ -465,8 +605,38 @@ class DataHandler:
         return sum(self.power_history) / len(self.power_history)
 
 
+def telemetry_row(batch, i):
+    """
+    get_data_batch çıktısından tek bir frame için get_data uyumlu dict üret.
+
+    Args:
+        batch (dict): get_data_batch sonucu
+        i (int): Satır (frame) indeksi
+
+    Returns:
+        dict: get_data ile aynı anahtarlar (eksik hr/cad = None)
+    """
+    hr = batch['hr'][i]
+    cad = batch['cad'][i]
+    return {
+        'lat': float(batch['lat'][i]),
+        'lon': float(batch['lon'][i]),
+        'ele': float(batch['ele'][i]),
+        'hr': None if np.isnan(hr) else int(hr),
+        'cad': None if np.isnan(cad) else int(cad),
+        'speed': float(batch['speed'][i]),
+        'grade': float(batch['grade'][i]),
+        'power': float(batch['power'][i]),
+        'cum_dist': float(batch['cum_dist'][i]),
+        'progress': float(batch['progress'][i]),
+        'idx': int(batch['idx'][i]),
+        'heading': float(batch['heading'][i]),
+    }
+
+
 if __name__ == "__main__":
     print("✅ Data handler module loaded")
     print("   • parse_gpx(file)")
     print("   • get_hr_zone(hr)")
     print("   • DataHandler class")
+    print("   • DataHandler.get_data_batch(times) / telemetry_row(batch, i)")
@@ -0,0 +1,207 @@
+# ================================================================
+#  ÇOKLU ÇIKIŞ (FAN-OUT) RENDER MODÜLÜ (fanout_render.py)
+#  ================================================================
+#  Bir sürüşten birden çok teslim dosyası tek geçişte üretilir
+#  (4K master, 1080p, 9:16 dikey, farklı temalar...):
+#
+#  - Kaynak video bir kez çözülür, telemetri bir kez hesaplanır
+#  - Her çıkış dalı frame'i kendi kırpma/ölçeğine getirir, HUD'u
+#    kendi çözünürlüğünde ve kendi temasıyla çizer, kendi ffmpeg
+#    encoder'ına yazar (encoder'lar paralel çalışır)
+#  - Her dalın kendi HUD önbelleği ve düzen (remap/mesafe)
+#    önbellekleri vardır; dallar birbirinin önbelleğini silmez
+#  ================================================================
+
+import os
+from collections import OrderedDict
+from contextlib import ExitStack
+
+import cv2
+from tqdm import tqdm
+
+import config
+import hud_layout
+from config import FANOUT_CONFIG, SELECTED_THEME, theme_settings
+from data_handler import telemetry_row
+from ffmpeg_utils import FrameWriter
+from progress import progress_update
+from utils import clear_gradient_cache
+from video_renderer import (resolve_render_window, get_encoder_settings, new_hud_cache,
+                            compose_frame, FrameSource)
+
+
+# ================================================================
+#  DAL TANIMLARI
+#  ================================================================
+
+def _even(v):
+    return max(2, int(v) // 2 * 2)
+
+
+def crop_box(src_size, aspect, crop_x=0.5):
+    """
+    Largest (x, y, w, h) window of `src_size` with aspect `aspect` (w / h),
+    centered vertically and placed at `crop_x` (0 = left, 1 = right).
+    """
+    W, H = src_size
+    if aspect is None or abs(aspect - W / float(H)) < 1e-3:
+        return 0, 0, W, H
+    if aspect < W / float(H):
+        w, h = _even(H * aspect), H
+    else:
+        w, h = W, _even(W / aspect)
+    x = int(round((W - w) * min(1.0, max(0.0, float(crop_x)))))
+    return x, (H - h) // 2, w, h
+
+
+def _parse_aspect(value):
+    if value is None:
+        return None
+    if isinstance(value, str) and ':' in value:
+        a, b = value.split(':', 1)
+        return float(a) / float(b)
+    return float(value)
+
+
+def plan_branches(outputs, src_size, output_file):
+    """
+    Resolve FANOUT_CONFIG['outputs'] into branch dicts: output path, crop box,
+    output size, theme settings and encoder arguments.
+    """
+    base, ext = os.path.splitext(output_file)
+    default_preset, threads = get_encoder_settings()
+    branches = []
+    for i, spec in enumerate(outputs):
+        size = spec.get('size')
+        aspect = _parse_aspect(spec.get('crop'))
+        if aspect is None and size:
+            aspect = size[0] / float(size[1])
+        box = crop_box(src_size, aspect, spec.get('crop_x', 0.5))
+        out_size = (_even(size[0]), _even(size[1])) if size else (box[2], box[3])
+        extra = ['-crf', str(spec['crf'])] if spec.get('crf') is not None else None
+        path = f"{base}{spec.get('suffix', f'_{i + 1}')}{ext}"
+        if any(b['path'] == path for b in branches):
+            raise ValueError(f"two fan-out outputs write to {path}; give them different 'suffix' values")
+        branches.append({
+            'path': path,
+            'box': box,
+            'size': out_size,
+            'theme': spec.get('theme'),
+            'settings': theme_settings(spec['theme']) if spec.get('theme') else None,
+            'codec': spec.get('codec', 'libx264'),
+            'preset': spec.get('preset', default_preset),
+            'threads': threads,
+            'extra_args': extra,
+            'hud_cache': new_hud_cache(),
+            'layout_cache': (OrderedDict(), OrderedDict()),
+        })
+    return branches
+
+
+# ================================================================
+#  DAL DURUMU (TEMA + ÖNBELLEK)
+#  ================================================================
+
+class BranchState:
+    """
+    Switch the process-wide HUD state (theme dicts in config and the layout
+    caches in hud_layout) between branches. Widgets read these dicts on
+    every draw, so updating them in place re-themes everything; the values
+    in place before the first switch are restored by `restore()`.
+    """
+
+    def __init__(self, branches):
+        self.base = {}
+        for branch in branches:
+            for name, values in (branch['settings'] or {}).items():
+                target = getattr(config, name)
+                saved = self.base.setdefault(name, {})
+                for key in values:
+                    saved.setdefault(key, target.get(key))
+        self.base_layout = (hud_layout._distance_cache, hud_layout._remap_cache)
+
+    def activate(self, branch):
+        for name, values in self.base.items():
+            getattr(config, name).update(values)
+        for name, values in (branch['settings'] or {}).items():
+            getattr(config, name).update(values)
+        hud_layout._distance_cache, hud_layout._remap_cache = branch['layout_cache']
+
+    def restore(self):
+        for name, values in self.base.items():
+            getattr(config, name).update(values)
+        hud_layout._distance_cache, hud_layout._remap_cache = self.base_layout
+
+
+# ================================================================
+#  ANA FAN-OUT RENDER
+#  ================================================================
+
+def render_video_fanout(clip, data_handler, output_file):
+    """
+    Render every FANOUT_CONFIG output from a single decode pass.
+
+    Args:
+        clip: MoviePy VideoFileClip object
+        data_handler: DataHandler object
+        output_file: Base output file; each output adds its 'suffix'
+    """
+    outputs = FANOUT_CONFIG.get('outputs') or []
+    if not outputs:
+        raise ValueError("FANOUT_CONFIG['outputs'] is empty")
+
+    W, H = int(clip.size[0]), int(clip.size[1])
+    start_offset, duration = resolve_render_window(clip)
+    fps = clip.fps
+    total_frames = int(duration * fps)
+    branches = plan_branches(outputs, (W, H), output_file)
+
+    print(f"\n📝 Opening {len(branches)} output videos (one decode pass):")
+    for branch in branches:
+        x, y, w, h = branch['box']
+        crop = f", crop {w}x{h}+{x}+{y}" if (w, h) != (W, H) else ""
+        print(f"   • {branch['path']}: {branch['size'][0]}x{branch['size'][1]}{crop}, "
+              f"theme {branch['theme'] or SELECTED_THEME}, {branch['codec']} {branch['preset']}")
+    print(f"   • FPS: {fps}")
+
+    print("\n📈 Interpolating telemetry at frame times...")
+    times = [n / fps + start_offset for n in range(total_frames)]
+    telemetry = data_handler.get_data_batch(times)
+
+    print("\n▶️  Starting fan-out render...\n")
+
+    state = BranchState(branches)
+    source = FrameSource(clip, fps, start_offset, end_frame=total_frames)
+    frames_done = 0
+    try:
+        with ExitStack() as stack:
+            writers = [stack.enter_context(FrameWriter(branch['path'], branch['size'], fps,
+                                                       codec=branch['codec'], preset=branch['preset'],
+                                                       threads=branch['threads'],
+                                                       extra_args=branch['extra_args']))
+                       for branch in branches]
+            for n in tqdm(range(total_frames), unit='frame'):
+                img_bgr = source.get(n)
+                data = telemetry_row(telemetry, n)
+                src_t = times[n]
+                for branch, writer in zip(branches, writers):
+                    x, y, w, h = branch['box']
+                    frame = img_bgr[y:y + h, x:x + w]
+                    if (w, h) != branch['size']:
+                        interp = cv2.INTER_AREA if w > branch['size'][0] else cv2.INTER_LINEAR
+                        frame = cv2.resize(frame, branch['size'], interpolation=interp)
+                    state.activate(branch)
+                    writer.write(compose_frame(frame, data, data_handler, src_t, branch['hud_cache']))
+                frames_done += 1
+                progress_update(frames_done, total_frames)
+    finally:
+        source.close()
+        state.restore()
+        clip.close()
+        clear_gradient_cache()
+
+    print(f"\n✅ RENDER COMPLETE!")
+    print(f"   • {frames_done} frames processed × {len(branches)} outputs")
+    print(f"   • Duration: {frames_done / fps:.1f}s")
+    for branch in branches:
+        print(f"   • File: {branch['path']}")
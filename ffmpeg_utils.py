@@ -0,0 +1,513 @@
+# ================================================================
+#  FFMPEG YARDIMCI MODÜLÜ (ffmpeg_utils.py)
+#  ================================================================
+#  İçerik:
+#  - ffmpeg/ffprobe çalıştırılabilir dosyalarını bulma
+#  - Keyframe zamanlarını okuma (parça sınırları için)
+#  - Concat demuxer ile yeniden kodlamadan birleştirme
+#  - Ham frame'leri doğrudan encoder'a yazma (FrameWriter)
+#    (VFR için frame başına zaman damgalı Matroska akışı)
+#  - Hızlı giriş seek'i ile ham frame okuma (FrameReader)
+#  - Frame zaman damgalarını (PTS) okuma ve VFR tespiti
+#  ================================================================
+
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+
+import numpy as np
+
+
+# ================================================================
+#  ÇALIŞTIRILABİLİR DOSYALAR
+#  ================================================================
+
+def get_ffmpeg_exe():
+    """
+    Return the ffmpeg binary MoviePy uses (imageio-ffmpeg or FFMPEG_BINARY),
+    so every helper here runs the exact same ffmpeg build as the encoder.
+    """
+    try:
+        from moviepy.config import FFMPEG_BINARY
+        if FFMPEG_BINARY:
+            return FFMPEG_BINARY
+    except Exception:
+        pass
+    return shutil.which('ffmpeg') or 'ffmpeg'
+
+
+def get_ffprobe_exe():
+    """Return the ffprobe binary if one is installed, otherwise None."""
+    return shutil.which('ffprobe')
+
+
+def run_ffmpeg(args, check=True):
+    """
+    Run ffmpeg with `args` (without the binary) and return the completed
+    process. stderr is captured so errors can be reported to the user.
+    """
+    cmd = [get_ffmpeg_exe(), '-hide_banner', '-y'] + list(args)
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    if check and proc.returncode != 0:
+        err = proc.stderr.decode('utf-8', errors='replace').strip().splitlines()
+        tail = err[-1] if err else 'unknown error'
+        raise RuntimeError(f"ffmpeg failed ({proc.returncode}): {tail}")
+    return proc
+
+
+# ================================================================
+#  KEYFRAME ANALİZİ
+#  ================================================================
+
+_PTS_TIME_RE = re.compile(r'pts_time:\s*(-?[0-9.]+)')
+
+
+def probe_keyframe_times(video_path):
+    """
+    Return sorted keyframe presentation times (seconds) of the first video
+    stream.
+
+    ffprobe reads packet flags without decoding when it is available;
+    otherwise ffmpeg decodes keyframes only (`-skip_frame nokey`) and the
+    times are parsed from the showinfo filter log.
+    """
+    times = []
+    ffprobe = get_ffprobe_exe()
+    if ffprobe:
+        cmd = [ffprobe, '-v', 'error', '-select_streams', 'v:0',
+               '-show_entries', 'packet=pts_time,flags', '-of', 'csv=p=0', video_path]
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if proc.returncode == 0:
+            for line in proc.stdout.decode('utf-8', errors='replace').splitlines():
+                parts = line.strip().split(',')
+                if len(parts) >= 2 and 'K' in parts[1]:
+                    try:
+                        times.append(float(parts[0]))
+                    except ValueError:
+                        pass
+            if times:
+                return sorted(set(times))
+
+    cmd = [get_ffmpeg_exe(), '-hide_banner', '-nostats', '-skip_frame', 'nokey',
+           '-i', video_path, '-map', '0:v:0', '-an', '-vf', 'showinfo', '-f', 'null', '-']
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    for line in proc.stderr.decode('utf-8', errors='replace').splitlines():
+        if 'Parsed_showinfo' not in line:
+            continue
+        m = _PTS_TIME_RE.search(line)
+        if m:
+            times.append(float(m.group(1)))
+    return sorted(set(times))
+
+
+# ================================================================
+#  FRAME ZAMAN DAMGALARI (VFR)
+#  ================================================================
+
+_FRAMEMD5_TB_RE = re.compile(r'^#tb 0:\s*(\d+)/(\d+)')
+
+
+def probe_frame_times(video_path):
+    """
+    Return the presentation times (seconds, sorted, relative to the first
+    frame) of every frame of the first video stream.
+
+    Only packet headers are read (no decoding): ffprobe when available,
+    otherwise ffmpeg's framemd5 muxer on a stream copy.
+    """
+    pts = []
+    ffprobe = get_ffprobe_exe()
+    if ffprobe:
+        cmd = [ffprobe, '-v', 'error', '-select_streams', 'v:0',
+               '-show_entries', 'packet=pts_time', '-of', 'csv=p=0', video_path]
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if proc.returncode == 0:
+            for line in proc.stdout.decode('utf-8', errors='replace').splitlines():
+                try:
+                    pts.append(float(line.strip().split(',')[0]))
+                except ValueError:
+                    pass
+
+    if not pts:
+        cmd = [get_ffmpeg_exe(), '-hide_banner', '-nostats', '-loglevel', 'error', '-i', video_path,
+               '-map', '0:v:0', '-c', 'copy', '-f', 'framemd5', '-']
+        proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        tb = None
+        for line in proc.stdout.decode('utf-8', errors='replace').splitlines():
+            if line.startswith('#'):
+                m = _FRAMEMD5_TB_RE.match(line)
+                if m:
+                    tb = int(m.group(1)) / int(m.group(2))
+                continue
+            parts = [p.strip() for p in line.split(',')]
+            if tb is not None and len(parts) >= 3:
+                try:
+                    pts.append(int(parts[2]) * tb)
+                except ValueError:
+                    pass
+
+    if not pts:
+        return []
+    pts.sort()
+    first = pts[0]
+    return [t - first for t in pts]
+
+
+def is_variable_frame_rate(frame_times, tolerance=0.1):
+    """
+    True if frame intervals deviate from the median interval by more than
+    `tolerance` (fraction of the median) anywhere in the stream.
+    """
+    if len(frame_times) < 3:
+        return False
+    deltas = np.diff(np.asarray(frame_times, dtype=np.float64))
+    median = float(np.median(deltas))
+    if median <= 0:
+        return True
+    return bool(np.max(np.abs(deltas - median)) > tolerance * median)
+
+
+# ================================================================
+#  BİRLEŞTİRME (STREAM COPY)
+#  ================================================================
+
+def concat_stream_copy(part_paths, output_path):
+    """
+    Join already-encoded parts with the concat demuxer without re-encoding.
+    All parts must share codec parameters (same encoder settings).
+    """
+    if not part_paths:
+        raise ValueError("No parts to concatenate")
+
+    out_dir = os.path.dirname(os.path.abspath(output_path)) or '.'
+    fd, list_path = tempfile.mkstemp(prefix='.vpro_concat_', suffix='.txt', dir=out_dir)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            f.write("ffconcat version 1.0\n")
+            for p in part_paths:
+                escaped = os.path.abspath(p).replace("'", "'\\''")
+                f.write(f"file '{escaped}'\n")
+        run_ffmpeg(['-loglevel', 'error', '-f', 'concat', '-safe', '0', '-i', list_path,
+                    '-map', '0', '-c', 'copy', output_path])
+    finally:
+        try:
+            os.remove(list_path)
+        except OSError:
+            pass
+    return output_path
+
+
+# ================================================================
+#  ENCODER BORUSU
+#  ================================================================
+
+# Matroska V_UNCOMPRESSED ColourSpace fourcc'leri (ffmpeg raw etiketleri)
+_MKV_RAW_FOURCC = {
+    'bgr24': b'BGR\x18',
+    'rgb24': b'RGB\x18',
+    'bgra': b'BGRA',
+}
+_MKV_TIMESTAMP_SCALE_NS = 1000      # microsecond timestamps
+_MKV_UNKNOWN_SIZE = b'\x01\xff\xff\xff\xff\xff\xff\xff'
+
+
+def _ebml_uint(value):
+    value = int(value)
+    return value.to_bytes(max(1, (value.bit_length() + 7) // 8), 'big')
+
+
+def _ebml_size(n):
+    # Shortest EBML variable-size integer for `n`
+    for length in range(1, 9):
+        if n < (1 << (7 * length)) - 1:
+            return ((1 << (7 * length)) | n).to_bytes(length, 'big')
+    raise ValueError(f"EBML element too large: {n}")
+
+
+def _ebml(element_id, payload):
+    return element_id + _ebml_size(len(payload)) + payload
+
+
+def _mkv_stream_header(size, pix_fmt):
+    """EBML header, open-ended Segment, Info and one raw video track."""
+    header = _ebml(b'\x1a\x45\xdf\xa3', b''.join([
+        _ebml(b'\x42\x86', _ebml_uint(1)),          # EBMLVersion
+        _ebml(b'\x42\xf7', _ebml_uint(1)),          # EBMLReadVersion
+        _ebml(b'\x42\xf2', _ebml_uint(4)),          # EBMLMaxIDLength
+        _ebml(b'\x42\xf3', _ebml_uint(8)),          # EBMLMaxSizeLength
+        _ebml(b'\x42\x82', b'matroska'),            # DocType
+        _ebml(b'\x42\x87', _ebml_uint(4)),          # DocTypeVersion
+        _ebml(b'\x42\x85', _ebml_uint(2)),          # DocTypeReadVersion
+    ]))
+    info = _ebml(b'\x15\x49\xa9\x66', b''.join([
+        _ebml(b'\x2a\xd7\xb1', _ebml_uint(_MKV_TIMESTAMP_SCALE_NS)),
+        _ebml(b'\x4d\x80', b'VeloMetrics'),         # MuxingApp
+        _ebml(b'\x57\x41', b'VeloMetrics'),         # WritingApp
+    ]))
+    video = _ebml(b'\xe0', b''.join([
+        _ebml(b'\xb0', _ebml_uint(size[0])),         # PixelWidth
+        _ebml(b'\xba', _ebml_uint(size[1])),         # PixelHeight
+        _ebml(b'\x2e\xb5\x24', _MKV_RAW_FOURCC[pix_fmt]),  # ColourSpace
+    ]))
+    track = _ebml(b'\xae', b''.join([
+        _ebml(b'\xd7', _ebml_uint(1)),               # TrackNumber
+        _ebml(b'\x73\xc5', _ebml_uint(1)),          # TrackUID
+        _ebml(b'\x83', _ebml_uint(1)),               # TrackType: video
+        _ebml(b'\x9c', _ebml_uint(0)),               # FlagLacing
+        _ebml(b'\x86', b'V_UNCOMPRESSED'),           # CodecID
+        video,
+    ]))
+    tracks = _ebml(b'\x16\x54\xae\x6b', track)
+    return header + b'\x18\x53\x80\x67' + _MKV_UNKNOWN_SIZE + info + tracks
+
+
+def _mkv_cluster_header(pts_units, frame_bytes):
+    """One Cluster holding one keyframe SimpleBlock; the frame bytes follow."""
+    timestamp = _ebml(b'\xe7', _ebml_uint(pts_units))
+    block_head = b'\x81\x00\x00\x80'                # track 1, relative time 0, keyframe
+    block = b'\xa3' + _ebml_size(len(block_head) + frame_bytes) + block_head
+    cluster_len = len(timestamp) + len(block) + frame_bytes
+    return b'\x1f\x43\xb6\x75' + _ebml_size(cluster_len) + timestamp + block
+
+class FrameWriter:
+    """
+    Pipe raw frames straight into an ffmpeg encoder.
+
+    Frames are taken in OpenCV's BGR layout by default, so the render loop
+    does not need a BGR->RGB conversion per frame. Encoder arguments mirror
+    MoviePy's writer (libx264, preset, threads, yuv420p).
+
+    With `timestamps=True` every `write` carries the frame's presentation
+    time. Frames then travel in a minimal Matroska stream (raw video, one
+    cluster per frame) and ffmpeg keeps those times on output, so a VFR
+    source is encoded without CFR duplication or dropping. Adding
+    `fill_cfr=True` makes ffmpeg produce constant `fps` output instead,
+    repeating each frame until the next timestamp: a frame that does not
+    change needs to be sent only once.
+
+    `background=(video_path, start_time, duration)` turns the piped frames
+    into an alpha layer: ffmpeg decodes that part of the source itself and
+    composites the layer on top with its `overlay` filter (each layer frame
+    stays on screen until the next timestamp). Source pixels then never
+    pass through Python. Needs `timestamps=True` and an alpha `pix_fmt_in`.
+    """
+
+    def __init__(self, output_file, size, fps, codec='libx264', preset='medium', threads=None,
+                 pix_fmt_in='bgr24', pix_fmt_out='yuv420p', extra_args=None, timestamps=False,
+                 fill_cfr=False, background=None):
+        self.output_file = output_file
+        self.size = (int(size[0]), int(size[1]))
+        self.timestamps = bool(timestamps)
+        cmd = [get_ffmpeg_exe(), '-hide_banner', '-y', '-loglevel', 'error']
+        if self.timestamps:
+            if pix_fmt_in not in _MKV_RAW_FOURCC:
+                raise ValueError(f"unsupported pixel format for timestamped frames: {pix_fmt_in}")
+            if background is not None:
+                video_path, start_time, duration = background
+                if start_time and start_time > 0:
+                    cmd += ['-ss', f"{float(start_time):.6f}"]
+                cmd += ['-t', f"{float(duration):.6f}", '-i', video_path]
+            cmd += ['-f', 'matroska', '-an', '-i', '-']
+            if background is not None:
+                # Straight-alpha overlay; the last layer frame is held to the end of the source
+                cmd += ['-filter_complex', '[0:v][1:v]overlay=eof_action=repeat:format=auto[v]',
+                        '-map', '[v]', '-an', '-sn']
+            if fill_cfr:
+                cmd += ['-fps_mode', 'cfr', '-r', f"{fps}"]
+            else:
+                # Without a fixed time base the encoder uses 1 / (guessed frame
+                # rate) and rounds every timestamp to that grid
+                cmd += ['-fps_mode', 'passthrough', '-enc_time_base', '1/90000']
+        elif background is not None:
+            raise ValueError("a background video needs timestamped frames")
+        else:
+            cmd += ['-f', 'rawvideo', '-vcodec', 'rawvideo',
+                    '-s', f"{self.size[0]}x{self.size[1]}", '-pix_fmt', pix_fmt_in,
+                    '-r', f"{fps}", '-an', '-i', '-']
+        cmd += ['-vcodec', codec]
+        if preset:
+            cmd += ['-preset', preset]
+        if threads is not None:
+            cmd += ['-threads', str(threads)]
+        if pix_fmt_out and self.size[0] % 2 == 0 and self.size[1] % 2 == 0:
+            cmd += ['-pix_fmt', pix_fmt_out]
+        if extra_args:
+            cmd += list(extra_args)
+        cmd.append(output_file)
+        # stderr goes to a temp file so a chatty encoder can never block the pipe
+        self._log = tempfile.TemporaryFile()
+        self.proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                     stderr=self._log)
+        self.frames_written = 0
+        self._last_pts_units = -1
+        if self.timestamps:
+            self._send(_mkv_stream_header(self.size, pix_fmt_in))
+
+    def _send(self, data):
+        try:
+            self.proc.stdin.write(data)
+        except (BrokenPipeError, OSError) as e:
+            raise RuntimeError(f"ffmpeg encoder stopped: {self._read_log() or e}")
+
+    def write(self, frame, pts=None):
+        """
+        Write one frame (uint8 array matching `size` and `pix_fmt_in`).
+        `pts` (seconds) is required when the writer was opened with
+        `timestamps=True` and ignored otherwise.
+        """
+        data = memoryview(frame).cast('B') if frame.flags['C_CONTIGUOUS'] else frame.tobytes()
+        if self.timestamps:
+            if pts is None:
+                raise ValueError("timestamped FrameWriter needs a pts for every frame")
+            units = int(round(pts * 1e9 / _MKV_TIMESTAMP_SCALE_NS))
+            # Keep timestamps strictly increasing after rounding
+            units = max(units, self._last_pts_units + 1)
+            self._last_pts_units = units
+            self._send(_mkv_cluster_header(units, len(data)))
+        try:
+            self.proc.stdin.write(data)
+        except (BrokenPipeError, OSError) as e:
+            raise RuntimeError(f"ffmpeg encoder stopped: {self._read_log() or e}")
+        self.frames_written += 1
+
+    def _read_log(self):
+        try:
+            self._log.seek(0)
+            return self._log.read().decode('utf-8', errors='replace').strip()
+        except Exception:
+            return ''
+
+    def close(self):
+        """Flush the encoder and wait for ffmpeg to finish the file."""
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdin.close()
+        except OSError:
+            pass
+        ret = self.proc.wait()
+        self.proc = None
+        log = self._read_log()
+        self._log.close()
+        if ret != 0:
+            raise RuntimeError(f"ffmpeg encoder failed ({ret}): {log}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None and self.proc is not None:
+            self.proc.kill()
+            self.proc.wait()
+            self.proc = None
+            self._log.close()
+            return False
+        self.close()
+        return False
+
+
+# ================================================================
+#  DECODER BORUSU
+#  ================================================================
+
+class FrameReader:
+    """
+    Read raw frames from an ffmpeg decoder, starting at `start_time`.
+
+    `-ss` before `-i` makes the demuxer jump to the keyframe preceding
+    `start_time`; ffmpeg then decodes and drops frames up to the exact time
+    (accurate seek). Opening at minute 95 therefore costs at most one GOP of
+    decoding. Frames come out in OpenCV's BGR layout by default.
+
+    By default ffmpeg resamples to the stream's nominal frame rate (like
+    MoviePy). `passthrough=True` returns every decoded frame exactly once,
+    in presentation order, for timestamp-driven (VFR) rendering.
+    `video_filter` is an extra ffmpeg filter chain run before conversion
+    (e.g. `fps=...` so only selected frames are converted and piped).
+    """
+
+    def __init__(self, video_path, size, start_time=0.0, frame_count=None, pix_fmt='bgr24',
+                 passthrough=False, video_filter=None):
+        self.video_path = video_path
+        self.size = (int(size[0]), int(size[1]))
+        self.frame_shape = (self.size[1], self.size[0], 3)
+        self.frame_bytes = int(np.prod(self.frame_shape))
+        cmd = [get_ffmpeg_exe(), '-hide_banner', '-nostdin', '-loglevel', 'error']
+        if start_time and start_time > 0:
+            cmd += ['-ss', f"{float(start_time):.6f}"]
+        cmd += ['-i', video_path, '-map', '0:v:0', '-an', '-sn']
+        if video_filter:
+            cmd += ['-vf', video_filter]
+        if passthrough:
+            cmd += ['-fps_mode', 'passthrough']
+        if frame_count is not None:
+            cmd += ['-frames:v', str(max(0, int(frame_count)))]
+        cmd += ['-f', 'rawvideo', '-pix_fmt', pix_fmt, '-']
+        self._log = tempfile.TemporaryFile()
+        self.proc = subprocess.Popen(cmd, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                                     stderr=self._log, bufsize=self.frame_bytes)
+        self.frames_read = 0
+
+    def read(self, out=None):
+        """
+        Return the next frame as a new (H, W, 3) uint8 array, or None at the end.
+
+        With `out` (a C-contiguous uint8 array of frame_shape) the frame is
+        read straight into it and `out` is returned, saving one copy.
+        """
+        frame = out if out is not None else np.empty(self.frame_shape, dtype=np.uint8)
+        view = memoryview(frame).cast('B')
+        got = 0
+        while got < self.frame_bytes:
+            n = self.proc.stdout.readinto(view[got:])
+            if not n:
+                if self.frames_read == 0 and self.proc.wait() != 0:
+                    raise RuntimeError(f"ffmpeg decoder failed: {self._read_log()}")
+                return None
+            got += n
+        self.frames_read += 1
+        return frame
+
+    def skip(self, count):
+        """Drop `count` frames; returns False if the stream ended first."""
+        for _ in range(int(count)):
+            if not self.proc.stdout.read(self.frame_bytes):
+                return False
+            self.frames_read += 1
+        return True
+
+    def _read_log(self):
+        try:
+            self._log.seek(0)
+            return self._log.read().decode('utf-8', errors='replace').strip()
+        except Exception:
+            return ''
+
+    def close(self):
+        """Stop the decoder (it may still be running if we stopped early)."""
+        if self.proc is None:
+            return
+        try:
+            self.proc.stdout.close()
+        except OSError:
+            pass
+        if self.proc.poll() is None:
+            self.proc.kill()
+        self.proc.wait()
+        self.proc = None
+        self._log.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+
+
+if __name__ == "__main__":
+    print("✅ ffmpeg utils module loaded")
+    print(f"   • ffmpeg: {get_ffmpeg_exe()}")
+    print(f"   • ffprobe: {get_ffprobe_exe() or 'not found'}")
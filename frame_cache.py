@@ -0,0 +1,213 @@
+# ================================================================
+#  ÇÖZÜLMÜŞ FRAME ÖNBELLEĞİ (frame_cache.py)
+#  ================================================================
+#  Demo penceresinin çözülmüş (decode edilmiş) frame'leri bir kez
+#  ham bir dosyaya yazılır, sonraki render'lar pikselleri doğrudan
+#  bellek eşlemeli (mmap) dosyadan okur; H.264/HEVC tekrar çözülmez.
+#
+#    .vpro_frame_cache/
+#        <anahtar>.raw     ← (N, H, W, 3) uint8 BGR frame'ler
+#        <anahtar>.json    ← boyut, fps, başlangıç, frame sayısı
+#
+#  - Anahtar: video kimliği (yol, boyut, mtime) + fps + başlangıç + çözünürlük
+#  - Toplam boyut sınırlıdır; en uzun süredir kullanılmayan pencere silinir
+#  - Yarım kalan kayıtlar (.part) asla kullanılmaz
+#  ================================================================
+
+import hashlib
+import json
+import os
+import time
+
+import numpy as np
+
+from config import FRAME_CACHE_CONFIG, DEMO_MODU
+
+
+def cache_enabled():
+    """True if decoded frames should be cached for this run."""
+    if not FRAME_CACHE_CONFIG.get('enabled', False):
+        return False
+    return DEMO_MODU or not FRAME_CACHE_CONFIG.get('demo_only', True)
+
+
+def get_cache_dir(video_path):
+    """Cache directory from FRAME_CACHE_CONFIG (default: next to the video)."""
+    cache_dir = FRAME_CACHE_CONFIG.get('dir')
+    if not cache_dir:
+        video_dir = os.path.dirname(os.path.abspath(video_path)) or '.'
+        cache_dir = os.path.join(video_dir, '.vpro_frame_cache')
+    return cache_dir
+
+
+def window_key(video_path, size, fps, start_offset):
+    """Identity of a decoded window, independent of how many frames it holds."""
+    try:
+        st = os.stat(video_path)
+        ident = [os.path.abspath(video_path), st.st_size, st.st_mtime_ns]
+    except OSError:
+        ident = [os.path.abspath(video_path), None, None]
+    payload = json.dumps([ident, [int(size[0]), int(size[1])], float(fps), float(start_offset)])
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def _write_json_atomic(path, obj):
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, indent=2)
+    os.replace(tmp, path)
+
+
+# ================================================================
+#  ÖNBELLEK DİZİNİ
+#  ================================================================
+
+class FrameCache:
+    """
+    Directory of decoded frame windows with a total size cap.
+
+    Entries are looked up by `window_key`; a hit returns a copy-on-write
+    memmap, so callers can treat the frames like freshly decoded arrays
+    without ever modifying the file.
+    """
+
+    def __init__(self, cache_dir, max_bytes):
+        self.cache_dir = cache_dir
+        self.max_bytes = int(max_bytes)
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _paths(self, key):
+        base = os.path.join(self.cache_dir, key)
+        return base + '.raw', base + '.json'
+
+    def lookup(self, key, size, min_frames):
+        """Return a (N, H, W, 3) memmap holding at least `min_frames`, or None."""
+        raw_path, meta_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+        W, H = int(size[0]), int(size[1])
+        count = int(meta.get('frame_count', 0))
+        if meta.get('width') != W or meta.get('height') != H or count < min_frames:
+            return None
+        try:
+            if os.path.getsize(raw_path) != count * H * W * 3:
+                return None
+            frames = np.memmap(raw_path, dtype=np.uint8, mode='c', shape=(count, H, W, 3))
+        except (OSError, ValueError):
+            return None
+        # mtime of the metadata is the LRU clock
+        now = time.time()
+        os.utime(meta_path, (now, now))
+        return frames
+
+    def entries(self):
+        """[(last_used, nbytes, key)] for every complete entry."""
+        out = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.json'):
+                continue
+            key = name[:-len('.json')]
+            raw_path, meta_path = self._paths(key)
+            try:
+                out.append((os.path.getmtime(meta_path), os.path.getsize(raw_path), key))
+            except OSError:
+                pass
+        return out
+
+    def remove(self, key):
+        for path in self._paths(key):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def make_room(self, nbytes):
+        """
+        Evict least recently used windows until `nbytes` more fit under the
+        cap. Returns False if the window would not fit even in an empty cache.
+        """
+        if nbytes > self.max_bytes:
+            return False
+        entries = sorted(self.entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, key in entries:
+            if total + nbytes <= self.max_bytes:
+                break
+            self.remove(key)
+            total -= size
+        return total + nbytes <= self.max_bytes
+
+    def record(self, key, size, fps, start_offset, frame_count):
+        """Start recording a window; returns a WindowRecorder or None if it cannot fit."""
+        W, H = int(size[0]), int(size[1])
+        nbytes = int(frame_count) * H * W * 3
+        if frame_count <= 0 or not self.make_room(nbytes):
+            return None
+        raw_path, meta_path = self._paths(key)
+        meta = {'width': W, 'height': H, 'fps': fps, 'start_offset': start_offset,
+                'frame_count': int(frame_count)}
+        return WindowRecorder(raw_path, meta_path, meta)
+
+
+class WindowRecorder:
+    """
+    Write frames 0..N-1 of a window, in order, into a `.part` memmap and
+    publish it (rename + metadata) once the last frame arrives. Any
+    out-of-order frame abandons the recording.
+    """
+
+    def __init__(self, raw_path, meta_path, meta):
+        self.raw_path = raw_path
+        self.meta_path = meta_path
+        self.meta = meta
+        self.part_path = raw_path + '.part'
+        shape = (meta['frame_count'], meta['height'], meta['width'], 3)
+        self.frames = np.memmap(self.part_path, dtype=np.uint8, mode='w+', shape=shape)
+        self.next = 0
+        self.done = False
+
+    def put(self, n, frame):
+        if self.frames is None:
+            return
+        if n != self.next or frame.shape != self.frames.shape[1:]:
+            self.abort()
+            return
+        self.frames[n] = frame
+        self.next += 1
+        if self.next == len(self.frames):
+            self._finish()
+
+    def _finish(self):
+        self.frames.flush()
+        self.frames = None
+        os.replace(self.part_path, self.raw_path)
+        _write_json_atomic(self.meta_path, self.meta)
+        self.done = True
+
+    def abort(self):
+        self.frames = None
+        if not self.done:
+            try:
+                os.remove(self.part_path)
+            except OSError:
+                pass
+
+
+def open_window(video_path, size, fps, start_offset, frame_count, record=True):
+    """
+    Return (frames, recorder) for the first `frame_count` frames of the
+    window starting at `start_offset`: a cached memmap on a hit, otherwise
+    a recorder (None if `record` is off or the window does not fit).
+    """
+    cache = FrameCache(get_cache_dir(video_path),
+                       float(FRAME_CACHE_CONFIG.get('max_mb', 8192)) * 1024 ** 2)
+    key = window_key(video_path, size, fps, start_offset)
+    frames = cache.lookup(key, size, frame_count)
+    if frames is not None:
+        return frames, None
+    if not record:
+        return None, None
+    return None, cache.record(key, size, fps, start_offset, frame_count)
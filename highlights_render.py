@@ -0,0 +1,196 @@
+# ================================================================
+#  ÖNE ÇIKANLAR (HIGHLIGHT) RENDER MODÜLÜ (highlights_render.py)
+#  ================================================================
+#  Uzun bir sürüşten sadece ilginç anlar render edilir:
+#
+#  - Telemetri toplu olarak taranır (DataHandler.get_data_batch):
+#    en yüksek hız, en dik tırmanış, nabız zirvesi, sprint gücü
+#  - Sabit uzunlukta pencereler puanlanır, çakışmayan en iyi
+#    pencereler hedef süre dolana kadar seçilir
+#  - Her pencere hızlı seek ile ayrı render edilir (render_chunk),
+#    kenarlarda kısa siyaha geçiş yapılır ve hepsi yeniden
+#    kodlanmadan tek dosyada birleştirilir
+#  ================================================================
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from config import HIGHLIGHTS_CONFIG
+from ffmpeg_utils import concat_stream_copy
+from parallel_render import render_chunk
+from progress import progress_update
+from utils import clear_gradient_cache
+from video_renderer import resolve_render_window
+
+
+# Channel → how a window summarises it: peaks for effort, average for climbs
+_CHANNEL_REDUCE = {
+    'speed': 'max',
+    'climb': 'mean',
+    'hr': 'max',
+    'power': 'max',
+}
+
+
+# ================================================================
+#  PENCERE PUANLAMA
+#  ================================================================
+
+def _window_reduce(values, length, how):
+    """Max or mean of every `length`-sample window (NaN-aware), one per start."""
+    count = len(values) - length + 1
+    if count <= 0:
+        return np.zeros(0)
+    windows = np.lib.stride_tricks.sliding_window_view(values, length)
+    with np.errstate(all='ignore'):
+        if how == 'max':
+            out = np.nanmax(np.where(np.isnan(windows), -np.inf, windows), axis=1)
+        else:
+            out = np.nanmean(windows, axis=1)
+    return np.where(np.isfinite(out), out, np.nan)
+
+
+def _percentile_rank(values):
+    """Rank of each value in [0, 1]; NaN stays NaN (channel missing there)."""
+    out = np.full(len(values), np.nan)
+    valid = ~np.isnan(values)
+    n = int(valid.sum())
+    if n == 0 or np.nanmax(values) == np.nanmin(values):
+        return out
+    order = np.argsort(values[valid], kind='stable')
+    ranks = np.empty(n)
+    ranks[order] = np.arange(n) / max(1, n - 1)
+    out[valid] = ranks
+    return out
+
+
+def score_windows(telemetry, scan_hz, window_seconds, weights):
+    """
+    Score every window start on the scan grid.
+
+    Returns (scores, channel_ranks): the weighted sum of per-channel
+    percentile ranks, and the ranks themselves (for reporting why a window
+    was picked). Channels without data (e.g. no HR strap) are skipped.
+    """
+    length = max(1, int(round(window_seconds * scan_hz)))
+    channels = {
+        'speed': telemetry['speed'],
+        'climb': np.maximum(telemetry['grade'], 0.0),
+        'hr': telemetry['hr'],
+        'power': telemetry['power'],
+    }
+    count = max(0, len(telemetry['t']) - length + 1)
+    scores = np.zeros(count)
+    ranks = {}
+    for name, values in channels.items():
+        weight = float(weights.get(name, 0.0))
+        if weight <= 0:
+            continue
+        rank = _percentile_rank(_window_reduce(np.asarray(values, dtype=np.float64), length,
+                                               _CHANNEL_REDUCE[name]))
+        if np.all(np.isnan(rank)):
+            continue
+        ranks[name] = rank
+        scores += weight * np.nan_to_num(rank)
+    return scores, ranks
+
+
+def pick_highlights(scores, window_len, target_count, min_gap):
+    """
+    Greedy choice of the best non-overlapping windows (start indices on the
+    scan grid), at least `min_gap` samples apart, returned in time order.
+    """
+    picked = []
+    for i in np.argsort(-scores, kind='stable'):
+        if len(picked) >= target_count:
+            break
+        i = int(i)
+        if all(i + window_len + min_gap <= p or p + window_len + min_gap <= i for p in picked):
+            picked.append(i)
+    return sorted(picked)
+
+
+# ================================================================
+#  ANA HIGHLIGHT RENDER
+#  ================================================================
+
+def render_video_highlights(clip, data_handler, output_file):
+    """
+    Render only the highest-scoring telemetry windows and join them.
+
+    Args:
+        clip: MoviePy VideoFileClip object (closed after planning)
+        data_handler: DataHandler object
+        output_file: Output video file
+    """
+    W, H = int(clip.size[0]), int(clip.size[1])
+    start_offset, duration = resolve_render_window(clip)
+    fps = clip.fps
+    video_path = clip.filename
+    clip.close()
+
+    scan_hz = float(HIGHLIGHTS_CONFIG.get('scan_hz', 1.0))
+    clip_s = float(HIGHLIGHTS_CONFIG.get('clip_seconds', 12))
+    target_s = float(HIGHLIGHTS_CONFIG.get('target_seconds', 180))
+    window_len = max(1, int(round(clip_s * scan_hz)))
+
+    print("\n📈 Scanning telemetry for highlights...")
+    scan_times = start_offset + np.arange(int(duration * scan_hz)) / scan_hz
+    telemetry = data_handler.get_data_batch(scan_times)
+    scores, ranks = score_windows(telemetry, scan_hz, clip_s, HIGHLIGHTS_CONFIG.get('weights', {}))
+    if len(scores) == 0:
+        raise RuntimeError(f"render window ({duration:.0f}s) is shorter than one highlight clip ({clip_s:.0f}s)")
+    picked = pick_highlights(scores, window_len, max(1, int(target_s // clip_s)),
+                             int(round(float(HIGHLIGHTS_CONFIG.get('min_gap_seconds', 5)) * scan_hz)))
+
+    frame_count = int(round(clip_s * fps))
+    fade_frames = int(round(float(HIGHLIGHTS_CONFIG.get('transition_seconds', 0.5)) * fps))
+    segments = []
+    for i in picked:
+        first = int(round((scan_times[i] - start_offset) * fps))
+        best = max(ranks, key=lambda name: ranks[name][i]) if ranks else '-'
+        segments.append((first, frame_count, best))
+
+    print(f"\n📝 Opening output video:")
+    print(f"   • File: {output_file}")
+    print(f"   • Resolution: {W}x{H}")
+    print(f"   • FPS: {fps}")
+    print(f"   • Highlights: {len(segments)} × {clip_s:.0f}s from {duration / 60:.0f} min")
+    for first, count, best in segments:
+        t = start_offset + first / fps
+        print(f"     - {int(t // 3600)}:{int(t // 60) % 60:02d}:{int(t) % 60:02d}  ({best})")
+
+    print("\n▶️  Starting highlights render...\n")
+
+    out_dir = os.path.dirname(os.path.abspath(output_file)) or '.'
+    clip_dir = tempfile.mkdtemp(prefix='.vpro_highlights_', dir=out_dir)
+    parts = []
+    total_frames = sum(count for _, count, _ in segments)
+    frames_done = [0]
+    progress_update(0, total_frames)
+
+    def count_frame():
+        frames_done[0] += 1
+        progress_update(frames_done[0], total_frames)
+
+    try:
+        for k, (first, count, _) in enumerate(segments):
+            part = os.path.join(clip_dir, f"highlight_{k:03d}.mp4")
+            print(f"🎞️  Highlight {k + 1}/{len(segments)}")
+            render_chunk(video_path, data_handler.fork(), first, count, fps, start_offset, part,
+                         logger='bar', fade_frames=fade_frames, on_frame=count_frame)
+            parts.append(part)
+
+        print("\n🔗 Joining highlights (stream copy)...")
+        concat_stream_copy(parts, output_file)
+    finally:
+        shutil.rmtree(clip_dir, ignore_errors=True)
+        clear_gradient_cache()
+
+    print(f"\n✅ RENDER COMPLETE!")
+    print(f"   • {total_frames} frames processed")
+    print(f"   • Duration: {total_frames / fps:.1f}s")
+    print(f"   • File: {output_file}")
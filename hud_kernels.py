@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# ================================================================
+#  HUD PİKSEL ÇEKİRDEKLERİ MODÜLÜ (hud_kernels.py)
+#  ================================================================
+#  render_unified_hud ve blend_hud'un piksel başına geçişleri:
+#
+#  - Alfa kurulumu: boyanmış piksel maskesi, parlaklık (luminance)
+#    ile arka plan / içerik ayrımı, merkeze doğru radyal solma,
+#    RGBA katmanı → tek fonksiyon
+#  - Birleştirme: frame * (1 - a) + hud * a
+#
+#  İki uygulama aynı pikselleri üretir:
+#    numpy → varsayılan / yedek; ara diziler ayırır
+#    numba → isteğe bağlı; tek geçişli, satırlar prange ile paralel
+#  HUD_CONFIG['pixel_kernels']: 'auto' (numba varsa), 'numba', 'numpy'
+#
+#  Kullanım:  python hud_kernels.py      (iki yolu karşılaştırır)
+#  ================================================================
+
+import sys
+import time
+
+import numpy as np
+
+from config import HUD_CONFIG
+
+try:
+    from numba import njit, prange
+    has_numba = True
+except ImportError:
+    has_numba = False
+
+_warned = False
+
+
+def pixel_kernel_backend():
+    """'numba' or 'numpy', as picked by HUD_CONFIG['pixel_kernels']."""
+    global _warned
+    choice = HUD_CONFIG.get('pixel_kernels', 'auto')
+    if choice == 'numpy':
+        return 'numpy'
+    if has_numba:
+        return 'numba'
+    if choice == 'numba' and not _warned:
+        _warned = True
+        print("⚠️  numba kurulu değil; NumPy piksel geçişleri kullanılıyor.")
+        print("⚠️  numba is not installed; using the NumPy pixel passes.")
+    return 'numpy'
+
+
+# ================================================================
+#  NUMPY (REFERANS)
+#  ================================================================
+
+def hud_rgba_numpy(hud, xg, yg, bg_thresh, fade_strength, base_bg_alpha):
+    """
+    RGBA HUD layer from the painted BGR canvas.
+
+    Dark painted pixels (glass backgrounds) get `base_bg_alpha`, faded
+    toward the screen center; brighter ones (text, icons) are opaque.
+    `xg`/`yg` are the pixel coordinate grids of the canvas.
+
+    Returns:
+        np.ndarray | None: uint8 HxWx4, or None when nothing was painted
+    """
+    render_H, render_W = hud.shape[:2]
+    # Compute diff mask where HUD painted (scaled)
+    diff_mask = np.any(hud != 0, axis=2)
+    if not np.any(diff_mask):
+        return None
+
+    # Prepare alpha mask: classify background vs content (text/icons)
+    # Use luminance to estimate background (dark glass areas)
+    bgr = hud.astype(np.float32)
+    lum = 0.2126 * bgr[:, :, 2] + 0.7152 * bgr[:, :, 1] + 0.0722 * bgr[:, :, 0]
+    background_mask = (lum < bg_thresh) & diff_mask
+    content_mask = diff_mask & (~background_mask)
+
+    # Radial fade toward screen center (use scaled coords)
+    cx, cy = render_W // 2, render_H // 2
+    dist = np.sqrt((xg - cx) ** 2 + (yg - cy) ** 2)
+    maxd = np.sqrt(cx ** 2 + cy ** 2)
+    nd = np.clip(dist / (maxd + 1e-6), 0.0, 1.0)
+    # alpha factor for backgrounds: edges keep base alpha, center becomes more transparent
+    alpha_bg_factor = 1.0 - fade_strength * (1.0 - nd)
+
+    alpha_map = np.zeros((render_H, render_W), dtype=np.float32)
+    alpha_map[background_mask] = base_bg_alpha * alpha_bg_factor[background_mask]
+    alpha_map[content_mask] = 1.0
+
+    # Ensure values in [0,1]
+    alpha_map = np.clip(alpha_map, 0.0, 1.0)
+
+    # Build RGBA HUD for remapping
+    alpha_chan = (alpha_map * 255).astype(np.uint8)
+    return np.dstack((hud, alpha_chan))
+
+
+def blend_numpy(img_bgr, hud_bgr, hud_alpha):
+    """img * (1 - a) + hud * a with a float32 HxW alpha."""
+    a3 = np.dstack([hud_alpha, hud_alpha, hud_alpha])
+    composed = (img_bgr.astype(np.float32) * (1.0 - a3) + hud_bgr.astype(np.float32) * a3)
+    return np.clip(composed, 0, 255).astype(np.uint8)
+
+
+# ================================================================
+#  NUMBA
+#  ================================================================
+#  Same float32 / float64 steps as the NumPy path, so the results
+#  match it bit for bit up to luminance values on the threshold.
+
+if has_numba:
+    @njit(parallel=True, cache=True)
+    def _hud_rgba_kernel(hud, out, painted, bg_thresh, fade_strength, base_bg_alpha):
+        H, W = hud.shape[0], hud.shape[1]
+        cx, cy = W // 2, H // 2
+        maxd = np.sqrt(cx ** 2 + cy ** 2) + 1e-6
+        for y in prange(H):
+            dy = y - cy
+            row_painted = False
+            for x in range(W):
+                b, g, r = hud[y, x, 0], hud[y, x, 1], hud[y, x, 2]
+                out[y, x, 0] = b
+                out[y, x, 1] = g
+                out[y, x, 2] = r
+                if b == 0 and g == 0 and r == 0:
+                    out[y, x, 3] = 0
+                    continue
+                row_painted = True
+                lum = (np.float32(0.2126) * np.float32(r) + np.float32(0.7152) * np.float32(g)
+                       + np.float32(0.0722) * np.float32(b))
+                if lum < bg_thresh:
+                    dx = x - cx
+                    nd = min(np.sqrt(dx * dx + dy * dy) / maxd, 1.0)
+                    a = np.float32(base_bg_alpha * (1.0 - fade_strength * (1.0 - nd)))
+                    if a < 0:
+                        a = np.float32(0.0)
+                    elif a > 1:
+                        a = np.float32(1.0)
+                    out[y, x, 3] = np.uint8(a * np.float32(255.0))
+                else:
+                    out[y, x, 3] = 255
+            painted[y] = row_painted
+
+    @njit(parallel=True, cache=True)
+    def _blend_kernel(img, hud, alpha, out):
+        H, W = img.shape[0], img.shape[1]
+        for y in prange(H):
+            for x in range(W):
+                a = alpha[y, x]
+                if a == 0:
+                    for c in range(3):
+                        out[y, x, c] = img[y, x, c]
+                    continue
+                ia = np.float32(1.0) - a
+                for c in range(3):
+                    v = np.float32(img[y, x, c]) * ia + np.float32(hud[y, x, c]) * a
+                    if v < 0:
+                        v = np.float32(0.0)
+                    elif v > 255:
+                        v = np.float32(255.0)
+                    out[y, x, c] = np.uint8(v)
+
+
+def hud_rgba_numba(hud, bg_thresh, fade_strength, base_bg_alpha):
+    """hud_rgba_numpy in one parallel pass; the coordinate grids are not needed."""
+    hud = np.ascontiguousarray(hud, dtype=np.uint8)
+    out = np.empty(hud.shape[:2] + (4,), dtype=np.uint8)
+    painted = np.zeros(hud.shape[0], dtype=np.bool_)
+    _hud_rgba_kernel(hud, out, painted, float(bg_thresh), float(fade_strength), float(base_bg_alpha))
+    return out if painted.any() else None
+
+
+def blend_numba(img_bgr, hud_bgr, hud_alpha):
+    """blend_numpy in one parallel pass."""
+    out = np.empty_like(img_bgr)
+    _blend_kernel(img_bgr, hud_bgr, np.ascontiguousarray(hud_alpha, dtype=np.float32), out)
+    return out
+
+
+def warm_up_kernels():
+    """JIT-compile the numba kernels (if selected) so the first frame does not wait."""
+    backend = pixel_kernel_backend()
+    if backend == 'numba':
+        hud = np.zeros((8, 8, 3), dtype=np.uint8)
+        hud[2:6, 2:6] = (40, 40, 40)
+        hud_rgba_numba(hud, 90, 0.9, 0.75)
+        blend_numba(hud, hud, np.full((8, 8), 0.5, dtype=np.float32))
+    return backend
+
+
+# ================================================================
+#  EŞDEĞERLİK KONTROLÜ
+#  ================================================================
+
+def _synthetic_hud(W, H, seed):
+    # Dark glass panels with bright text-like strokes, anti-aliased edges
+    rng = np.random.default_rng(seed)
+    hud = np.zeros((H, W, 3), dtype=np.uint8)
+    for _ in range(12):
+        w, h = int(rng.integers(W // 10, W // 4)), int(rng.integers(H // 12, H // 5))
+        x, y = int(rng.integers(0, W - w)), int(rng.integers(0, H - h))
+        hud[y:y + h, x:x + w] = rng.integers(10, 80, size=3)
+        strokes = rng.random((h, w)) < 0.15
+        hud[y:y + h, x:x + w][strokes] = rng.integers(0, 256, size=(int(strokes.sum()), 3))
+    return hud
+
+
+def check_kernels(W=1280, H=720, seed=0, tolerance=1):
+    """
+    Compare the numba kernels with the NumPy reference on a synthetic HUD.
+
+    Returns:
+        dict: max absolute pixel difference per pass ('rgba', 'blend')
+    """
+    if not has_numba:
+        raise RuntimeError("numba is not installed")
+    hud = _synthetic_hud(W, H, seed)
+    frame = np.random.default_rng(seed + 1).integers(0, 256, size=(H, W, 3), dtype=np.uint8)
+    xg, yg = np.meshgrid(np.arange(W), np.arange(H))
+    ref = hud_rgba_numpy(hud, xg, yg, HUD_CONFIG.get('bg_lum_threshold', 90),
+                         HUD_CONFIG.get('fade_strength', 0.9), 0.75)
+    got = hud_rgba_numba(hud, HUD_CONFIG.get('bg_lum_threshold', 90),
+                         HUD_CONFIG.get('fade_strength', 0.9), 0.75)
+    alpha = ref[:, :, 3].astype(np.float32) / 255.0
+    diffs = {
+        'rgba': int(np.abs(ref.astype(np.int16) - got).max()),
+        'blend': int(np.abs(blend_numpy(frame, hud, alpha).astype(np.int16)
+                            - blend_numba(frame, hud, alpha)).max()),
+    }
+    diffs['ok'] = all(v <= tolerance for v in diffs.values())
+    return diffs
+
+
+def main():
+    if not has_numba:
+        print("❌ numba is not installed; only the NumPy path is available")
+        return 1
+    warm_up_kernels()
+    diffs = check_kernels()
+    print(f"🔍 numba vs numpy max pixel difference: rgba {diffs['rgba']}, blend {diffs['blend']}")
+
+    hud = _synthetic_hud(1920, 1080, 0)
+    frame = np.zeros_like(hud)
+    alpha = np.full(hud.shape[:2], 0.5, dtype=np.float32)
+    xg, yg = np.meshgrid(np.arange(1920), np.arange(1080))
+    for name, fn in (('rgba numpy', lambda: hud_rgba_numpy(hud, xg, yg, 90, 0.9, 0.75)),
+                     ('rgba numba', lambda: hud_rgba_numba(hud, 90, 0.9, 0.75)),
+                     ('blend numpy', lambda: blend_numpy(frame, hud, alpha)),
+                     ('blend numba', lambda: blend_numba(frame, hud, alpha))):
+        t0 = time.perf_counter()
+        for _ in range(10):
+            fn()
+        print(f"   • {name:<12} {(time.perf_counter() - t0) * 100:.2f} ms (1080p)")
+    return 0 if diffs['ok'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
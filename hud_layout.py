@@ -1,10 +1,14 @@
 import cv2
 import numpy as np
 import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from collections import OrderedDict
 
 from config import (
-    COLORS, WIDGETS_ENABLED, OPACITY, HUD_CONFIG,
+    COLORS, WIDGETS_ENABLED, OPACITY, HUD_CONFIG, FONT_CONFIG,
     WIDGET_WIDTH_RATIO, WIDGET_HEIGHT_RATIO, WIDGET_MIN_WIDTH, WIDGET_MIN_HEIGHT,
     BOX_SIZE_RATIO, BOX_SIZE_MIN, PADDING_RATIO, PADDING_MIN, GAP_RATIO, GAP_MIN,
     WIDGET_SCALE, WIDGET_VERTICAL_SHIFT_RATIO,
@@ -13,37 +17,46 @@ from config import (
 from config import TOP_WIDGET_OFFSET_PX
 from widgets import (
     draw_panel_v2, draw_heart_panel, draw_pro_map,
-    draw_elevation_profile, draw_progress_bar,
-    draw_mountain_icon, draw_route_icon, draw_speed_icon,
-    draw_gradient_icon, draw_cadence_icon, get_gradient_color
+    draw_elevation_profile, draw_progress_bar
 )
-from utils import draw_power_icon
+from icon_cache import cached_speed_icon, cached_gradient_icon, cached_power_icon
+from profiler import span, record
+from progress import progress_cache
+from theme_compiler import get_compiled_theme
+from text_atlas import text_size
+from hud_kernels import pixel_kernel_backend, hud_rgba_numpy, hud_rgba_numba
 
 # LRU caches to avoid expensive per-frame recomputation
 # Use OrderedDict to allow simple LRU eviction when cache grows too large
 _distance_cache = OrderedDict()
 _remap_cache = OrderedDict()
+# HUD may be rendered from several threads (pipeline mode); guard LRU updates
+_cache_lock = threading.RLock()
 
 
 def _create_distance_map(W, H):
     # Use cache keyed by resolution
     key = (W, H)
-    if key in _distance_cache:
-        # Move to end (most recently used)
-        _distance_cache.move_to_end(key)
-        return _distance_cache[key]
+    with _cache_lock:
+        if key in _distance_cache:
+            # Move to end (most recently used)
+            _distance_cache.move_to_end(key)
+            progress_cache('layout', True)
+            return _distance_cache[key]
+    progress_cache('layout', False)
 
     xs = np.arange(W)
     ys = np.arange(H)
     xg, yg = np.meshgrid(xs, ys)
-    _distance_cache[key] = (xg, yg)
-    # Enforce cache size limit if set in HUD_CONFIG
-    try:
-        max_entries = int(HUD_CONFIG.get('distance_cache_max_entries', 4))
-    except Exception:
-        max_entries = 4
-    while len(_distance_cache) > max_entries:
-        _distance_cache.popitem(last=False)
+    with _cache_lock:
+        _distance_cache[key] = (xg, yg)
+        # Enforce cache size limit if set in HUD_CONFIG
+        try:
+            max_entries = int(HUD_CONFIG.get('distance_cache_max_entries', 4))
+        except Exception:
+            max_entries = 4
+        while len(_distance_cache) > max_entries:
+            _distance_cache.popitem(last=False)
     return xg, yg
 
 
@@ -58,9 +71,13 @@ def get_remap_maps(W, H, curve_k):
     k_rounded = round(k, 4)
     key = (W, H, k_rounded)
 
-    if HUD_CONFIG.get('remap_cache_enabled', True) and key in _remap_cache:
-        _remap_cache.move_to_end(key)
-        return _remap_cache[key]
+    if HUD_CONFIG.get('remap_cache_enabled', True):
+        with _cache_lock:
+            if key in _remap_cache:
+                _remap_cache.move_to_end(key)
+                progress_cache('remap', True)
+                return _remap_cache[key]
+        progress_cache('remap', False)
 
     xg, yg = _create_distance_map(W, H)
     cx, cy = W // 2, H // 2
@@ -76,65 +93,85 @@ def get_remap_maps(W, H, curve_k):
     map_y = np.clip(map_y, 0, H - 1).astype(np.float32)
 
     if HUD_CONFIG.get('remap_cache_enabled', True):
-        _remap_cache[key] = (map_x, map_y)
-        try:
-            max_entries = int(HUD_CONFIG.get('remap_cache_max_entries', 4))
-        except Exception:
-            max_entries = 4
-        while len(_remap_cache) > max_entries:
-            _remap_cache.popitem(last=False)
+        with _cache_lock:
+            _remap_cache[key] = (map_x, map_y)
+            try:
+                max_entries = int(HUD_CONFIG.get('remap_cache_max_entries', 4))
+            except Exception:
+                max_entries = 4
+            while len(_remap_cache) > max_entries:
+                _remap_cache.popitem(last=False)
 
     return map_x, map_y
 
 
 def clear_hud_caches():
     """Clear remap and distance caches (call after big resolution change)."""
-    _distance_cache.clear()
-    _remap_cache.clear()
+    with _cache_lock:
+        _distance_cache.clear()
+        _remap_cache.clear()
 
 
 # (duplicate helper removed)
 
 
-def render_unified_hud(frame, data, data_handler, t):
-    """
-    Draw all enabled GPX widgets onto a single HUD layer, apply
-    a radial fade toward the screen center and an optional parabolic
-    curve. Return (hud_bgr, alpha_mask) where alpha_mask is float32 [0..1].
+# Extra pixels around each widget box: long value text and the beating
+# heart icon reach up to 8 px outside their panels
+_TILE_MARGIN = 8
 
-    - frame: source frame (BGR) used only for size reference
-    - data: interpolated GPX/datetime data dict
-    - data_handler: DataHandler instance (for points list etc.)
-    - t: current time (seconds)
+_widget_pool = None
+_widget_pool_key = None
 
-    This function ensures no widget is composited individually onto the
-    input frame; instead everything is rendered into one overlay layer.
-    """
-    H, W = frame.shape[0], frame.shape[1]
 
-    # HUD downscale (render HUD at lower resolution to speed up remap)
-    hud_scale = float(HUD_CONFIG.get('hud_downscale', 1.0))
-    hud_scale = max(0.25, min(1.0, hud_scale))
+def _widget_job(name, box, fn, *args):
+    """Build one widget job: (name, (x0, y0, x1, y1), draw) with draw(img)."""
+    x, y = box[0], box[1]
+    label = f"widget.{name}"
 
-    render_W = max(1, int(W * hud_scale))
-    render_H = max(1, int(H * hud_scale))
+    def draw(img):
+        with span(label):
+            fn(img, x, y, *args)
 
-    # Create empty HUD layer at render resolution (BGR)
-    hud = np.zeros((render_H, render_W, 3), dtype=frame.dtype)
+    return (name, box, draw)
 
+
+def widget_geometry(render_W, render_H):
+    """
+    Panel and box sizes for a HUD of render_W x render_H: dict with
+    widget_scale, bw, bh (side panels), pad, gap, box_size (map and
+    elevation boxes), bar_w, bar_h (progress bar).
+    """
     # Sizes and layout calculations (same logic as in video_renderer)
-    # Apply global widget scale and vertical shift (user-configurable)
-    widget_scale = float(WIDGET_SCALE) if 'WIDGET_SCALE' in globals() or 'WIDGET_SCALE' in locals() else float(1.0)
-    # Clamp reasonable limits
-    widget_scale = max(0.4, min(1.2, widget_scale))
-
-    bw = max(int(render_W * WIDGET_WIDTH_RATIO * widget_scale), int(WIDGET_MIN_WIDTH * widget_scale))
-    bh = max(int(render_H * WIDGET_HEIGHT_RATIO * widget_scale), int(WIDGET_MIN_HEIGHT * widget_scale))
-    pad = max(int(render_W * PADDING_RATIO * widget_scale), int(PADDING_MIN * widget_scale))
-    gap = max(int(render_H * GAP_RATIO * widget_scale), int(GAP_MIN * widget_scale))
-    box_size = max(int(min(render_W, render_H) * BOX_SIZE_RATIO * widget_scale), int(BOX_SIZE_MIN * widget_scale))
-    bar_w = int(render_W * PROGRESS_BAR_WIDTH_RATIO * widget_scale)
-    bar_h = PROGRESS_BAR_HEIGHT
+    # Apply global widget scale (user-configurable), clamped to reasonable limits
+    widget_scale = max(0.4, min(1.2, float(WIDGET_SCALE)))
+    return {
+        'widget_scale': widget_scale,
+        'bw': max(int(render_W * WIDGET_WIDTH_RATIO * widget_scale), int(WIDGET_MIN_WIDTH * widget_scale)),
+        'bh': max(int(render_H * WIDGET_HEIGHT_RATIO * widget_scale), int(WIDGET_MIN_HEIGHT * widget_scale)),
+        'pad': max(int(render_W * PADDING_RATIO * widget_scale), int(PADDING_MIN * widget_scale)),
+        'gap': max(int(render_H * GAP_RATIO * widget_scale), int(GAP_MIN * widget_scale)),
+        'box_size': max(int(min(render_W, render_H) * BOX_SIZE_RATIO * widget_scale), int(BOX_SIZE_MIN * widget_scale)),
+        'bar_w': int(render_W * PROGRESS_BAR_WIDTH_RATIO * widget_scale),
+        'bar_h': PROGRESS_BAR_HEIGHT,
+    }
+
+
+def collect_widget_jobs(render_W, render_H, data, data_handler, t, hud_scale=1.0):
+    """
+    Lay out all enabled widgets for one HUD and return their draw jobs in
+    paint order. Each job is (name, (x0, y0, x1, y1), draw) where the box
+    is the HUD area the widget may touch (decorations included) and
+    `draw(img)` paints the widget onto a HUD-sized image.
+    """
+    jobs = []
+    theme = get_compiled_theme((render_W, render_H), hud_scale)
+
+    geometry = widget_geometry(render_W, render_H)
+    widget_scale = geometry['widget_scale']
+    bw, bh = geometry['bw'], geometry['bh']
+    pad, gap = geometry['pad'], geometry['gap']
+    box_size = geometry['box_size']
+    bar_w, bar_h = geometry['bar_w'], geometry['bar_h']
 
     # Vertical shift (fraction of scaled HUD height). Positive moves widgets down.
     vshift = float(WIDGET_VERTICAL_SHIFT_RATIO)
@@ -151,10 +188,7 @@ def render_unified_hud(frame, data, data_handler, t):
     beat_freq = hr / 60.0
     beat_phase = (t * beat_freq * 2 * math.pi) % (2 * math.pi)
 
-    # Draw all widgets onto hud (they draw into provided BGR image)
-    # Fast mode control: when enabled, skip expensive features (curve, heavy widgets)
     fast_mode = HUD_CONFIG.get('fast_mode', False)
-    curve_enabled = HUD_CONFIG.get('curve_enabled', True) and not fast_mode
 
     # Left panels (3 widgets)
     pad_y = pad + vshift_px + top_offset_px
@@ -169,18 +203,19 @@ def render_unified_hud(frame, data, data_handler, t):
     
     for i, (widget_type, value) in enumerate(left_widgets[:3]):
         widget_y = pad_y + (bh + gap) * i
+        box = (pad, widget_y, pad + bw, widget_y + bh)
         
         if widget_type == 'altitude':
-            draw_panel_v2(hud, pad, widget_y, bw, bh, "ALTITUDE", int(value), "altitude",
-                          draw_mountain_icon, COLORS['altitude'])
+            jobs.append(_widget_job('altitude', box, draw_panel_v2, bw, bh, "ALTITUDE", int(value), "altitude",
+                                    theme.icon('mountain'), COLORS['altitude'], theme))
         elif widget_type == 'distance':
-            draw_panel_v2(hud, pad, widget_y, bw, bh, "DISTANCE", value, "distance",
-                          draw_route_icon, COLORS['distance'])
+            jobs.append(_widget_job('distance', box, draw_panel_v2, bw, bh, "DISTANCE", value, "distance",
+                                    theme.icon('route'), COLORS['distance'], theme))
         elif widget_type == 'gradient':
             grade_val = value if value is not None else 0.0
-            grad_color = get_gradient_color(abs(grade_val))
-            draw_panel_v2(hud, pad, widget_y, bw, bh, "GRADIENT", grade_val, "gradient",
-                          draw_gradient_icon, grad_color)
+            grad_color = theme.grade_color(abs(grade_val))
+            jobs.append(_widget_job('gradient', box, draw_panel_v2, bw, bh, "GRADIENT", grade_val, "gradient",
+                                    cached_gradient_icon, grad_color, theme))
 
     # Right panels (4 widgets)
     right_widgets = []
@@ -194,23 +229,24 @@ def render_unified_hud(frame, data, data_handler, t):
     if WIDGETS_ENABLED.get('cadence') and data_handler.has_data_type('cad'):
         right_widgets.append(('cadence', data.get('cad')))
     
-    # Draw right widgets (max 4)
+    # Right widgets (max 4)
     for i, (widget_type, value) in enumerate(right_widgets[:4]):
         widget_y = pad_y + (bh + gap) * i
+        box = (render_W - pad - bw, widget_y, render_W - pad, widget_y + bh)
         
         if widget_type == 'speed':
-            draw_panel_v2(hud, render_W - pad - bw, widget_y, bw, bh, "SPEED",
-                          value, "speed", draw_speed_icon, COLORS['speed'])
+            jobs.append(_widget_job('speed', box, draw_panel_v2, bw, bh, "SPEED",
+                                    value, "speed", cached_speed_icon, COLORS['speed'], theme))
         elif widget_type == 'heart_rate':
-            draw_heart_panel(hud, render_W - pad - bw, widget_y, bw, bh, value, beat_phase)
+            jobs.append(_widget_job('heart_rate', box, draw_heart_panel, bw, bh, value, beat_phase, theme))
         elif widget_type == 'power':
-            draw_panel_v2(hud, render_W - pad - bw, widget_y, bw, bh,
-                          "POWER", value, "power",
-                          draw_power_icon, COLORS['power'])
+            jobs.append(_widget_job('power', box, draw_panel_v2, bw, bh,
+                                    "POWER", value, "power",
+                                    cached_power_icon, COLORS['power'], theme))
         elif widget_type == 'cadence':
-            draw_panel_v2(hud, render_W - pad - bw, widget_y, bw, bh,
-                          "CADENCE", value, "cadence",
-                          draw_cadence_icon, COLORS['cadence'])
+            jobs.append(_widget_job('cadence', box, draw_panel_v2, bw, bh,
+                                    "CADENCE", value, "cadence",
+                                    theme.icon('cadence'), COLORS['cadence'], theme))
 
     # Bottom widgets (skip heavy ones in fast mode)
     if WIDGETS_ENABLED.get('elevation_profile') and not fast_mode:
@@ -219,58 +255,187 @@ def render_unified_hud(frame, data, data_handler, t):
         # available space between left pad and map box (approx)
         max_w_allowed = max(box_size, render_W - 3 * pad - box_size - int(20 * widget_scale))
         elev_w = min(desired_w, max_w_allowed)
-        draw_elevation_profile(hud, data, pad, render_H - pad - box_size - int(40 * widget_scale) + vshift_px,
-                               elev_w, box_size, data_handler.points)
+        ey = render_H - pad - box_size - int(40 * widget_scale) + vshift_px
+        # The position label can run past the right edge near the route end
+        jobs.append(_widget_job('elevation_profile', (pad, ey, pad + elev_w + 40, ey + box_size),
+                                lambda img, x, y: draw_elevation_profile(img, data, x, y, elev_w, box_size,
+                                                                         data_handler.points, theme)))
 
     if WIDGETS_ENABLED.get('route_map') and not fast_mode:
-        draw_pro_map(hud, data, render_W - pad - box_size, render_H - pad - box_size - int(40 * widget_scale) + vshift_px,
-                    box_size, data_handler.points)
+        mx = render_W - pad - box_size
+        my = render_H - pad - box_size - int(40 * widget_scale) + vshift_px
+        jobs.append(_widget_job('route_map', (mx, my, mx + box_size, my + box_size),
+                                lambda img, x, y: draw_pro_map(img, data, x, y, box_size, data_handler.points, theme)))
 
     if WIDGETS_ENABLED.get('progress_bar'):
         bx = (render_W - bar_w) // 2
         by = render_H - int(35 * hud_scale) + vshift_px
-        elapsed_seconds = int(t)
+        # Riding time when stops are cut (auto_cut), otherwise the video clock
+        elapsed_seconds = int(data.get('moving_time', t))
         from datetime import timedelta
         time_str = str(timedelta(seconds=elapsed_seconds))[2:7]
-        draw_progress_bar(hud, bx, by, bar_w, bar_h, data['progress'], time_str)
+        # Time label sits above the bar, the percentage right of it
+        label_h = 40
+        (pct_w, _), _ = text_size("100.0%", cv2.FONT_HERSHEY_TRIPLEX, FONT_CONFIG['title_size'] + 0.1, 2)
+        jobs.append(_widget_job('progress_bar', (bx, by - label_h, bx + bar_w + 8 + pct_w, by + bar_h + 5),
+                                lambda img, x, y: draw_progress_bar(img, x, y + label_h, bar_w, bar_h,
+                                                                    data['progress'], time_str, theme)))
 
-    # Compute diff mask where HUD painted (scaled)
-    diff_mask = np.any(hud != 0, axis=2)
-    if not np.any(diff_mask):
-        # Nothing drawn
-        return np.zeros((H, W, 3), dtype=np.uint8), np.zeros((H, W), dtype=np.float32)
+    return jobs
 
-    # Prepare alpha mask: classify background vs content (text/icons)
-    # Use luminance to estimate background (dark glass areas)
-    bgr = hud.astype(np.float32)
-    lum = 0.2126 * bgr[:, :, 2] + 0.7152 * bgr[:, :, 1] + 0.0722 * bgr[:, :, 0]
-    bg_thresh = HUD_CONFIG.get('bg_lum_threshold', 90)
-    background_mask = (lum < bg_thresh) & diff_mask
-    content_mask = diff_mask & (~background_mask)
-
-    # Radial fade toward screen center (use scaled coords)
-    cx, cy = render_W // 2, render_H // 2
-    xg, yg = _create_distance_map(render_W, render_H)
-    dist = np.sqrt((xg - cx) ** 2 + (yg - cy) ** 2)
-    maxd = np.sqrt(cx ** 2 + cy ** 2)
-    nd = np.clip(dist / (maxd + 1e-6), 0.0, 1.0)
-    fade_strength = HUD_CONFIG.get('fade_strength', 0.9)
-    # alpha factor for backgrounds: edges keep base alpha, center becomes more transparent
-    alpha_bg_factor = 1.0 - fade_strength * (1.0 - nd)
 
-    # Base background alpha: use the larger of small/large panel alphas
-    base_bg_alpha = max(OPACITY.get('panel_bg_alpha', 0.7), OPACITY.get('panel_bg_alpha_large', 0.75))
+def _merge_tiles(jobs):
+    """
+    Group jobs into tiles: (x0, y0, x1, y1, [jobs]) in paint order.
 
-    alpha_map = np.zeros((render_H, render_W), dtype=np.float32)
-    alpha_map[background_mask] = base_bg_alpha * alpha_bg_factor[background_mask]
-    alpha_map[content_mask] = 1.0
+    Boxes get a safety margin; jobs whose boxes touch share one tile and
+    are drawn by one worker in their original order, so overlapping
+    widgets blend exactly as in a single pass.
+    """
+    tiles = []
+    for job in jobs:
+        x0, y0, x1, y1 = job[1]
+        x0, y0 = x0 - _TILE_MARGIN, y0 - _TILE_MARGIN
+        x1, y1 = x1 + _TILE_MARGIN, y1 + _TILE_MARGIN
+        tile = [x0, y0, x1, y1, [job]]
+        # Absorb every earlier tile this one touches (repeat: the union grows)
+        merged = True
+        while merged:
+            merged = False
+            for other in tiles:
+                if other[0] < tile[2] and tile[0] < other[2] and other[1] < tile[3] and tile[1] < other[3]:
+                    tiles.remove(other)
+                    tile = [min(tile[0], other[0]), min(tile[1], other[1]),
+                            max(tile[2], other[2]), max(tile[3], other[3]),
+                            other[4] + tile[4]]
+                    merged = True
+                    break
+        tiles.append(tile)
+    # Paint order of a tile = position of its first job
+    order = {id(job): i for i, job in enumerate(jobs)}
+    for tile in tiles:
+        tile[4].sort(key=lambda j: order[id(j)])
+    tiles.sort(key=lambda tile: order[id(tile[4][0])])
+    return tiles
+
+
+def _draw_tile(hud, tile):
+    for _, _, draw in tile[4]:
+        draw(hud)
+
+
+def _get_widget_pool(workers):
+    # One shared pool per process; a forked child must not reuse the parent's
+    global _widget_pool, _widget_pool_key
+    key = (os.getpid(), workers)
+    with _cache_lock:
+        if _widget_pool is None or _widget_pool_key != key:
+            _widget_pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='vpro-widget')
+            _widget_pool_key = key
+        return _widget_pool
+
+
+def draw_widget_jobs(hud, jobs, workers=None):
+    """
+    Paint widget jobs onto `hud`.
+
+    With more than one worker (HUD_CONFIG['widget_workers'], None = auto),
+    jobs are grouped into disjoint tiles that render concurrently on a
+    thread pool (the cv2 drawing calls release the GIL). Every tile is
+    drawn in place at HUD coordinates: icon math rounds float positions,
+    so drawing at a shifted origin would not be pixel-identical. Tiles
+    never share pixels, so the result equals drawing the jobs one by one.
+    """
+    if workers is None:
+        workers = HUD_CONFIG.get('widget_workers')
+    if workers is None:
+        workers = min(4, os.cpu_count() or 1)
+    workers = max(1, int(workers))
+
+    if workers == 1 or len(jobs) < 2:
+        for _, _, draw in jobs:
+            draw(hud)
+        return hud
+
+    tiles = _merge_tiles(jobs)
+    pool = _get_widget_pool(workers)
+    # list() waits for every tile and re-raises the first widget error
+    list(pool.map(lambda tile: _draw_tile(hud, tile), tiles))
+    return hud
+
+
+def render_unified_hud(frame, data, data_handler, t, proxy_scale=None):
+    """
+    Draw all enabled GPX widgets onto a single HUD layer, apply
+    a radial fade toward the screen center and an optional parabolic
+    curve. Return (hud_bgr, alpha_mask) where alpha_mask is float32 [0..1].
+
+    - frame: source frame (BGR) used only for size reference
+    - data: interpolated GPX/datetime data dict
+    - data_handler: DataHandler instance (for points list etc.)
+    - t: current time (seconds)
+    - proxy_scale: the frame is a proxy downscaled by this factor; widgets
+      are laid out and drawn as for the full-size frame (with
+      `hud_downscale`), then shrunk to the proxy before the costly
+      mask/fade/curve passes, so the preview shows the real layout
+
+    This function ensures no widget is composited individually onto the
+    input frame; instead everything is rendered into one overlay layer.
+    """
+    H, W = frame.shape[0], frame.shape[1]
+
+    # HUD downscale (render HUD at lower resolution to speed up remap)
+    hud_scale = float(HUD_CONFIG.get('hud_downscale', 1.0))
+    hud_scale = max(0.25, min(1.0, hud_scale))
+
+    # Proxy frames: lay out for the full-size frame they stand for
+    layout_W, layout_H = W, H
+    if proxy_scale:
+        layout_W = int(round(W / float(proxy_scale)))
+        layout_H = int(round(H / float(proxy_scale)))
+
+    render_W = max(1, int(layout_W * hud_scale))
+    render_H = max(1, int(layout_H * hud_scale))
+
+    # Create empty HUD layer at render resolution (BGR)
+    hud = np.zeros((render_H, render_W, 3), dtype=frame.dtype)
 
-    # Ensure values in [0,1]
-    alpha_map = np.clip(alpha_map, 0.0, 1.0)
+    # Draw all widgets onto hud (each job may render into its own tile)
+    # Fast mode control: when enabled, skip expensive features (curve, heavy widgets)
+    fast_mode = HUD_CONFIG.get('fast_mode', False)
+    curve_enabled = HUD_CONFIG.get('curve_enabled', True) and not fast_mode
 
-    # Build RGBA HUD for remapping
-    alpha_chan = (alpha_map * 255).astype(np.uint8)
-    hud_rgba = np.dstack((hud, alpha_chan))
+    with span('hud.layout'):
+        jobs = collect_widget_jobs(render_W, render_H, data, data_handler, t, hud_scale)
+    with span('hud.widgets'):
+        draw_widget_jobs(hud, jobs)
+
+    if proxy_scale:
+        # Widgets are drawn at full layout size; masks, fade and curve run at proxy size.
+        # INTER_AREA is fast for whole-number ratios, so shrink by the integer part first
+        with span('hud.resize'):
+            step = int(render_W // W)
+            if step >= 2:
+                hud = cv2.resize(hud, (render_W // step, render_H // step), interpolation=cv2.INTER_AREA)
+            hud = cv2.resize(hud, (W, H), interpolation=cv2.INTER_AREA if step < 2 else cv2.INTER_LINEAR)
+        render_W, render_H = W, H
+
+    t_alpha = time.perf_counter()
+    # Luminance classification, radial fade and RGBA build (hud_kernels.py)
+    bg_thresh = HUD_CONFIG.get('bg_lum_threshold', 90)
+    fade_strength = HUD_CONFIG.get('fade_strength', 0.9)
+    # Base background alpha: use the larger of small/large panel alphas
+    base_bg_alpha = max(OPACITY.get('panel_bg_alpha', 0.7), OPACITY.get('panel_bg_alpha_large', 0.75))
+    if pixel_kernel_backend() == 'numba':
+        hud_rgba = hud_rgba_numba(hud, bg_thresh, fade_strength, base_bg_alpha)
+    else:
+        xg, yg = _create_distance_map(render_W, render_H)
+        hud_rgba = hud_rgba_numpy(hud, xg, yg, bg_thresh, fade_strength, base_bg_alpha)
+    if hud_rgba is None:
+        # Nothing drawn
+        return np.zeros((H, W, 3), dtype=np.uint8), np.zeros((H, W), dtype=np.float32)
+    t_remap = time.perf_counter()
+    record('hud.alpha', t_alpha, t_remap)
 
     # Apply parabolic curve if enabled (use cached remap maps)
     # Prepare for remap / curve
@@ -323,17 +488,20 @@ def render_unified_hud(frame, data, data_handler, t):
             warped = hud_rgba
     else:
         warped = hud_rgba
+    t_split = time.perf_counter()
+    record('hud.remap', t_remap, t_split)
 
     # Split back (still scaled)
     warped_bgr_small = warped[:, :, :3]
     warped_alpha_small = warped[:, :, 3].astype(np.float32) / 255.0
 
     # Upscale to original frame resolution if we rendered at lower res
-    if hud_scale < 1.0:
+    if (render_W, render_H) != (W, H):
         warped_bgr = cv2.resize(warped_bgr_small, (W, H), interpolation=cv2.INTER_LINEAR)
         warped_alpha = cv2.resize(warped_alpha_small, (W, H), interpolation=cv2.INTER_LINEAR)
     else:
         warped_bgr = warped_bgr_small
         warped_alpha = warped_alpha_small
+    record('hud.resize', t_split, time.perf_counter())
 
     return warped_bgr, warped_alpha
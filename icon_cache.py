@@ -0,0 +1,152 @@
+# ================================================================
+#  DEĞERE BAĞLI İKON SPRITE ÖNBELLEĞİ (icon_cache.py)
+#  ================================================================
+#  Hız, eğim ve güç ikonları gösterilen değere, kalp ikonu animasyon
+#  fazına göre her HUD güncellemesinde yeniden çiziliyordu:
+#
+#  - Her ikon bir kez küçük bir sprite'a çizilir (önçarpımlı BGR +
+#    ters alfa), sonra cv2 multiply/add ile yerinde blit edilir
+#  - Anahtar: (ikon, boyut, renk, kovalanmış değer / şekil)
+#      hız  → ibre, ICON_CACHE_CONFIG['speed_step'] km/h kovalarında
+#      eğim → düz / tırmanış / iniş şekli (tam)
+#      güç  → şimşek boyutu ve parıltı (tam)
+#      kalp → animasyonun tamsayı boyutu (tam)
+#  - Sınırlı LRU; isabet / ıskala sayıları progress 'icon' önbelleği
+#  - utils.draw_*_icon ile aynı imzalar: doğrudan yerine geçer
+#  ================================================================
+
+import math
+import threading
+from collections import OrderedDict
+
+from config import ICON_CACHE_CONFIG
+from utils import (
+    draw_speed_icon, draw_gradient_icon, draw_power_icon, draw_heart_icon,
+    render_icon_sprite, blit_icon_sprite
+)
+from progress import progress_cache
+
+
+class IconSpriteCache:
+    """Bounded LRU of rendered sprites, shared by the widget threads."""
+
+    def __init__(self, max_entries=512, name='icon'):
+        self.max_entries = max(1, int(max_entries))
+        self.name = name
+        self._sprites = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, build):
+        """Sprite for `key`, rendered with build() on a miss."""
+        with self._lock:
+            sprite = self._sprites.get(key)
+            if sprite is not None:
+                self._sprites.move_to_end(key)
+        progress_cache(self.name, sprite is not None)
+        if sprite is None:
+            sprite = build()
+            with self._lock:
+                self._sprites[key] = sprite
+                while len(self._sprites) > self.max_entries:
+                    self._sprites.popitem(last=False)
+        return sprite
+
+    def clear(self):
+        with self._lock:
+            self._sprites.clear()
+
+    def __len__(self):
+        return len(self._sprites)
+
+
+_cache = IconSpriteCache(ICON_CACHE_CONFIG.get('max_entries', 512))
+
+
+def _number(val, *suffixes):
+    # Same parsing as the utils icons: numbers or strings with a unit suffix
+    if val is None:
+        return 0.0
+    if isinstance(val, (int, float)):
+        return float(val)
+    text = str(val).strip()
+    for suffix in suffixes:
+        text = text.replace(suffix, '')
+    return float(text)
+
+
+def _blit(img, cx, cy, key, draw, size, color, *args):
+    sprite = _cache.get(key, lambda: render_icon_sprite(draw, size, color, *args))
+    blit_icon_sprite(img, sprite, cx, cy)
+
+
+def _color_key(color):
+    return tuple(int(c) for c in color)
+
+
+# ================================================================
+#  ÖNBELLEKLİ İKONLAR
+#  ================================================================
+
+def cached_speed_icon(img, cx, cy, size, color, val=None):
+    """draw_speed_icon with the needle bucketed to ICON_CACHE_CONFIG['speed_step'] km/h."""
+    if not ICON_CACHE_CONFIG.get('enabled', True):
+        return draw_speed_icon(img, cx, cy, size, color, val)
+    try:
+        sp = max(0.0, min(70.0, _number(val, 'km/h', 'kmh', 'km')))
+    except (TypeError, ValueError):
+        sp = 0.0
+    step = float(ICON_CACHE_CONFIG.get('speed_step', 0.5) or 0)
+    if step > 0:
+        sp = min(70.0, round(sp / step) * step)
+        needle = sp
+    else:
+        # Exact: only the needle end pixel changes with the speed
+        angle = math.radians(225.0 + 90.0 * (sp / 70.0))
+        needle = (math.floor(math.cos(angle) * (size - 4)), math.floor(math.sin(angle) * (size - 4)))
+    key = ('speed', size, _color_key(color), needle)
+    _blit(img, cx, cy, key, draw_speed_icon, size, color, sp)
+
+
+def cached_gradient_icon(img, cx, cy, size, color, val=None):
+    """draw_gradient_icon; only the flat / climb / descent shape is keyed."""
+    if not ICON_CACHE_CONFIG.get('enabled', True):
+        return draw_gradient_icon(img, cx, cy, size, color, val)
+    try:
+        grade = _number(val, '%')
+    except (TypeError, ValueError):
+        grade = 0.0
+    # Same branches as draw_gradient_icon (exactly 1.0 draws the descent)
+    if abs(grade) < 1.0:
+        shape, grade = 'flat', 0.0
+    elif grade > 1.0:
+        shape, grade = 'climb', 2.0
+    else:
+        shape, grade = 'descent', -2.0
+    key = ('gradient', size, _color_key(color), shape)
+    _blit(img, cx, cy, key, draw_gradient_icon, size, color, grade)
+
+
+def cached_power_icon(img, cx, cy, size, color, val=None):
+    """draw_power_icon; keyed by the drawn bolt size and glow, so it is exact."""
+    if not ICON_CACHE_CONFIG.get('enabled', True):
+        return draw_power_icon(img, cx, cy, size, color, val)
+    try:
+        power = _number(val, 'W', 'w')
+    except (TypeError, ValueError):
+        power = 0.0
+    scaled_s = int(size * (1.0 + min(0.3, power / 1000)))
+    key = ('power', size, _color_key(color), scaled_s, power > 200)
+    _blit(img, cx, cy, key, draw_power_icon, size, color, power)
+
+
+def cached_heart_icon(img, cx, cy, size, color, filled=True):
+    """draw_heart_icon; the beating animation only steps through a few sizes."""
+    if not ICON_CACHE_CONFIG.get('enabled', True):
+        return draw_heart_icon(img, cx, cy, size, color, filled)
+    key = ('heart', size, _color_key(color), bool(filled))
+    _blit(img, cx, cy, key, draw_heart_icon, size, color, filled)
+
+
+def clear_icon_cache():
+    """Drop every cached sprite."""
+    _cache.clear()
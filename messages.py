@@ -45,16 +45,17 @@ MESSAGES = {
     
     # Output
     'output_saving': "💾 Saving output video...",
-    'output_saved': "✅ Output video saved:",
+    'output_saved': "✅ Output video saved: {}",
     'output_location': "📁 Location:",
-    'output_size': "📏 File size:",
+    'output_size': "📏 File size: {}",
     'output_duration': "⏱️  Duration:",
     
     # Performance
-    'performance_fps': "🎯 Processing speed:",
-    'performance_time': "⏱️  Total time:",
-    'performance_frames': "🎬 Total frames:",
+    'performance_fps': "🎯 Processing speed: {}",
+    'performance_time': "⏱️  Total time: {}",
+    'performance_frames': "🎬 Total frames: {}",
     'memory_usage': "🧠 Memory usage:",
+    'profile_title': "🔬 Stage timings:",
     
     # Errors and warnings
     'error_gpx_not_found': "❌ GPX file not found:",
@@ -80,7 +81,7 @@ MESSAGES = {
     # Completion
     'render_success': "🎉 Render completed successfully!",
     'render_failed': "💥 Render failed",
-    'ready_to_play': "▶️  Ready to play:",
+    'ready_to_play': "▶️  Ready to play: {}",
     'tips_title': "💡 Tips:",
     'tip_demo_mode': "• Use demo mode for quick testing",
     'tip_theme_change': "• Change themes in config.py",
@@ -95,7 +96,7 @@ def get_message(key, *args):
     if args:
         try:
             return message.format(*args)
-        except:
+        except (IndexError, KeyError, ValueError):
             return f"{message} {' '.join(str(arg) for arg in args)}"
     return message
 
@@ -176,6 +177,15 @@ def format_memory(bytes_mem):
     """Format memory usage"""
     return format_file_size(bytes_mem)
 
+def print_profile_table(rows):
+    """Print profiler.Profiler.summary() rows as a stage timing table"""
+    if not rows:
+        return
+    print(f"\n{get_message('profile_title')}")
+    print(f"   {'stage':<28} {'calls':>7} {'total s':>9} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}")
+    for name, calls, total, p50, p95, peak in rows:
+        print(f"   {name:<28} {calls:>7} {total:>9.2f} {p50:>9.2f} {p95:>9.2f} {peak:>9.2f}")
+
 # ==================== RENDER STATUS REPORTER ====================
 
 class RenderStatus:
@@ -200,8 +210,8 @@ class RenderStatus:
         self.current_frame = frame_num
         print_progress(frame_num, self.total_frames)
         
-    def finish_render(self, output_path):
-        """Finish render and show stats"""
+    def finish_render(self, output_path, profile=None):
+        """Finish render and show stats (and the stage table of a profiler.Profiler)"""
         import time
         import os
         
@@ -220,6 +230,8 @@ class RenderStatus:
         print_info('performance_time', format_duration(total_time))
         print_info('performance_fps', format_fps(avg_fps))
         print_info('performance_frames', self.current_frame)
+        if profile is not None:
+            print_profile_table(profile.summary())
         
         print_section('render_success')
         print_info('ready_to_play', output_path)
@@ -0,0 +1,224 @@
+# ================================================================
+#  PROMETHEUS METRİK MODÜLÜ (metrics.py)
+#  ================================================================
+#  Render çiftliğinde çok sayıda eşzamanlı iş için pano ve alarm:
+#
+#  - Prometheus metin formatı: yerel bir HTTP uç noktası (/metrics)
+#    ve/veya node_exporter textfile collector için .prom dosyası
+#  - Sayaçlar ve histogramlar: render edilen frame'ler, aşama
+#    süreleri (profiler histogramları), önbellek isabet / ıskala
+#    sayıları, kuyruk derinlikleri, bellek
+#  - Her seride job / ride / theme etiketleri
+#  - Sayaçlar progress.RenderState ve profiler'dan okunur; render
+#    döngüsüne ek bir kanca eklenmez
+#  ================================================================
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from config import METRICS_CONFIG, GPX_DOSYASI, SELECTED_THEME
+from profiler import HISTOGRAM_BUCKETS, active_profiler, start_profiling, stop_profiling
+from progress import render_state, rss_mb
+
+
+_PREFIX = 'velometrics'
+
+# Values of the render_status state set (finish_metrics statuses)
+RENDER_STATUSES = ('running', 'done', 'error', 'canceled')
+
+# Active MetricsExporter (None = metrics off)
+_exporter = None
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _labels(base, **extra):
+    pairs = list(base.items()) + list(extra.items())
+    return '{' + ','.join(f'{k}="{_escape(v)}"' for k, v in pairs) + '}'
+
+
+def _number(value):
+    if value is None:
+        return 'NaN'
+    if isinstance(value, float):
+        return repr(value)
+    return str(value)
+
+
+class MetricsExporter:
+    """
+    Render the shared RenderState and profiler histograms in the Prometheus
+    text exposition format, serve them over HTTP and/or write a textfile.
+    """
+
+    def __init__(self, labels, state, profiler, owns_profiler=False):
+        self.labels = labels
+        self.state = state
+        self.profiler = profiler
+        self.owns_profiler = owns_profiler
+        self.status = 'running'
+        self.server = None
+        self.textfile = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def render(self):
+        """Current metrics as Prometheus text."""
+        lb = self.labels
+        lines = []
+
+        def family(name, kind, help_text):
+            lines.append(f"# HELP {_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {_PREFIX}_{name} {kind}")
+
+        state = self.state
+        family('frames_rendered_total', 'counter', 'Frames written to the output.')
+        lines.append(f"{_PREFIX}_frames_rendered_total{_labels(lb)} {state.frames_done}")
+        family('frames_planned', 'gauge', 'Frames this render will write.')
+        lines.append(f"{_PREFIX}_frames_planned{_labels(lb)} {_number(state.total_frames)}")
+        family('render_start_time_seconds', 'gauge', 'Unix time the render started.')
+        lines.append(f"{_PREFIX}_render_start_time_seconds{_labels(lb)} {state.started:.3f}")
+        family('render_running', 'gauge', '1 while the render runs, 0 once it has finished.')
+        lines.append(f"{_PREFIX}_render_running{_labels(lb)} {1 if self.status == 'running' else 0}")
+        # State set: every status is always exported, so no series goes stale on a change
+        family('render_status', 'gauge', 'Render status: 1 for the current one, 0 for the others.')
+        for status in RENDER_STATUSES:
+            lines.append(f"{_PREFIX}_render_status{_labels(lb, status=status)} "
+                         f"{1 if self.status == status else 0}")
+
+        family('stage_seconds', 'histogram', 'Per-stage latency (decode, get_data, HUD passes, widgets, ...).')
+        for stage, (counts, count, total) in sorted(self.profiler.histograms.items()):
+            cumulative = 0
+            for bound, n in zip(HISTOGRAM_BUCKETS, counts):
+                cumulative += n
+                lines.append(f"{_PREFIX}_stage_seconds_bucket{_labels(lb, stage=stage, le=repr(bound))} {cumulative}")
+            lines.append(f"{_PREFIX}_stage_seconds_bucket{_labels(lb, stage=stage, le='+Inf')} {count}")
+            lines.append(f"{_PREFIX}_stage_seconds_sum{_labels(lb, stage=stage)} {total:.6f}")
+            lines.append(f"{_PREFIX}_stage_seconds_count{_labels(lb, stage=stage)} {count}")
+
+        caches = sorted(state.caches.items())
+        family('cache_hits_total', 'counter', 'Cache lookups that hit.')
+        for name, (hits, _) in caches:
+            lines.append(f"{_PREFIX}_cache_hits_total{_labels(lb, cache=name)} {hits}")
+        family('cache_misses_total', 'counter', 'Cache lookups that missed.')
+        for name, (_, misses) in caches:
+            lines.append(f"{_PREFIX}_cache_misses_total{_labels(lb, cache=name)} {misses}")
+
+        family('queue_depth', 'gauge', 'Items waiting in a render queue (pipeline/shm stages).')
+        for name, depth in sorted(dict(state.queues).items()):
+            lines.append(f"{_PREFIX}_queue_depth{_labels(lb, queue=name)} {_number(depth)}")
+
+        mem = rss_mb()
+        family('resident_memory_bytes', 'gauge', 'Resident memory of the render process.')
+        lines.append(f"{_PREFIX}_resident_memory_bytes{_labels(lb)} "
+                     f"{_number(int(mem * 1024 ** 2) if mem is not None else None)}")
+        return '\n'.join(lines) + '\n'
+
+    # ---------- çıkışlar ----------
+
+    def serve(self, host, port):
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] not in ('/metrics', '/'):
+                    self.send_error(404)
+                    return
+                body = exporter.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, fmt, *args):
+                pass
+
+        self.server = ThreadingHTTPServer((host, int(port)), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, name='vpro-metrics-http', daemon=True).start()
+
+    def write_textfile(self):
+        # Atomic replace: the collector never reads a half-written file
+        tmp = f"{self.textfile}.{os.getpid()}.tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(self.render())
+        os.replace(tmp, self.textfile)
+
+    def start_textfile(self, path, interval):
+        self.textfile = path
+        self.write_textfile()
+
+        def run():
+            while not self._stop.wait(interval):
+                try:
+                    self.write_textfile()
+                except OSError:
+                    pass
+
+        self._thread = threading.Thread(target=run, name='vpro-metrics-file', daemon=True)
+        self._thread.start()
+
+    def close(self, status):
+        self.status = status
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+        if self.textfile:
+            self.write_textfile()
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+        if self.owns_profiler:
+            stop_profiling()
+
+
+# ================================================================
+#  GLOBAL API
+#  ================================================================
+
+def metric_labels(output_file):
+    """job / ride / theme labels (METRICS_CONFIG overrides the file-name defaults)."""
+    return {
+        'job': METRICS_CONFIG.get('job') or os.path.splitext(os.path.basename(output_file))[0],
+        'ride': METRICS_CONFIG.get('ride') or os.path.splitext(os.path.basename(GPX_DOSYASI))[0],
+        'theme': SELECTED_THEME,
+    }
+
+
+def start_metrics(output_file):
+    """Start the endpoint / textfile from METRICS_CONFIG; None if both are off."""
+    global _exporter
+    port, textfile = METRICS_CONFIG.get('port'), METRICS_CONFIG.get('textfile')
+    if port is None and not textfile:
+        return None
+    profiler = active_profiler()
+    owns = profiler is None
+    if owns:
+        # Histograms only: constant memory however long the render runs
+        profiler = start_profiling(keep_samples=False)
+    _exporter = MetricsExporter(metric_labels(output_file), render_state(), profiler, owns)
+    if port is not None:
+        _exporter.serve(METRICS_CONFIG.get('host', '127.0.0.1'), port)
+        print(f"\n📡 Metrics: http://{METRICS_CONFIG.get('host', '127.0.0.1')}:{port}/metrics")
+    if textfile:
+        _exporter.start_textfile(textfile, max(1.0, float(METRICS_CONFIG.get('interval_seconds', 10))))
+        print(f"\n📡 Metrics file: {textfile}")
+    return _exporter
+
+
+def finish_metrics(status='done'):
+    """Write the final values and stop serving (no-op if metrics are off)."""
+    global _exporter
+    exporter, _exporter = _exporter, None
+    if exporter is not None:
+        linger = float(METRICS_CONFIG.get('linger_seconds', 0) or 0)
+        exporter.status = status
+        if exporter.server is not None and linger > 0:
+            # Let the scraper collect the final values before the process exits
+            time.sleep(linger)
+        exporter.close(status)
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# ================================================================
+#  ZAMAN OFSETİ TAHMİNİ (offset_estimator.py)
+#  ================================================================
+#  ZAMAN_OFFSET_SANIYE'yi deneme-yanılma yerine otomatik bulur:
+#
+#  - Video çok küçük boyutta ve seyrek (saniyede birkaç frame)
+#    çözülür; ardışık frame farkından bir "hareket enerjisi"
+#    sinyali çıkarılır
+#  - GPX hız serisi aynı sıklıkta örneklenir
+#  - İki sinyal FFT ile çapraz korele edilir (her kaydırma için
+#    örtüşen kısımda Pearson korelasyonu); kaydırmalar örtüşme
+#    uzunluğunu da hesaba katan Fisher z ile sıralanır
+#  - En iyi ofset saniye hassasiyetinde ve bir güven değeriyle
+#    raporlanır
+#
+#  Kullanım:  python offset_estimator.py
+#  ================================================================
+
+import math
+
+import numpy as np
+
+from config import GPX_DOSYASI, VIDEO_DOSYASI, ZAMAN_OFFSET_SANIYE, OFFSET_ESTIMATE_CONFIG
+from ffmpeg_utils import FrameReader
+
+
+# Correlation peaks closer than this to the best one are the same peak
+_PEAK_EXCLUSION_SECONDS = 10.0
+
+
+# ================================================================
+#  SİNYALLER
+#  ================================================================
+
+def motion_energy(video_path, size, sample_hz, width):
+    """
+    Mean absolute difference between consecutive grayscale thumbnails,
+    sampled `sample_hz` times per second. Sample i covers video time
+    (i + 0.5) / sample_hz, between the two thumbnails it compares.
+    """
+    W, H = int(size[0]), int(size[1])
+    w = max(8, int(width))
+    h = max(2, int(round(w * H / float(W) / 2)) * 2)
+    energy = []
+    prev = None
+    # Decimate and shrink inside ffmpeg: only tiny frames reach Python
+    with FrameReader(video_path, (w, h), video_filter=f"fps={sample_hz:g},scale={w}:{h}:flags=area") as reader:
+        while True:
+            frame = reader.read()
+            if frame is None:
+                break
+            gray = frame.astype(np.float32).mean(axis=2)
+            if prev is not None:
+                energy.append(float(np.abs(gray - prev).mean()))
+            prev = gray
+    return np.asarray(energy, dtype=np.float64)
+
+
+def gpx_speed_series(data_handler, sample_hz):
+    """GPX speed (km/h) from the track start, one sample per 1/sample_hz seconds."""
+    last = data_handler.points[-1]['t'] - data_handler.gpx_start
+    times = np.arange(int(last.total_seconds() * sample_hz)) / sample_hz
+    return data_handler.get_data_batch(times, offset=0.0)['speed']
+
+
+# ================================================================
+#  ÇAPRAZ KORELASYON
+#  ================================================================
+
+def _xcorr(a, b, n_fft):
+    """sum_t a[t] * b[t + lag] for every lag (index lag mod n_fft), via FFT."""
+    return np.fft.irfft(np.conj(np.fft.rfft(a, n_fft)) * np.fft.rfft(b, n_fft), n_fft)
+
+
+def correlate_offsets(video_sig, gpx_sig, min_overlap):
+    """
+    Pearson correlation between the video signal and the GPX signal shifted
+    by every lag (in samples; GPX sample = video sample + lag), computed only
+    over the part where the two overlap.
+
+    Returns (lags, r, overlap); lags with less than `min_overlap` samples
+    of overlap get NaN.
+    """
+    v = np.asarray(video_sig, dtype=np.float64)
+    g = np.asarray(gpx_sig, dtype=np.float64)
+    nv, ng = len(v), len(g)
+    n_fft = 1 << int(math.ceil(math.log2(nv + ng)))
+    # Center both so the running sums stay well-conditioned
+    v = v - v.mean()
+    g = g - g.mean()
+    ones_v, ones_g = np.ones(nv), np.ones(ng)
+
+    n = _xcorr(ones_v, ones_g, n_fft)
+    sv = _xcorr(v, ones_g, n_fft)
+    sg = _xcorr(ones_v, g, n_fft)
+    svv = _xcorr(v * v, ones_g, n_fft)
+    sgg = _xcorr(ones_v, g * g, n_fft)
+    svg = _xcorr(v, g, n_fft)
+
+    lags = np.arange(-(nv - 1), ng)
+    k = lags % n_fft
+    n, sv, sg, svv, sgg, svg = (np.round(n[k]), sv[k], sg[k], svv[k], sgg[k], svg[k])
+    with np.errstate(all='ignore'):
+        cov = svg - sv * sg / n
+        var_v = svv - sv * sv / n
+        var_g = sgg - sg * sg / n
+        r = cov / np.sqrt(var_v * var_g)
+    r[(n < max(4, min_overlap)) | ~np.isfinite(r)] = np.nan
+    return lags, r, n
+
+
+def significance(r, overlap):
+    """
+    Fisher z-score of each correlation. A short overlap at the ends of the
+    track can correlate by chance; this ranks lags by how unlikely their
+    correlation is, not by its raw size.
+    """
+    with np.errstate(all='ignore'):
+        return np.arctanh(np.clip(r, -0.999999, 0.999999)) * np.sqrt(np.maximum(overlap - 3, 0))
+
+
+def estimate_offset(video_path, size, data_handler, search_center=None):
+    """
+    Estimate ZAMAN_OFFSET_SANIYE for a video/GPX pair.
+
+    Returns a dict with 'offset' (seconds), 'r' (correlation at the best
+    offset), 'runner_up' (offset of the best other peak) and 'confidence'
+    (1 - significance of that peak / significance of the best one: near 0
+    means ambiguous, 1 means unique).
+    """
+    cfg = OFFSET_ESTIMATE_CONFIG
+    hz = float(cfg.get('sample_hz', 2.0))
+    video_sig = motion_energy(video_path, size, hz, cfg.get('width', 64))
+    gpx_sig = gpx_speed_series(data_handler, hz)
+    if len(video_sig) < 2 or len(gpx_sig) < 2:
+        raise RuntimeError("video or GPX too short to estimate an offset")
+
+    min_overlap = min(len(video_sig), float(cfg.get('min_overlap_seconds', 60)) * hz)
+    lags, r, overlap = correlate_offsets(video_sig, gpx_sig, min_overlap)
+    z = significance(r, overlap)
+    # Video sample i sits at (i + 0.5) / hz, GPX sample j at j / hz
+    offsets = (lags - 0.5) / hz
+
+    search = cfg.get('search_seconds')
+    if search is not None:
+        center = ZAMAN_OFFSET_SANIYE if search_center is None else search_center
+        z[np.abs(offsets - center) > float(search)] = np.nan
+    if np.all(np.isnan(z)):
+        raise RuntimeError("no offset in the search window overlaps the GPX track enough")
+
+    best = int(np.nanargmax(z))
+    offset = offsets[best]
+    # Parabolic refinement between neighbouring lags (sub-sample offset)
+    if 0 < best < len(r) - 1 and np.isfinite(r[best - 1]) and np.isfinite(r[best + 1]):
+        denom = r[best - 1] - 2 * r[best] + r[best + 1]
+        if denom < 0:
+            offset += 0.5 * (r[best - 1] - r[best + 1]) / denom / hz
+
+    others = np.where(np.abs(offsets - offsets[best]) > _PEAK_EXCLUSION_SECONDS, z, np.nan)
+    runner_up, confidence = None, 1.0
+    if not np.all(np.isnan(others)) and z[best] > 0:
+        second = int(np.nanargmax(others))
+        runner_up = float(offsets[second])
+        confidence = float(np.clip(1.0 - max(0.0, z[second]) / z[best], 0.0, 1.0))
+    return {
+        'offset': float(offset),
+        'r': float(r[best]),
+        'runner_up': runner_up,
+        'confidence': confidence,
+    }
+
+
+# ================================================================
+#  MAIN
+#  ================================================================
+
+if __name__ == "__main__":
+    from moviepy import VideoFileClip
+    from data_handler import DataHandler
+
+    print(f"\n📹 Video: {VIDEO_DOSYASI}")
+    clip = VideoFileClip(VIDEO_DOSYASI, audio=False)
+    size = (int(clip.size[0]), int(clip.size[1]))
+    clip.close()
+    print(f"📍 GPX: {GPX_DOSYASI}")
+    data_handler = DataHandler(GPX_DOSYASI)
+
+    print("\n🔎 Correlating video motion with GPX speed...")
+    result = estimate_offset(VIDEO_DOSYASI, size, data_handler)
+
+    print(f"\n✅ Estimated offset: {result['offset']:.1f} s")
+    print(f"   • Correlation: {result['r']:.2f}")
+    if result['runner_up'] is not None:
+        print(f"   • Next best peak: {result['runner_up']:.1f} s")
+    print(f"   • Confidence: {result['confidence']:.2f}"
+          f"{'  ⚠️ ambiguous, check with a demo render' if result['confidence'] < 0.1 else ''}")
+    print(f"   • Current ZAMAN_OFFSET_SANIYE: {ZAMAN_OFFSET_SANIYE}")
+    print(f"\n   ZAMAN_OFFSET_SANIYE = {int(round(result['offset']))}")
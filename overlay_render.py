@@ -0,0 +1,182 @@
+# ================================================================
+#  ŞEFFAF HUD KATMANI DIŞA AKTARIM MODÜLÜ (overlay_render.py)
+#  ================================================================
+#  Kurgu programları (Resolve/Premiere) için HUD ayrı, alfa kanallı
+#  bir katman olarak yazılır:
+#
+#  - Kaynak video hiç çözülmez; HUD boş bir tuvale çizilir
+#  - HUD sadece hud_update_rate anlarında çizilir; değişmeyen
+#    frame'ler tekrar gönderilmez (tekrarları ffmpeg doldurur)
+#  - Çıkış kaynak FPS'inde: ProRes 4444 / QTRLE / PNG (.mov) ya da
+#    PNG dizisi + ffconcat zamanlama dosyası
+#  ================================================================
+
+import os
+import shutil
+
+import cv2
+import numpy as np
+from tqdm import tqdm
+
+from config import OVERLAY_CONFIG, HUD_CONFIG
+from ffmpeg_utils import FrameWriter
+from utils import clear_gradient_cache
+from video_renderer import resolve_render_window, new_hud_cache, get_hud_layer
+from data_handler import telemetry_row
+from progress import progress_update
+
+
+# Alpha-capable encoders: format → (codec, output pix_fmt, extra args, extension)
+OVERLAY_FORMATS = {
+    'prores4444': ('prores_ks', 'yuva444p10le', ['-profile:v', '4444', '-vendor', 'apl0'], '.mov'),
+    'qtrle': ('qtrle', 'argb', None, '.mov'),
+    'png': ('png', 'rgba', None, '.mov'),
+    'sequence': (None, None, None, ''),
+}
+
+
+def overlay_output_path(output_file, fmt):
+    base, _ = os.path.splitext(output_file)
+    return f"{base}{OVERLAY_CONFIG.get('suffix', '_overlay')}{OVERLAY_FORMATS[fmt][3]}"
+
+
+def hud_bgra(hud_bgr, hud_alpha):
+    """Straight (non-premultiplied) BGRA layer from a HUD color + float alpha pair."""
+    alpha = np.clip(hud_alpha * 255.0 + 0.5, 0, 255).astype(np.uint8)
+    return np.dstack((hud_bgr, alpha))
+
+
+def distinct_hud_layers(size, times, telemetry, data_handler, stats):
+    """
+    Yield (n, bgra) for every frame index `n` whose HUD differs from the
+    previous one. The HUD is drawn only at update-rate ticks (on an empty
+    canvas) and a redraw identical to the last layer is not yielded.
+    `stats` receives the 'drawn' and 'written' counts.
+    """
+    canvas = np.zeros((size[1], size[0], 3), dtype=np.uint8)
+    hud_cache = new_hud_cache()
+    stats.update(drawn=0, written=0)
+    last = None
+    for n in tqdm(range(len(times)), unit='frame'):
+        drawn_t = hud_cache['t']
+        hud_bgr, hud_alpha = get_hud_layer(canvas, telemetry_row(telemetry, n), data_handler,
+                                           times[n], hud_cache)
+        # Between update-rate ticks the cached HUD is reused: nothing new to write
+        if hud_cache['t'] != drawn_t:
+            stats['drawn'] += 1
+            layer = hud_bgra(hud_bgr, hud_alpha)
+            if last is None or not np.array_equal(layer, last):
+                stats['written'] += 1
+                last = layer
+                yield n, layer
+        progress_update(n + 1, len(times))
+
+
+# ================================================================
+#  ÇIKIŞ YAZICILARI
+#  ================================================================
+
+class SequenceWriter:
+    """
+    PNG sequence with an ffconcat timing file: each distinct HUD is one
+    PNG, shown until the next one (`ffmpeg -f concat -i overlay.ffconcat`
+    or an NLE image-sequence import with the timing file).
+    """
+
+    def __init__(self, out_dir, fps, end_time):
+        if os.path.isdir(out_dir):
+            shutil.rmtree(out_dir)
+        os.makedirs(out_dir)
+        self.out_dir = out_dir
+        self.fps = fps
+        self.end_time = end_time
+        self.entries = []
+
+    def write(self, frame, pts):
+        name = f"hud_{len(self.entries):06d}.png"
+        if not cv2.imwrite(os.path.join(self.out_dir, name), frame):
+            raise RuntimeError(f"could not write {name} to {self.out_dir}")
+        self.entries.append((name, pts))
+
+    def close(self):
+        lines = ['ffconcat version 1.0']
+        for i, (name, pts) in enumerate(self.entries):
+            end = self.entries[i + 1][1] if i + 1 < len(self.entries) else self.end_time
+            lines += [f"file {name}", f"duration {end - pts:.6f}"]
+        if self.entries:
+            # concat demuxer needs the last file repeated to honour its duration
+            lines.append(f"file {self.entries[-1][0]}")
+        with open(os.path.join(self.out_dir, 'overlay.ffconcat'), 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        return False
+
+
+# ================================================================
+#  ANA OVERLAY RENDER
+#  ================================================================
+
+def render_video_overlay(clip, data_handler, output_file):
+    """
+    Export only the HUD as a transparent layer at the source fps.
+
+    Args:
+        clip: MoviePy VideoFileClip object (only size/fps are used)
+        data_handler: DataHandler object
+        output_file: Output video file (the overlay suffix is added)
+    """
+    if not HUD_CONFIG.get('unified_hud', True):
+        raise RuntimeError("overlay export needs HUD_CONFIG['unified_hud'] = True")
+    fmt = OVERLAY_CONFIG.get('format', 'prores4444')
+    if fmt not in OVERLAY_FORMATS:
+        raise ValueError(f"unknown overlay format '{fmt}' (choose from {', '.join(OVERLAY_FORMATS)})")
+
+    W, H = int(clip.size[0]), int(clip.size[1])
+    start_offset, duration = resolve_render_window(clip)
+    fps = clip.fps
+    clip.close()
+    total_frames = int(duration * fps)
+    output_path = overlay_output_path(output_file, fmt)
+    codec, pix_fmt_out, extra, _ = OVERLAY_FORMATS[fmt]
+
+    print(f"\n📝 Opening overlay output:")
+    print(f"   • {'Folder' if fmt == 'sequence' else 'File'}: {output_path}")
+    print(f"   • Resolution: {W}x{H}")
+    print(f"   • FPS: {fps} (HUD redrawn at {HUD_CONFIG.get('hud_update_rate') or fps} Hz)")
+    print(f"   • Format: {fmt}")
+
+    print("\n📈 Interpolating telemetry at frame times...")
+    times = [n / fps + start_offset for n in range(total_frames)]
+    telemetry = data_handler.get_data_batch(times)
+
+    print("\n▶️  Starting overlay render (source is not decoded)...\n")
+
+    if fmt == 'sequence':
+        writer = SequenceWriter(output_path, fps, total_frames / fps)
+    else:
+        writer = FrameWriter(output_path, (W, H), fps, codec=codec, preset=None, pix_fmt_in='bgra',
+                             pix_fmt_out=pix_fmt_out, extra_args=(extra or []) + ['-frames:v', str(total_frames)],
+                             timestamps=True, fill_cfr=True)
+    stats = {}
+    last = None
+    try:
+        with writer:
+            for n, layer in distinct_hud_layers((W, H), times, telemetry, data_handler, stats):
+                writer.write(layer, n / fps)
+                last = (n, layer)
+            if fmt != 'sequence' and last is not None and last[0] < total_frames - 1:
+                # Timestamp the final frame so ffmpeg fills up to the very end
+                writer.write(last[1], (total_frames - 1) / fps)
+    finally:
+        clear_gradient_cache()
+
+    print(f"\n✅ RENDER COMPLETE!")
+    print(f"   • {total_frames} frames, {stats['drawn']} HUD draws, {stats['written']} distinct frames written")
+    print(f"   • Duration: {total_frames / fps:.1f}s")
+    print(f"   • {'Folder' if fmt == 'sequence' else 'File'}: {output_path}")
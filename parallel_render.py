@@ -0,0 +1,244 @@
+# ================================================================
+#  PARALEL PARÇA RENDER MODÜLÜ (parallel_render.py)
+#  ================================================================
+#  Zaman çizelgesi keyframe hizalı parçalara bölünür, her parça
+#  ayrı bir işlemde (kendi decoder, DataHandler görünümü ve encoder'ı
+#  ile) render edilir ve sonuç ffmpeg concat demuxer ile yeniden
+#  kodlanmadan birleştirilir.
+#
+#  Her parça, seri render'ın o noktadaki durumuyla (güç smoothing
+#  penceresi, HUD önbelleği) başlar; çıktı seri yol ile aynıdır,
+#  sadece encoder GOP sınırları farklıdır.
+#  ================================================================
+
+import cv2
+import math
+import multiprocessing as mp
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+
+from moviepy import VideoFileClip, VideoClip
+from tqdm import tqdm
+
+from config import PARALLEL_CONFIG
+from ffmpeg_utils import probe_keyframe_times, concat_stream_copy
+from progress import progress_update
+from utils import clear_gradient_cache
+from video_renderer import (
+    resolve_render_window, get_encoder_settings, new_hud_cache,
+    compose_frame, prime_render_state, FrameSource
+)
+
+
+# ================================================================
+#  PARÇA PLANLAMA
+#  ================================================================
+
+def plan_chunks(total_frames, fps, start_offset, keyframe_times, workers, chunk_seconds):
+    """
+    Split [0, total_frames) into (first_frame, frame_count) chunks.
+
+    Chunks target `chunk_seconds` (shortened so every worker gets at least
+    one chunk) and each border is moved to the nearest source keyframe
+    within half a chunk, so every worker's decoder starts on a keyframe.
+    """
+    if total_frames <= 0:
+        return []
+
+    target = max(1, int(round(float(chunk_seconds) * fps)))
+    target = min(target, max(1, math.ceil(total_frames / max(1, workers))))
+
+    key_frames = sorted({
+        int(math.ceil((kt - start_offset) * fps - 1e-6))
+        for kt in keyframe_times
+    })
+    key_frames = [k for k in key_frames if 0 < k < total_frames]
+
+    borders = []
+    for ideal in range(target, total_frames, target):
+        border = ideal
+        if key_frames:
+            nearest = min(key_frames, key=lambda k: abs(k - ideal))
+            if abs(nearest - ideal) <= target // 2:
+                border = nearest
+        if (not borders or border > borders[-1]) and border < total_frames:
+            borders.append(border)
+
+    starts = [0] + borders
+    ends = borders + [total_frames]
+    return [(s, e - s) for s, e in zip(starts, ends) if e > s]
+
+
+# ================================================================
+#  PARÇA RENDER (İŞÇİ İŞLEMİ)
+#  ================================================================
+
+def render_chunk(video_path, data_handler, first_frame, frame_count, fps, start_offset,
+                 output_file, logger=None, fade_frames=0, on_frame=None):
+    """
+    Render frames [first_frame, first_frame + frame_count) of the timeline
+    into `output_file` with the same encoder settings as the serial path.
+
+    `data_handler` must be a fresh view (see DataHandler.fork); it is primed
+    to the serial render state at `first_frame` before the first frame.
+    `fade_frames` > 0 fades the chunk in from and out to black over that
+    many frames at each end. `on_frame()` is called after each new frame
+    (progress reporting).
+    """
+    clip = VideoFileClip(video_path, audio=False)
+    W, H = int(clip.size[0]), int(clip.size[1])
+
+    hud_cache = new_hud_cache()
+    prime_render_state(data_handler, hud_cache, first_frame, fps, start_offset, (H, W, 3))
+    # Decoder seeks straight to the chunk start instead of decoding up to it
+    source = FrameSource(clip, fps, start_offset, end_frame=first_frame + frame_count,
+                         cache_record=False)
+    last_frame = {'n': None, 'rgb': None}
+
+    def make_frame(t_local):
+        n = first_frame + int(round(t_local * fps))
+        if n == last_frame['n']:
+            return last_frame['rgb']
+        src_t = n / fps + start_offset
+        img_bgr = source.get(n)
+        data = data_handler.get_data(src_t)
+        composed = compose_frame(img_bgr, data, data_handler, src_t, hud_cache)
+        out_rgb = cv2.cvtColor(composed, cv2.COLOR_BGR2RGB)
+        if fade_frames:
+            edge = min(n - first_frame + 1, first_frame + frame_count - n)
+            if edge <= fade_frames:
+                out_rgb = cv2.convertScaleAbs(out_rgb, alpha=edge / (fade_frames + 1.0))
+        last_frame['n'] = n
+        last_frame['rgb'] = out_rgb
+        if on_frame is not None:
+            on_frame()
+        return out_rgb
+
+    ff_preset, ff_threads = get_encoder_settings()
+    # Half a frame of slack so MoviePy's int(duration * fps) yields frame_count
+    out_clip = VideoClip(make_frame, duration=(frame_count + 0.5) / fps)
+    try:
+        out_clip.write_videofile(output_file, codec='libx264', fps=fps, audio=False,
+                                 threads=ff_threads, preset=ff_preset, logger=logger)
+    finally:
+        try:
+            out_clip.close()
+        except Exception:
+            pass
+        source.close()
+        clip.close()
+        clear_gradient_cache()
+    return output_file
+
+
+_worker_data_handler = None
+_worker_frames_done = None
+
+
+def _init_worker(data_handler, frames_done):
+    # Parsed GPX is shipped once per worker process, not once per chunk
+    global _worker_data_handler, _worker_frames_done
+    _worker_data_handler = data_handler
+    _worker_frames_done = frames_done
+
+
+def _count_frame():
+    # Shared across the workers; the parent reads it for the progress bar / stream
+    with _worker_frames_done.get_lock():
+        _worker_frames_done.value += 1
+
+
+def _render_chunk_job(job):
+    render_chunk(job['video_path'], _worker_data_handler.fork(), job['first_frame'],
+                 job['frame_count'], job['fps'], job['start_offset'], job['output_file'],
+                 on_frame=_count_frame)
+    return job['index'], job['frame_count']
+
+
+# ================================================================
+#  ANA PARALEL RENDER
+#  ================================================================
+
+def render_video_parallel(clip, data_handler, output_file):
+    """
+    Render `clip` on several processes and join the chunks without
+    re-encoding.
+
+    Args:
+        clip: MoviePy VideoFileClip object (closed after planning)
+        data_handler: DataHandler object
+        output_file: Output video file
+    """
+    W, H = int(clip.size[0]), int(clip.size[1])
+    start_offset, duration = resolve_render_window(clip)
+    fps = clip.fps
+    video_path = clip.filename
+    clip.close()
+
+    total_frames = int(duration * fps)
+    workers = PARALLEL_CONFIG.get('workers') or os.cpu_count() or 1
+
+    keyframes = []
+    if PARALLEL_CONFIG.get('keyframe_align', True):
+        print("\n🔑 Reading keyframe positions...")
+        try:
+            keyframes = probe_keyframe_times(video_path)
+            print(f"   • {len(keyframes)} keyframes found")
+        except Exception as e:
+            print(f"   ⚠️ Keyframe probe failed ({e}); using even chunk borders")
+
+    chunks = plan_chunks(total_frames, fps, start_offset, keyframes, workers,
+                         PARALLEL_CONFIG.get('chunk_seconds', 60))
+
+    print(f"\n📝 Opening output video:")
+    print(f"   • File: {output_file}")
+    print(f"   • Resolution: {W}x{H}")
+    print(f"   • FPS: {fps}")
+    print(f"   • Codec: libx264 (MP4), {len(chunks)} chunks on {workers} processes")
+
+    print("\n▶️  Starting parallel render...\n")
+
+    out_dir = os.path.dirname(os.path.abspath(output_file)) or '.'
+    chunk_dir = tempfile.mkdtemp(prefix='.vpro_chunks_', dir=out_dir)
+    jobs = []
+    for i, (first, count) in enumerate(chunks):
+        jobs.append({
+            'index': i,
+            'video_path': video_path,
+            'first_frame': first,
+            'frame_count': count,
+            'fps': fps,
+            'start_offset': start_offset,
+            'output_file': os.path.join(chunk_dir, f"chunk_{i:05d}.mp4"),
+        })
+
+    frames_done = mp.Value('l', 0)
+    progress_update(0, total_frames)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(data_handler, frames_done)) as pool:
+            pending = {pool.submit(_render_chunk_job, job) for job in jobs}
+            with tqdm(total=total_frames, unit='frame') as bar:
+                while pending:
+                    finished, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                    for fut in finished:
+                        fut.result()
+                    done = frames_done.value
+                    bar.update(done - bar.n)
+                    progress_update(done, total_frames)
+
+        print("\n🔗 Joining chunks (stream copy)...")
+        concat_stream_copy([job['output_file'] for job in jobs], output_file)
+    finally:
+        if PARALLEL_CONFIG.get('keep_chunks', False):
+            print(f"   • Chunks kept in: {chunk_dir}")
+        else:
+            shutil.rmtree(chunk_dir, ignore_errors=True)
+        clear_gradient_cache()
+
+    print(f"\n✅ RENDER COMPLETE!")
+    print(f"   • {total_frames} frames processed")
+    print(f"   • Duration: {total_frames / fps:.1f}s")
+    print(f"   • File: {output_file}")
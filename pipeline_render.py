@@ -0,0 +1,344 @@
+# ================================================================
+#  PIPELINE RENDER MODÜLÜ (pipeline_render.py)
+#  ================================================================
+#  Tek işlem içinde aşamalı render:
+#
+#    decode thread ──► [decode kuyruğu] ──► HUD/birleştirme işçileri
+#        ──► [çıkış kuyruğu] ──► encoder besleme thread'i (sıralı)
+#
+#  - Kuyruklar sınırlıdır (back-pressure): yavaş aşama öncekileri bekletir
+#  - İşçiler HUD güncelleme gruplarını işler (bir HUD + onu kullanan frame'ler)
+#  - Encoder thread'i grupları sıraya göre yeniden dizer
+#  - OpenCV ve NumPy GIL'i bıraktığı için işçiler gerçekten paralel çalışır
+#  ================================================================
+
+import os
+import queue
+import threading
+import time
+
+from tqdm import tqdm
+
+from config import HUD_CONFIG, PIPELINE_CONFIG
+from ffmpeg_utils import FrameWriter
+from hud_layout import render_unified_hud
+from progress import progress_update
+from utils import clear_gradient_cache
+from video_renderer import (
+    resolve_render_window, get_encoder_settings, hud_update_interval, blend_hud, FrameSource
+)
+
+
+# ================================================================
+#  AŞAMA İSTATİSTİKLERİ
+#  ================================================================
+
+class StageStats:
+    """
+    Per-stage counters: items handled, busy time, time stalled waiting for
+    input (starved) or for room in the output queue (back-pressure), and the
+    depth of the stage's output queue sampled on every put.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.items = 0
+        self.busy_s = 0.0
+        self.wait_in_s = 0.0
+        self.wait_out_s = 0.0
+        self.depth_sum = 0
+        self.depth_samples = 0
+        self.depth_max = 0
+        self._lock = threading.Lock()
+
+    def add(self, items=0, busy=0.0, wait_in=0.0, wait_out=0.0):
+        with self._lock:
+            self.items += items
+            self.busy_s += busy
+            self.wait_in_s += wait_in
+            self.wait_out_s += wait_out
+
+    def sample_depth(self, depth):
+        with self._lock:
+            self.depth_sum += depth
+            self.depth_samples += 1
+            self.depth_max = max(self.depth_max, depth)
+
+    def snapshot(self):
+        with self._lock:
+            avg = self.depth_sum / self.depth_samples if self.depth_samples else 0.0
+            return {
+                'items': self.items,
+                'busy_s': self.busy_s,
+                'wait_in_s': self.wait_in_s,
+                'wait_out_s': self.wait_out_s,
+                'queue_depth_avg': avg,
+                'queue_depth_max': self.depth_max,
+            }
+
+
+class _Aborted(Exception):
+    pass
+
+
+_DONE = object()
+
+
+class RenderPipeline:
+    """
+    Decode → HUD/composite → encode pipeline connected by bounded queues.
+
+    Work travels in HUD groups: the frame that triggers a HUD redraw plus the
+    following frames that reuse it, so the HUD update-rate cache behaves
+    exactly like the serial path while groups are processed in parallel.
+    """
+
+    def __init__(self, clip, data_handler, writer, first_frame, frame_count, fps,
+                 start_offset, hud_workers, queue_size):
+        self.clip = clip
+        self.data_handler = data_handler
+        self.writer = writer
+        self.first_frame = first_frame
+        self.frame_count = frame_count
+        self.fps = fps
+        self.start_offset = start_offset
+        self.hud_workers = max(1, int(hud_workers))
+        self.decode_q = queue.Queue(maxsize=max(1, int(queue_size)))
+        self.encode_q = queue.Queue(maxsize=max(1, int(queue_size)))
+        self.stop = threading.Event()
+        self.errors = []
+        self.frames_done = 0
+        self.stats = {
+            'decode': StageStats('decode'),
+            'hud': StageStats('hud'),
+            'encode': StageStats('encode'),
+        }
+
+    # ---------- kuyruk yardımcıları ----------
+
+    def _put(self, q, item, stats):
+        t0 = time.perf_counter()
+        while True:
+            if self.stop.is_set():
+                raise _Aborted()
+            try:
+                q.put(item, timeout=0.1)
+                break
+            except queue.Full:
+                pass
+        stats.add(wait_out=time.perf_counter() - t0)
+        stats.sample_depth(q.qsize())
+
+    def _get(self, q, stats):
+        t0 = time.perf_counter()
+        while True:
+            if self.stop.is_set():
+                raise _Aborted()
+            try:
+                item = q.get(timeout=0.1)
+                break
+            except queue.Empty:
+                pass
+        stats.add(wait_in=time.perf_counter() - t0)
+        return item
+
+    def _guard(self, fn):
+        def run():
+            try:
+                fn()
+            except _Aborted:
+                pass
+            except BaseException as e:
+                self.errors.append(e)
+                self.stop.set()
+        return run
+
+    # ---------- aşamalar ----------
+
+    def _decode_stage(self):
+        stats = self.stats['decode']
+        interval = hud_update_interval()
+        hud_on = HUD_CONFIG.get('unified_hud', True)
+        group = None
+        group_idx = 0
+        last_t = None
+        source = FrameSource(self.clip, self.fps, self.start_offset,
+                             end_frame=self.first_frame + self.frame_count)
+
+        try:
+            for n in range(self.first_frame, self.first_frame + self.frame_count):
+                t0 = time.perf_counter()
+                src_t = n / self.fps + self.start_offset
+                frame_bgr = source.get(n)
+                # Telemetry stays in decode order: power smoothing depends on it
+                data = self.data_handler.get_data(src_t)
+
+                new_group = (not hud_on or interval is None or last_t is None
+                             or not ((src_t - last_t) < interval))
+                stats.add(items=1, busy=time.perf_counter() - t0)
+
+                if new_group:
+                    if group is not None:
+                        self._put(self.decode_q, group, stats)
+                        group_idx += 1
+                    last_t = src_t
+                    group = {'idx': group_idx, 'hud_t': src_t, 'hud_data': data, 'frames': []}
+                group['frames'].append(frame_bgr)
+        finally:
+            source.close()
+
+        if group is not None:
+            self._put(self.decode_q, group, stats)
+        for _ in range(self.hud_workers):
+            self._put(self.decode_q, _DONE, stats)
+
+    def _hud_stage(self):
+        stats = self.stats['hud']
+        hud_on = HUD_CONFIG.get('unified_hud', True)
+        while True:
+            group = self._get(self.decode_q, stats)
+            if group is _DONE:
+                self._put(self.encode_q, _DONE, stats)
+                return
+            t0 = time.perf_counter()
+            frames_bgr = group['frames']
+            if hud_on:
+                hud_bgr, hud_alpha = render_unified_hud(frames_bgr[0], group['hud_data'],
+                                                        self.data_handler, group['hud_t'])
+                frames_bgr = [blend_hud(f, hud_bgr, hud_alpha) for f in frames_bgr]
+            stats.add(items=len(frames_bgr), busy=time.perf_counter() - t0)
+            self._put(self.encode_q, (group['idx'], frames_bgr), stats)
+
+    def _encode_stage(self):
+        stats = self.stats['encode']
+        pending = {}
+        next_idx = 0
+        finished = 0
+        while finished < self.hud_workers:
+            item = self._get(self.encode_q, stats)
+            if item is _DONE:
+                finished += 1
+                continue
+            idx, frames = item
+            pending[idx] = frames
+            # In-order reassembly: groups can finish out of order
+            while next_idx in pending:
+                t0 = time.perf_counter()
+                out = pending.pop(next_idx)
+                for f in out:
+                    self.writer.write(f)
+                next_idx += 1
+                self.frames_done += len(out)
+                stats.add(items=len(out), busy=time.perf_counter() - t0)
+        if pending:
+            raise RuntimeError(f"pipeline lost {len(pending)} HUD groups")
+
+    # ---------- çalıştırma ----------
+
+    def run(self, progress=None):
+        """Run all stages; `progress(frames_done)` is polled from this thread."""
+        threads = [threading.Thread(target=self._guard(self._decode_stage), name='vpro-decode')]
+        threads += [threading.Thread(target=self._guard(self._hud_stage), name=f'vpro-hud-{i}')
+                    for i in range(self.hud_workers)]
+        threads.append(threading.Thread(target=self._guard(self._encode_stage), name='vpro-encode'))
+        for th in threads:
+            th.daemon = True
+            th.start()
+
+        try:
+            while any(th.is_alive() for th in threads):
+                threads[-1].join(timeout=0.2)
+                if progress is not None:
+                    progress(self.frames_done)
+                if self.stop.is_set():
+                    break
+        except KeyboardInterrupt:
+            self.stop.set()
+            raise
+        finally:
+            for th in threads:
+                th.join(timeout=5.0)
+
+        if self.errors:
+            raise self.errors[0]
+
+    def snapshot(self):
+        """Current per-stage stats plus live queue depths."""
+        snap = {name: st.snapshot() for name, st in self.stats.items()}
+        snap['decode']['queue_depth'] = self.decode_q.qsize()
+        snap['hud']['queue_depth'] = self.encode_q.qsize()
+        snap['frames_done'] = self.frames_done
+        return snap
+
+
+def print_pipeline_stats(snapshot):
+    """Print a small per-stage table (busy / starved / blocked seconds)."""
+    print("\n📊 Pipeline stages:")
+    print(f"   {'stage':<8} {'items':>7} {'busy s':>8} {'starved s':>10} {'blocked s':>10} {'q avg':>6} {'q max':>6}")
+    for name in ('decode', 'hud', 'encode'):
+        st = snapshot[name]
+        print(f"   {name:<8} {st['items']:>7} {st['busy_s']:>8.1f} {st['wait_in_s']:>10.1f} "
+              f"{st['wait_out_s']:>10.1f} {st['queue_depth_avg']:>6.1f} {st['queue_depth_max']:>6}")
+
+
+# ================================================================
+#  ANA PIPELINE RENDER
+#  ================================================================
+
+def render_video_pipelined(clip, data_handler, output_file):
+    """
+    Render video through the staged pipeline and write to output file.
+
+    Args:
+        clip: MoviePy VideoFileClip object
+        data_handler: DataHandler object
+        output_file: Output video file
+
+    Returns:
+        dict: Final per-stage statistics (see RenderPipeline.snapshot)
+    """
+    W, H = int(clip.size[0]), int(clip.size[1])
+    start_offset, duration = resolve_render_window(clip)
+    fps = clip.fps
+    total_frames = int(duration * fps)
+
+    hud_workers = PIPELINE_CONFIG.get('hud_workers') or max(1, min(4, (os.cpu_count() or 2) - 2))
+    queue_size = PIPELINE_CONFIG.get('queue_size', 8)
+
+    print(f"\n📝 Opening output video:")
+    print(f"   • File: {output_file}")
+    print(f"   • Resolution: {W}x{H}")
+    print(f"   • FPS: {fps}")
+    print(f"   • Codec: libx264 (MP4), {hud_workers} HUD workers, queue size {queue_size}")
+
+    print("\n▶️  Starting pipelined render...\n")
+
+    ff_preset, ff_threads = get_encoder_settings()
+    snapshot = None
+    try:
+        with FrameWriter(output_file, (W, H), fps, preset=ff_preset, threads=ff_threads) as writer:
+            pipe = RenderPipeline(clip, data_handler, writer, 0, total_frames, fps, start_offset,
+                                  hud_workers, queue_size)
+            with tqdm(total=total_frames, unit='frame') as bar:
+                def progress(done):
+                    bar.update(done - bar.n)
+                    progress_update(done, total_frames, {'decode': pipe.decode_q.qsize(),
+                                                         'encode': pipe.encode_q.qsize()})
+                pipe.run(progress)
+                progress(pipe.frames_done)
+            snapshot = pipe.snapshot()
+    finally:
+        try:
+            clip.close()
+        except Exception:
+            pass
+        clear_gradient_cache()
+
+    if PIPELINE_CONFIG.get('show_stats', True):
+        print_pipeline_stats(snapshot)
+
+    print(f"\n✅ RENDER COMPLETE!")
+    print(f"   • {total_frames} frames processed")
+    print(f"   • Duration: {total_frames / fps:.1f}s")
+    print(f"   • File: {output_file}")
+    return snapshot
@@ -0,0 +1,180 @@
+# ================================================================
+#  PROFİL ÇIKARMA MODÜLÜ (profiler.py)
+#  ================================================================
+#  Render 3 fps'de çalışırken suçluyu bulmak için:
+#
+#  - Her aşama (decode, get_data, HUD, alfa, remap, resize,
+#    birleştirme, encode) ve her widget çizimi için zamanlayıcı
+#  - Kapalıyken maliyet neredeyse sıfır: span() tek bir global
+#    kontrolden sonra paylaşılan boş bir context manager döndürür
+#  - Aşama başına p50 / p95 / max tablosu (RenderStatus.finish_render)
+#  - İsteğe bağlı Chrome trace / Perfetto JSON zaman çizelgesi
+#  ================================================================
+
+import bisect
+import json
+import os
+import threading
+import time
+
+import numpy as np
+
+from config import PROFILE_CONFIG
+
+
+class _NullSpan:
+    """Shared do-nothing span returned while profiling is off."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+# Histogram bucket upper bounds (seconds), shared with the metrics endpoint
+HISTOGRAM_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+# Active Profiler (None = profiling off)
+_profiler = None
+
+
+class _Span:
+    __slots__ = ('profiler', 'name', 't0')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.name, self.t0, time.perf_counter())
+        return False
+
+
+class Profiler:
+    """
+    Duration samples per stage name, plus (optionally) every span as a
+    Chrome trace event. `record` is safe to call from the HUD widget
+    thread pool: list appends are atomic under the GIL.
+
+    Every stage also keeps a fixed-bucket histogram (counts, sum), so a
+    long render can be watched with `keep_samples=False` in constant memory.
+    """
+
+    def __init__(self, trace=False, max_trace_events=200000, keep_samples=True):
+        self.samples = {}
+        self.histograms = {}
+        self.keep_samples = keep_samples
+        self.trace = trace
+        self.max_trace_events = int(max_trace_events)
+        self.events = []
+        self.origin = time.perf_counter()
+        self.pid = os.getpid()
+
+    def span(self, name):
+        return _Span(self, name)
+
+    def record(self, name, t0, t1):
+        """Add one `name` sample lasting from perf_counter `t0` to `t1`."""
+        d = t1 - t0
+        hist = self.histograms.get(name)
+        if hist is None:
+            # [per-bucket counts (+Inf last), count, sum]
+            hist = self.histograms.setdefault(name, [[0] * (len(HISTOGRAM_BUCKETS) + 1), 0, 0.0])
+        hist[0][bisect.bisect_left(HISTOGRAM_BUCKETS, d)] += 1
+        hist[1] += 1
+        hist[2] += d
+        if self.keep_samples:
+            samples = self.samples.get(name)
+            if samples is None:
+                samples = self.samples.setdefault(name, [])
+            samples.append(d)
+        if self.trace and len(self.events) < self.max_trace_events:
+            self.events.append((name, t0, t1, threading.get_ident()))
+
+    def count(self, name):
+        hist = self.histograms.get(name)
+        return hist[1] if hist is not None else 0
+
+    def summary(self):
+        """[(name, calls, total_s, p50_ms, p95_ms, max_ms)] sorted by total time."""
+        rows = []
+        for name, samples in self.samples.items():
+            ms = np.asarray(samples, dtype=np.float64) * 1000.0
+            p50, p95 = np.percentile(ms, (50, 95))
+            rows.append((name, len(ms), float(ms.sum()) / 1000.0, float(p50), float(p95), float(ms.max())))
+        rows.sort(key=lambda row: -row[2])
+        return rows
+
+    def write_trace(self, path):
+        """Write a Chrome trace (chrome://tracing, ui.perfetto.dev) of the recorded spans."""
+        threads = {}
+        events = []
+        for name, t0, t1, tid in self.events:
+            tid = threads.setdefault(tid, len(threads) + 1)
+            events.append({
+                'name': name,
+                'cat': name.split('.', 1)[0],
+                'ph': 'X',
+                'ts': round((t0 - self.origin) * 1e6, 3),
+                'dur': round((t1 - t0) * 1e6, 3),
+                'pid': self.pid,
+                'tid': tid,
+            })
+        for tid in threads.values():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': self.pid, 'tid': tid,
+                           'args': {'name': 'render' if tid == 1 else f"worker {tid - 1}"}})
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+
+
+# ================================================================
+#  GLOBAL API
+#  ================================================================
+
+def span(name):
+    """Context manager timing the `name` stage (no-op while profiling is off)."""
+    if _profiler is None:
+        return _NULL_SPAN
+    return _profiler.span(name)
+
+
+def record(name, t0, t1):
+    """Record a stage measured by the caller with perf_counter (ignored while off)."""
+    if _profiler is not None:
+        _profiler.record(name, t0, t1)
+
+
+def profiling_enabled():
+    return _profiler is not None
+
+
+def start_profiling(keep_samples=True):
+    """
+    Start collecting (PROFILE_CONFIG['trace_file'] also keeps trace events).
+    `keep_samples=False` keeps only histograms: what the metrics endpoint needs.
+    """
+    global _profiler
+    _profiler = Profiler(trace=bool(PROFILE_CONFIG.get('trace_file')) and keep_samples,
+                         max_trace_events=PROFILE_CONFIG.get('max_trace_events', 200000),
+                         keep_samples=keep_samples)
+    return _profiler
+
+
+def active_profiler():
+    return _profiler
+
+
+def stop_profiling():
+    """Stop collecting; writes the trace file if one is configured. Returns the Profiler."""
+    global _profiler
+    profiler, _profiler = _profiler, None
+    if profiler is not None and profiler.trace:
+        profiler.write_trace(PROFILE_CONFIG['trace_file'])
+    return profiler
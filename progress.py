@@ -0,0 +1,209 @@
+# ================================================================
+#  MAKİNE OKUNUR İLERLEME AKIŞI MODÜLÜ (progress.py)
+#  ================================================================
+#  İş zamanlayıcıları için insan yerine makineye yönelik ilerleme:
+#
+#  - JSON Lines (satır başına bir JSON kaydı) bir dosyaya veya
+#    açık bir dosya tanımlayıcısına (fd) yazılır
+#  - Kayıtlar render döngüsünden bağımsız bir arka plan thread'i ile
+#    sabit aralıkla yazılır: takılan bir render, frame sayısı
+#    ilerlemeyen taze kayıtlarla yavaş olandan ayırt edilir
+#  - Frame sayısı, anlık / ortalama FPS, ETA, kuyruk derinlikleri,
+#    bellek (RSS) ve önbellek isabet oranları; sonda özet kaydı
+#  - Sayaçlar (RenderState) metrics.py ile paylaşılır
+#  - Kapalıyken render döngüsündeki maliyet tek bir global kontrol
+#  ================================================================
+
+import json
+import os
+import sys
+import threading
+import time
+
+from config import PROGRESS_CONFIG
+
+
+# Counters fed by the render loop (None = nobody is listening)
+_state = None
+# Active ProgressStream (None = stream off)
+_stream = None
+
+
+def rss_mb():
+    """Resident memory of this process in MB (peak RSS where current is unavailable)."""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1024.0 ** 2
+    except (OSError, ValueError, AttributeError, IndexError):
+        pass
+    try:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KB, macOS bytes
+        return peak / 1024.0 ** 2 if sys.platform == 'darwin' else peak / 1024.0
+    except Exception:
+        return None
+
+
+class RenderState:
+    """
+    What the render loop reports: frames written, the frame total, queue
+    depths and cache hit/miss counts. Only plain stores happen on the
+    render path; readers (ProgressStream, metrics) take snapshots.
+    """
+
+    def __init__(self):
+        self.frames_done = 0
+        self.total_frames = None
+        self.queues = {}
+        self.caches = {}
+        self.started = time.time()
+
+    def update(self, frames_done, total_frames=None, queues=None):
+        self.frames_done = int(frames_done)
+        if total_frames is not None:
+            self.total_frames = int(total_frames)
+        if queues is not None:
+            self.queues = queues
+
+    def cache(self, name, hit):
+        counts = self.caches.get(name)
+        if counts is None:
+            counts = self.caches.setdefault(name, [0, 0])
+        counts[0 if hit else 1] += 1
+
+    def cache_rates(self):
+        rates = {}
+        for name, (hits, misses) in list(self.caches.items()):
+            total = hits + misses
+            rates[name] = {'hits': hits, 'misses': misses,
+                           'hit_rate': round(hits / total, 4) if total else None}
+        return rates
+
+
+def render_state():
+    """The shared RenderState, created on first use (the render loop starts reporting to it)."""
+    global _state
+    if _state is None:
+        _state = RenderState()
+    return _state
+
+
+class ProgressStream:
+    """
+    Background JSON Lines reporter over a RenderState. A daemon thread
+    turns the state into a 'progress' record every `interval` seconds and
+    `finish` writes the 'summary'.
+    """
+
+    def __init__(self, out, mode, output_file, state, interval=2.0):
+        self.out = out
+        self.mode = mode
+        self.output_file = output_file
+        self.state = state
+        self.interval = max(0.1, float(interval))
+        self.started = time.time()
+        self._last = (self.started, state.frames_done)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._emit('start', {})
+        self._thread = threading.Thread(target=self._run, name='vpro-progress', daemon=True)
+        self._thread.start()
+
+    # ---------- kayıtlar ----------
+
+    def _emit(self, event, fields):
+        record = {'event': event, 'ts': round(time.time(), 3), 'mode': self.mode}
+        record.update(fields)
+        line = json.dumps(record, separators=(',', ':')) + '\n'
+        with self._lock:
+            try:
+                self.out.write(line)
+                self.out.flush()
+            except (OSError, ValueError):
+                # A closed pipe must not kill the render
+                pass
+
+    def _progress_fields(self, now):
+        done, total = self.state.frames_done, self.state.total_frames
+        elapsed = now - self.started
+        last_t, last_done = self._last
+        self._last = (now, done)
+        fps = (done - last_done) / (now - last_t) if now > last_t else 0.0
+        fps_avg = done / elapsed if elapsed > 0 else 0.0
+        eta = (total - done) / fps_avg if total and fps_avg > 0 else None
+        mem = rss_mb()
+        return {
+            'frames_done': done,
+            'total_frames': total,
+            'percent': round(100.0 * done / total, 2) if total else None,
+            'fps': round(fps, 3),
+            'fps_avg': round(fps_avg, 3),
+            'elapsed_seconds': round(elapsed, 3),
+            'eta_seconds': round(eta, 1) if eta is not None else None,
+            'rss_mb': round(mem, 1) if mem is not None else None,
+            'queues': dict(self.state.queues),
+            'cache': self.state.cache_rates(),
+        }
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._emit('progress', self._progress_fields(time.time()))
+
+    def finish(self, status='done', error=None):
+        """Stop the reporter and write the final 'summary' record."""
+        self._stop.set()
+        self._thread.join(timeout=self.interval + 1.0)
+        fields = self._progress_fields(time.time())
+        fields.pop('fps')
+        fields.update(status=status, output_file=self.output_file)
+        if error is not None:
+            fields['error'] = str(error)
+        self._emit('summary', fields)
+
+
+# ================================================================
+#  GLOBAL API
+#  ================================================================
+
+def start_progress(mode, output_file):
+    """Open the stream configured in PROGRESS_CONFIG ('path' or 'fd'); None if neither is set."""
+    global _stream
+    path, fd = PROGRESS_CONFIG.get('path'), PROGRESS_CONFIG.get('fd')
+    if path:
+        out = open(path, 'a', encoding='utf-8')
+    elif fd is not None:
+        out = os.fdopen(int(fd), 'w', encoding='utf-8', closefd=False)
+    else:
+        return None
+    _stream = ProgressStream(out, mode, output_file, render_state(),
+                             PROGRESS_CONFIG.get('interval_seconds', 2.0))
+    return _stream
+
+
+def progress_update(frames_done, total_frames=None, queues=None):
+    """Report frames written so far (and optionally queue depths {name: items})."""
+    if _state is not None:
+        _state.update(frames_done, total_frames, queues)
+
+
+def progress_cache(name, hit):
+    """Count one hit or miss of cache `name`."""
+    if _state is not None:
+        _state.cache(name, hit)
+
+
+def finish_progress(status='done', error=None):
+    """Write the summary record and close the stream (no-op if it is off)."""
+    global _stream
+    stream, _stream = _stream, None
+    if stream is None:
+        return
+    stream.finish(status, error)
+    try:
+        if PROGRESS_CONFIG.get('path'):
+            stream.out.close()
+        else:
+            stream.out.flush()
+    except (OSError, ValueError):
+        pass
@@ -0,0 +1,94 @@
+# ================================================================
+#  PROXY (ÖNİZLEME) RENDER MODÜLÜ (proxy_render.py)
+#  ================================================================
+#  Düzen kontrolü için hızlı, düşük çözünürlüklü önizleme:
+#
+#  - Frame'ler ffmpeg içinde küçültülür (decoder çıkışında);
+#    Python'a sadece proxy boyutunda frame gelir
+#  - HUD proxy boyutunda, hud_downscale düzeniyle doğrudan çizilir
+#    (büyütme adımı yok)
+#  - Hızlı preset ve yüksek CRF ile kodlanır; çıkış dosyasının
+#    adına sonek eklenir, asıl render üzerine yazılmaz
+#  ================================================================
+
+import os
+
+from tqdm import tqdm
+
+from config import PROXY_CONFIG
+from data_handler import telemetry_row
+from ffmpeg_utils import FrameReader, FrameWriter
+from progress import progress_update
+from utils import clear_gradient_cache
+from video_renderer import resolve_render_window, get_encoder_settings, new_hud_cache, compose_frame
+
+
+def proxy_size(size, scale):
+    """Proxy frame size for `scale` (even dimensions, as yuv420p needs)."""
+    return (max(2, int(size[0] * scale) // 2 * 2),
+            max(2, int(size[1] * scale) // 2 * 2))
+
+
+def proxy_output_path(output_file):
+    base, ext = os.path.splitext(output_file)
+    return f"{base}{PROXY_CONFIG.get('suffix', '_proxy')}{ext}"
+
+
+def render_video_proxy(clip, data_handler, output_file):
+    """
+    Render a low-resolution preview, downscaled at decode time.
+
+    Args:
+        clip: MoviePy VideoFileClip object (closed after planning)
+        data_handler: DataHandler object
+        output_file: Output video file (the proxy suffix is added)
+    """
+    W, H = int(clip.size[0]), int(clip.size[1])
+    start_offset, duration = resolve_render_window(clip)
+    fps = clip.fps
+    video_path = clip.filename
+    clip.close()
+
+    scale = max(0.05, min(1.0, float(PROXY_CONFIG.get('scale', 0.25))))
+    pw, ph = proxy_size((W, H), scale)
+    total_frames = int(duration * fps)
+    output_file = proxy_output_path(output_file)
+    _, ff_threads = get_encoder_settings()
+    preset = PROXY_CONFIG.get('preset', 'ultrafast')
+    crf = PROXY_CONFIG.get('crf', 32)
+
+    print(f"\n📝 Opening output video:")
+    print(f"   • File: {output_file}")
+    print(f"   • Resolution: {pw}x{ph} (proxy of {W}x{H}, scale {scale:g})")
+    print(f"   • FPS: {fps}")
+    print(f"   • Codec: libx264 {preset}, CRF {crf}")
+
+    print("\n📈 Interpolating telemetry at frame times...")
+    times = [n / fps + start_offset for n in range(total_frames)]
+    telemetry = data_handler.get_data_batch(times)
+
+    print("\n▶️  Starting proxy render...\n")
+
+    hud_cache = new_hud_cache()
+    frames_done = 0
+    try:
+        with FrameReader(video_path, (pw, ph), start_offset, total_frames,
+                         video_filter=f"scale={pw}:{ph}:flags=fast_bilinear") as reader, \
+                FrameWriter(output_file, (pw, ph), fps, preset=preset, threads=ff_threads,
+                            extra_args=['-crf', str(crf)] if crf is not None else None) as writer:
+            for n in tqdm(range(total_frames), unit='frame'):
+                img_bgr = reader.read()
+                if img_bgr is None:
+                    break
+                data = telemetry_row(telemetry, n)
+                writer.write(compose_frame(img_bgr, data, data_handler, times[n], hud_cache,
+                                           proxy_scale=scale))
+                frames_done += 1
+                progress_update(frames_done, total_frames)
+    finally:
+        clear_gradient_cache()
+
+    print(f"\n✅ RENDER COMPLETE!")
+    print(f"   • {frames_done} frames processed")
+    print(f"   • Duration: {frames_done / fps:.1f}s")
+    print(f"   • File: {output_file}")
@@ -0,0 +1,248 @@
+# ================================================================
+#  PARÇALI / DEVAM ETTİRİLEBİLİR RENDER MODÜLÜ (segmented_render.py)
+#  ================================================================
+#  Çıkış numaralı segmentler halinde yazılır:
+#
+#    .vpro_segments/
+#        manifest.json        ← config hash + segment aralıkları + durum
+#        seg_00000.mp4
+#        seg_00001.mp4
+#        ...
+#
+#  - Her segment önce geçici isimle yazılır, bitince yeniden adlandırılır
+#    ve manifest'te "done" işaretlenir (atomik)
+#  - Yeniden çalıştırmada config hash aynıysa sadece eksik segmentler
+#    render edilir; çökme / iptal en fazla bir segment kaybettirir
+#  - Sonuç ffmpeg concat demuxer ile yeniden kodlanmadan birleştirilir
+#  ================================================================
+
+import hashlib
+import json
+import os
+
+import config
+from config import SEGMENT_CONFIG, GPX_DOSYASI
+from ffmpeg_utils import probe_keyframe_times, concat_stream_copy
+from parallel_render import plan_chunks, render_chunk
+from progress import progress_update
+from utils import clear_gradient_cache
+from video_renderer import resolve_render_window
+
+
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 1
+
+# Settings that never change the rendered pixels (output name has a timestamp)
+_HASH_EXCLUDE = {
+    'CIKTI_DOSYASI', 'RENDER_MODE', 'RENDER_MODES',
+    'PARALLEL_CONFIG', 'PIPELINE_CONFIG', 'SHM_CONFIG', 'SEGMENT_CONFIG', 'DECODE_CONFIG',
+    'FRAME_CACHE_CONFIG', 'TIMELAPSE_CONFIG', 'HIGHLIGHTS_CONFIG', 'AUTO_CUT_CONFIG',
+    'OFFSET_ESTIMATE_CONFIG', 'FANOUT_CONFIG', 'PROXY_CONFIG',
+    'OVERLAY_CONFIG', 'SIDECAR_CONFIG', 'PROFILE_CONFIG',
+    'PROGRESS_CONFIG', 'METRICS_CONFIG', 'THEME_CACHE_CONFIG',
+}
+
+
+# ================================================================
+#  CONFIG PARMAK İZİ
+#  ================================================================
+
+def _file_identity(path):
+    try:
+        st = os.stat(path)
+        return [os.path.abspath(path), st.st_size, st.st_mtime_ns]
+    except OSError:
+        return [os.path.abspath(path), None, None]
+
+
+def config_fingerprint(video_path, gpx_path=GPX_DOSYASI):
+    """
+    Hash of everything that affects the rendered frames: all upper-case
+    settings in config (theme, widgets, HUD, encoder...) plus the identity
+    (path, size, mtime) of the input video and GPX file.
+    """
+    settings = {}
+    for name, value in vars(config).items():
+        if not name.isupper() or name in _HASH_EXCLUDE:
+            continue
+        if isinstance(value, (dict, list, tuple, str, int, float, bool, type(None))):
+            settings[name] = value
+    payload = {
+        'settings': settings,
+        'video': _file_identity(video_path),
+        'gpx': _file_identity(gpx_path),
+    }
+    blob = json.dumps(payload, sort_keys=True, default=repr, ensure_ascii=True)
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()[:16]
+
+
+# ================================================================
+#  MANIFEST
+#  ================================================================
+
+def _write_json_atomic(path, obj):
+    tmp = path + '.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(obj, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def load_manifest(segment_dir):
+    """Return the manifest dict in `segment_dir`, or None if missing/corrupt."""
+    path = os.path.join(segment_dir, MANIFEST_NAME)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if manifest.get('version') != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def save_manifest(segment_dir, manifest):
+    _write_json_atomic(os.path.join(segment_dir, MANIFEST_NAME), manifest)
+
+
+def new_manifest(config_hash, video_path, fps, start_offset, total_frames, segments):
+    """Build a fresh manifest for `segments` = [(first_frame, frame_count), ...]."""
+    return {
+        'version': MANIFEST_VERSION,
+        'config_hash': config_hash,
+        'video': os.path.abspath(video_path),
+        'fps': fps,
+        'start_offset': start_offset,
+        'total_frames': total_frames,
+        'segments': [
+            {'index': i, 'first_frame': first, 'frame_count': count,
+             'file': f"seg_{i:05d}.mp4", 'done': False}
+            for i, (first, count) in enumerate(segments)
+        ],
+    }
+
+
+def _manifest_matches(manifest, config_hash, fps, start_offset, total_frames):
+    return (manifest is not None
+            and manifest.get('config_hash') == config_hash
+            and manifest.get('fps') == fps
+            and manifest.get('start_offset') == start_offset
+            and manifest.get('total_frames') == total_frames)
+
+
+def _clear_segment_dir(segment_dir):
+    for name in os.listdir(segment_dir):
+        if name.startswith('seg_') or name.startswith(MANIFEST_NAME):
+            try:
+                os.remove(os.path.join(segment_dir, name))
+            except OSError:
+                pass
+
+
+# ================================================================
+#  ANA PARÇALI RENDER
+#  ================================================================
+
+def get_segment_dir(output_file):
+    """Segment directory from SEGMENT_CONFIG (default: next to the output)."""
+    seg_dir = SEGMENT_CONFIG.get('dir')
+    if not seg_dir:
+        out_dir = os.path.dirname(os.path.abspath(output_file)) or '.'
+        seg_dir = os.path.join(out_dir, '.vpro_segments')
+    return seg_dir
+
+
+def render_video_segmented(clip, data_handler, output_file):
+    """
+    Render into resumable numbered segments and join them without
+    re-encoding. Re-running with unchanged settings continues where the
+    previous run stopped.
+
+    Args:
+        clip: MoviePy VideoFileClip object (closed after planning)
+        data_handler: DataHandler object
+        output_file: Output video file
+    """
+    W, H = int(clip.size[0]), int(clip.size[1])
+    start_offset, duration = resolve_render_window(clip)
+    fps = clip.fps
+    video_path = clip.filename
+    clip.close()
+
+    total_frames = int(duration * fps)
+    segment_dir = get_segment_dir(output_file)
+    os.makedirs(segment_dir, exist_ok=True)
+    config_hash = config_fingerprint(video_path)
+
+    manifest = load_manifest(segment_dir)
+    if _manifest_matches(manifest, config_hash, fps, start_offset, total_frames):
+        # Trust "done" only when the segment file is really there
+        for seg in manifest['segments']:
+            if seg['done'] and not os.path.isfile(os.path.join(segment_dir, seg['file'])):
+                seg['done'] = False
+        done = sum(1 for seg in manifest['segments'] if seg['done'])
+        print(f"\n♻️  Resuming: {done}/{len(manifest['segments'])} segments already rendered")
+    else:
+        if manifest is not None:
+            print("\n⚠️ Settings or inputs changed since the last run; starting over")
+        _clear_segment_dir(segment_dir)
+        keyframes = []
+        try:
+            keyframes = probe_keyframe_times(video_path)
+        except Exception as e:
+            print(f"   ⚠️ Keyframe probe failed ({e}); using even segment borders")
+        segments = plan_chunks(total_frames, fps, start_offset, keyframes, 1,
+                               SEGMENT_CONFIG.get('segment_seconds', 120))
+        manifest = new_manifest(config_hash, video_path, fps, start_offset, total_frames, segments)
+    save_manifest(segment_dir, manifest)
+
+    todo = [seg for seg in manifest['segments'] if not seg['done']]
+
+    print(f"\n📝 Opening output video:")
+    print(f"   • File: {output_file}")
+    print(f"   • Resolution: {W}x{H}")
+    print(f"   • FPS: {fps}")
+    print(f"   • Codec: libx264 (MP4), {len(manifest['segments'])} segments in {segment_dir}")
+
+    print("\n▶️  Starting segmented render...\n")
+
+    # Segments finished by an earlier run count as done
+    frames_done = [total_frames - sum(seg['frame_count'] for seg in todo)]
+    progress_update(frames_done[0], total_frames)
+
+    def count_frame():
+        frames_done[0] += 1
+        progress_update(frames_done[0], total_frames)
+
+    try:
+        for seg in todo:
+            final_path = os.path.join(segment_dir, seg['file'])
+            tmp_path = os.path.join(segment_dir, seg['file'].replace('.mp4', '.part.mp4'))
+            print(f"🎞️  Segment {seg['index'] + 1}/{len(manifest['segments'])} "
+                  f"(frames {seg['first_frame']}-{seg['first_frame'] + seg['frame_count'] - 1})")
+            render_chunk(video_path, data_handler.fork(), seg['first_frame'], seg['frame_count'],
+                         fps, start_offset, tmp_path, logger='bar', on_frame=count_frame)
+            os.replace(tmp_path, final_path)
+            seg['done'] = True
+            save_manifest(segment_dir, manifest)
+
+        print("\n🔗 Joining segments (stream copy)...")
+        concat_stream_copy([os.path.join(segment_dir, seg['file']) for seg in manifest['segments']],
+                           output_file)
+    finally:
+        clear_gradient_cache()
+
+    if SEGMENT_CONFIG.get('keep_segments', False):
+        print(f"   • Segments kept in: {segment_dir}")
+    else:
+        _clear_segment_dir(segment_dir)
+        try:
+            os.rmdir(segment_dir)
+        except OSError:
+            pass
+
+    print(f"\n✅ RENDER COMPLETE!")
+    print(f"   • {total_frames} frames processed")
+    print(f"   • Duration: {total_frames / fps:.1f}s")
+    print(f"   • File: {output_file}")
@@ -0,0 +1,277 @@
+# ================================================================
+#  PAYLAŞIMLI BELLEK RENDER MODÜLÜ (shm_render.py)
+#  ================================================================
+#  Frame düzeyinde çok işlemli render:
+#
+#    ana işlem (decode) ──► paylaşımlı bellek halkası (N slot)
+#        ──► HUD işçi işlemleri (slot üzerinde yerinde birleştirme)
+#        ──► encoder işlemi (slotları sırayla ffmpeg'e yazar, slotu serbest bırakır)
+#
+#  - Piksel verisi işlemler arasında asla kopyalanmaz / pickle edilmez;
+#    kuyruklarda sadece slot numaraları dolaşır
+#  - Telemetri bir kez toplu hesaplanır (DataHandler.get_data_batch);
+#    işçiler GPX'i yeniden parse etmez
+#  - GIL'e takılan widget kodu için thread havuzundan daha iyi ölçeklenir
+#  ================================================================
+
+import os
+import queue
+import multiprocessing as mp
+from multiprocessing import shared_memory
+
+import numpy as np
+from tqdm import tqdm
+
+from config import HUD_CONFIG, SHM_CONFIG
+from data_handler import telemetry_row
+from ffmpeg_utils import FrameWriter
+from hud_layout import render_unified_hud
+from progress import progress_update
+from utils import clear_gradient_cache
+from video_renderer import (
+    resolve_render_window, get_encoder_settings, hud_update_interval, blend_hud, FrameSource
+)
+
+
+# ================================================================
+#  PAYLAŞIMLI FRAME HALKASI
+#  ================================================================
+
+class SharedFrameRing:
+    """
+    Fixed number of BGR frame slots in one shared memory block.
+
+    The creating process owns (and unlinks) the block; other processes
+    attach by name and see the same pixels through `frame(slot)`.
+    """
+
+    def __init__(self, slots, frame_shape, name=None):
+        self.slots = int(slots)
+        self.frame_shape = tuple(frame_shape)
+        nbytes = self.slots * int(np.prod(self.frame_shape))
+        self._owner = name is None
+        if self._owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=nbytes)
+        else:
+            self.shm = _attach_shared_memory(name)
+        self.name = self.shm.name
+        self.frames = np.ndarray((self.slots,) + self.frame_shape, dtype=np.uint8, buffer=self.shm.buf)
+
+    def frame(self, slot):
+        """Writable (H, W, 3) view of one slot."""
+        return self.frames[slot]
+
+    def close(self):
+        self.frames = None
+        self.shm.close()
+        if self._owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _attach_shared_memory(name):
+    # Only the owner may unlink. Child processes share the parent's resource
+    # tracker, so on older Pythons a plain attach is already harmless
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)  # Python 3.13+
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+
+# ================================================================
+#  İŞÇİ İŞLEMLERİ
+#  ================================================================
+
+def _hud_worker(ring_name, slots, frame_shape, data_handler, telemetry, work_q, done_q):
+    """Composite the HUD onto each group's slots in place."""
+    ring = SharedFrameRing(slots, frame_shape, name=ring_name)
+    hud_on = HUD_CONFIG.get('unified_hud', True)
+    try:
+        while True:
+            job = work_q.get()
+            if job is None:
+                break
+            group_idx, hud_row, slot_ids = job
+            if hud_on:
+                first = ring.frame(slot_ids[0])
+                data = telemetry_row(telemetry, hud_row)
+                hud_bgr, hud_alpha = render_unified_hud(first, data, data_handler,
+                                                        float(telemetry['t'][hud_row]))
+                for s in slot_ids:
+                    frame = ring.frame(s)
+                    np.copyto(frame, blend_hud(frame, hud_bgr, hud_alpha))
+            done_q.put((group_idx, slot_ids))
+    finally:
+        ring.close()
+        clear_gradient_cache()
+
+
+def _encoder_proc(ring_name, slots, frame_shape, output_file, fps, preset, threads,
+                  group_count, done_q, free_q, frames_written):
+    """Write completed groups in order straight from shared memory, free slots."""
+    ring = SharedFrameRing(slots, frame_shape, name=ring_name)
+    H, W = frame_shape[0], frame_shape[1]
+    pending = {}
+    next_idx = 0
+    try:
+        with FrameWriter(output_file, (W, H), fps, preset=preset, threads=threads) as writer:
+            while next_idx < group_count:
+                group_idx, slot_ids = done_q.get()
+                pending[group_idx] = slot_ids
+                while next_idx in pending:
+                    for s in pending.pop(next_idx):
+                        writer.write(ring.frame(s))
+                        free_q.put(s)
+                        with frames_written.get_lock():
+                            frames_written.value += 1
+                    next_idx += 1
+    finally:
+        ring.close()
+
+
+# ================================================================
+#  ANA PAYLAŞIMLI BELLEK RENDER
+#  ================================================================
+
+def plan_hud_groups(times):
+    """
+    Split frame times into HUD groups: [start, end) index ranges that share
+    one HUD redraw (the serial path's update-rate schedule).
+    """
+    interval = hud_update_interval()
+    if interval is None or not HUD_CONFIG.get('unified_hud', True):
+        return [(i, i + 1) for i in range(len(times))]
+    groups = []
+    last_t = None
+    start = 0
+    for i, t in enumerate(times):
+        if last_t is None or not ((t - last_t) < interval):
+            if i > start:
+                groups.append((start, i))
+            start = i
+            last_t = t
+    if len(times) > start:
+        groups.append((start, len(times)))
+    return groups
+
+
+def _qsize(q):
+    # multiprocessing queues cannot report their size on macOS
+    try:
+        return q.qsize()
+    except NotImplementedError:
+        return None
+
+
+def _get_slot(free_q, procs):
+    # Block for a free slot, but notice a crashed child instead of hanging
+    while True:
+        try:
+            return free_q.get(timeout=0.5)
+        except queue.Empty:
+            for p in procs:
+                if p.exitcode not in (None, 0):
+                    raise RuntimeError(f"{p.name} exited with code {p.exitcode}")
+
+
+def render_video_shm(clip, data_handler, output_file):
+    """
+    Render video with HUD worker processes sharing a frame ring buffer.
+
+    Args:
+        clip: MoviePy VideoFileClip object
+        data_handler: DataHandler object
+        output_file: Output video file
+    """
+    W, H = int(clip.size[0]), int(clip.size[1])
+    start_offset, duration = resolve_render_window(clip)
+    fps = clip.fps
+    total_frames = int(duration * fps)
+    frame_shape = (H, W, 3)
+
+    times = [n / fps + start_offset for n in range(total_frames)]
+    print("\n📈 Precomputing telemetry...")
+    telemetry = data_handler.get_data_batch(times)
+    groups = plan_hud_groups(times)
+
+    hud_workers = SHM_CONFIG.get('hud_workers') or max(1, (os.cpu_count() or 2) - 2)
+    longest = max((e - s for s, e in groups), default=1)
+    # The decoder holds one partial group; leave room for the others in flight
+    slots = max(int(SHM_CONFIG.get('ring_slots', 24)), 2 * longest + hud_workers)
+
+    print(f"\n📝 Opening output video:")
+    print(f"   • File: {output_file}")
+    print(f"   • Resolution: {W}x{H}")
+    print(f"   • FPS: {fps}")
+    print(f"   • Codec: libx264 (MP4), {hud_workers} HUD processes, {slots}-slot shared ring "
+          f"({slots * W * H * 3 / 1024 ** 2:.0f} MB)")
+
+    print("\n▶️  Starting shared-memory render...\n")
+
+    ring = SharedFrameRing(slots, frame_shape)
+    source = FrameSource(clip, fps, start_offset, end_frame=total_frames)
+    work_q, done_q, free_q = mp.Queue(), mp.Queue(), mp.Queue()
+    frames_written = mp.Value('i', 0)
+    for s in range(slots):
+        free_q.put(s)
+
+    ff_preset, ff_threads = get_encoder_settings()
+    workers = [mp.Process(target=_hud_worker, name=f'vpro-hud-{i}',
+                          args=(ring.name, slots, frame_shape, data_handler, telemetry, work_q, done_q))
+               for i in range(hud_workers)]
+    encoder = mp.Process(target=_encoder_proc, name='vpro-encode',
+                         args=(ring.name, slots, frame_shape, output_file, fps, ff_preset, ff_threads,
+                               len(groups), done_q, free_q, frames_written))
+    procs = workers + [encoder]
+    for p in procs:
+        p.daemon = True
+        p.start()
+
+    def report(bar):
+        done = frames_written.value
+        bar.update(done - bar.n)
+        progress_update(done, total_frames, {'hud_work': _qsize(work_q), 'free_slots': _qsize(free_q)})
+
+    try:
+        with tqdm(total=total_frames, unit='frame') as bar:
+            for group_idx, (start, end) in enumerate(groups):
+                slot_ids = []
+                for n in range(start, end):
+                    s = _get_slot(free_q, procs)
+                    source.get(n, out=ring.frame(s))
+                    slot_ids.append(s)
+                work_q.put((group_idx, start, slot_ids))
+                report(bar)
+
+            for _ in workers:
+                work_q.put(None)
+            while encoder.is_alive():
+                encoder.join(timeout=0.2)
+                report(bar)
+                for p in workers:
+                    if p.exitcode not in (None, 0):
+                        raise RuntimeError(f"{p.name} exited with code {p.exitcode}")
+            report(bar)
+        if encoder.exitcode != 0:
+            raise RuntimeError(f"encoder process exited with code {encoder.exitcode}")
+        for p in workers:
+            p.join(timeout=5.0)
+    finally:
+        for p in procs:
+            if p.is_alive():
+                p.terminate()
+                p.join(timeout=1.0)
+        ring.close()
+        source.close()
+        try:
+            clip.close()
+        except Exception:
+            pass
+        clear_gradient_cache()
+
+    print(f"\n✅ RENDER COMPLETE!")
+    print(f"   • {total_frames} frames processed")
+    print(f"   • Duration: {total_frames / fps:.1f}s")
+    print(f"   • File: {output_file}")
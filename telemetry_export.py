@@ -0,0 +1,239 @@
+# ================================================================
+#  TELEMETRİ YAN DOSYA / ALTYAZI İZİ MODÜLÜ (telemetry_export.py)
+#  ================================================================
+#  Arşiv kopyaları için HUD videoya gömülmez; yeniden kodlama yok:
+#
+#  - Telemetri toplu interpolasyonla (get_data_batch) sabit bir
+#    sıklıkta örneklenir
+#  - Hız / nabız / yükseklik tema renkleriyle ASS altyazısı ve
+#    düz WebVTT altyazısı olarak yazılır
+#  - Tüm kanallar JSON ve CSV yan dosyalarına yazılır
+#  - Orijinal video ve ses stream copy ile kopyalanır, altyazılar
+#    (ve MKV'de JSON eki) yanına muxlanır: saatler değil saniyeler
+#  ================================================================
+
+import csv
+import json
+import math
+import os
+
+import numpy as np
+
+from config import SIDECAR_CONFIG, COLORS
+from ffmpeg_utils import run_ffmpeg
+from progress import progress_update
+
+
+# Exported channels: (column name, get_data_batch key, decimals)
+SIDECAR_FIELDS = (
+    ('time_s', 't', 3),
+    ('lat', 'lat', 6),
+    ('lon', 'lon', 6),
+    ('ele_m', 'ele', 1),
+    ('speed_kmh', 'speed', 2),
+    ('hr_bpm', 'hr', 0),
+    ('cadence_rpm', 'cad', 0),
+    ('power_w', 'power', 0),
+    ('grade_pct', 'grade', 1),
+    ('distance_m', 'cum_dist', 1),
+)
+
+
+def sidecar_paths(output_file):
+    """Output paths keyed by kind: 'video', 'ass', 'vtt', 'json', 'csv'."""
+    base, _ = os.path.splitext(output_file)
+    base += SIDECAR_CONFIG.get('suffix', '_telemetry')
+    container = SIDECAR_CONFIG.get('container', 'mkv')
+    return {
+        'video': f"{base}.{container}",
+        'ass': f"{base}.ass",
+        'vtt': f"{base}.vtt",
+        'json': f"{base}.json",
+        'csv': f"{base}.csv",
+    }
+
+
+def _value(batch, key, i, decimals):
+    v = float(batch[key][i])
+    if not math.isfinite(v):
+        return None
+    return int(round(v)) if decimals == 0 else round(v, decimals)
+
+
+def telemetry_records(batch):
+    """One dict per sample (SIDECAR_FIELDS columns; missing values are None)."""
+    return [{name: _value(batch, key, i, dec) for name, key, dec in SIDECAR_FIELDS}
+            for i in range(len(batch['t']))]
+
+
+# ================================================================
+#  ALTYAZI METİNLERİ
+#  ================================================================
+
+def _cue_parts(record):
+    """(value, unit, color key) triples shown in a subtitle cue."""
+    parts = [(f"{record['speed_kmh']:.1f}", 'km/h', 'speed')]
+    if record['hr_bpm'] is not None:
+        parts.append((f"{record['hr_bpm']}", 'bpm', 'danger'))
+    parts.append((f"{record['ele_m']:.0f}", 'm', 'altitude'))
+    return parts
+
+
+def build_cues(batch, step):
+    """
+    [(t0, t1, parts)] subtitle cues, one per sample; consecutive samples with
+    the same text are merged. Samples off the GPX track get no cue.
+    """
+    cues = []
+    records = telemetry_records(batch)
+    for i, record in enumerate(records):
+        if np.isnan(batch['seg_seconds'][i]):
+            continue
+        t0 = float(batch['t'][i])
+        parts = _cue_parts(record)
+        if cues and cues[-1][2] == parts and abs(cues[-1][1] - t0) < 1e-6:
+            cues[-1] = (cues[-1][0], t0 + step, parts)
+        else:
+            cues.append((t0, t0 + step, parts))
+    return cues
+
+
+def _ass_time(t):
+    cs = int(round(t * 100))
+    return f"{cs // 360000}:{cs // 6000 % 60:02d}:{cs // 100 % 60:02d}.{cs % 100:02d}"
+
+
+def _vtt_time(t):
+    ms = int(round(t * 1000))
+    return f"{ms // 3600000:02d}:{ms // 60000 % 60:02d}:{ms // 1000 % 60:02d}.{ms % 1000:03d}"
+
+
+def _ass_color(key):
+    # Theme colors are BGR, ASS colors are &HAABBGGRR
+    b, g, r = COLORS.get(key, COLORS.get('text_main', (255, 255, 255)))
+    return f"&H00{int(b):02X}{int(g):02X}{int(r):02X}"
+
+
+def write_ass(path, cues, size):
+    """Styled ASS subtitles: theme colors, bottom-left, sized for the video."""
+    W, H = size
+    font_size = max(12, int(H * float(SIDECAR_CONFIG.get('font_scale', 0.045))))
+    margin = int(H * 0.04)
+    unit_color = _ass_color('text_sub')
+    lines = [
+        '[Script Info]',
+        'ScriptType: v4.00+',
+        f'PlayResX: {W}',
+        f'PlayResY: {H}',
+        'ScaledBorderAndShadow: yes',
+        '',
+        '[V4+ Styles]',
+        'Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, '
+        'Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, '
+        'Shadow, Alignment, MarginL, MarginR, MarginV, Encoding',
+        f'Style: Telemetry,Arial,{font_size},{_ass_color("text_main")},&H000000FF,&H00000000,&H80000000,'
+        f'1,0,0,0,100,100,0,0,1,2,1,1,{margin},{margin},{margin},1',
+        '',
+        '[Events]',
+        'Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text',
+    ]
+    for t0, t1, parts in cues:
+        text = '   '.join(f"{{\\c{_ass_color(color)}}}{value}{{\\c{unit_color}}} {unit}"
+                           for value, unit, color in parts)
+        lines.append(f"Dialogue: 0,{_ass_time(t0)},{_ass_time(t1)},Telemetry,,0,0,0,,{text}")
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+
+
+def write_vtt(path, cues):
+    """Plain WebVTT subtitles (players that do not render ASS)."""
+    lines = ['WEBVTT', '']
+    for t0, t1, parts in cues:
+        lines += [f"{_vtt_time(t0)} --> {_vtt_time(t1)}",
+                  '  ·  '.join(f"{value} {unit}" for value, unit, _ in parts), '']
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines))
+
+
+def write_data_files(paths, records, rate_hz):
+    """JSON (with sampling metadata) and CSV sidecars of every channel."""
+    with open(paths['json'], 'w', encoding='utf-8') as f:
+        json.dump({'rate_hz': rate_hz, 'fields': [name for name, _, _ in SIDECAR_FIELDS],
+                   'samples': records}, f, separators=(',', ':'))
+    with open(paths['csv'], 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=[name for name, _, _ in SIDECAR_FIELDS])
+        writer.writeheader()
+        writer.writerows(records)
+
+
+# ================================================================
+#  MUX (STREAM COPY)
+#  ================================================================
+
+def mux_sidecar_tracks(video_path, paths):
+    """
+    Copy the source video/audio untouched and add the subtitle tracks
+    (MKV: styled ASS + WebVTT + JSON attachment; MP4/MOV: mov_text).
+    """
+    container = os.path.splitext(paths['video'])[1].lstrip('.').lower()
+    args = ['-i', video_path, '-i', paths['ass']]
+    maps = ['-map', '0:v', '-map', '0:a?', '-map', '1:0']
+    if container == 'mkv':
+        args += ['-i', paths['vtt']]
+        maps += ['-map', '2:0']
+        codecs = ['-c', 'copy', '-c:s:0', 'ass', '-c:s:1', 'webvtt',
+                  '-metadata:s:s:0', 'title=Telemetry', '-metadata:s:s:1', 'title=Telemetry (plain)',
+                  '-attach', paths['json'], '-metadata:s:t', 'mimetype=application/json']
+    else:
+        codecs = ['-c', 'copy', '-c:s', 'mov_text', '-metadata:s:s:0', 'title=Telemetry']
+    run_ffmpeg(args + maps + codecs + ['-metadata:s:s:0', 'language=eng', paths['video']])
+
+
+# ================================================================
+#  ANA DIŞA AKTARIM
+#  ================================================================
+
+def render_video_sidecar(clip, data_handler, output_file):
+    """
+    Export the source with telemetry subtitle tracks and JSON/CSV sidecars,
+    without re-encoding. The whole video is exported (demo mode is ignored:
+    a stream copy cannot start between keyframes).
+
+    Args:
+        clip: MoviePy VideoFileClip object (only size/duration/filename are used)
+        data_handler: DataHandler object
+        output_file: Output video file (the sidecar suffix and container are applied)
+    """
+    W, H = int(clip.size[0]), int(clip.size[1])
+    duration = clip.duration
+    video_path = clip.filename
+    clip.close()
+
+    rate_hz = float(SIDECAR_CONFIG.get('rate_hz', 1.0))
+    step = 1.0 / rate_hz
+    paths = sidecar_paths(output_file)
+
+    print(f"\n📝 Exporting telemetry tracks (no re-encode):")
+    print(f"   • File: {paths['video']}")
+    print(f"   • Duration: {duration:.1f}s, {rate_hz:g} samples/s")
+
+    print("\n📈 Interpolating telemetry...")
+    times = np.arange(int(math.ceil(duration * rate_hz))) * step
+    batch = data_handler.get_data_batch(times)
+    records = telemetry_records(batch)
+    cues = build_cues(batch, step)
+    # No frames are rendered: progress counts telemetry samples, done after the mux
+    progress_update(0, len(records))
+
+    write_ass(paths['ass'], cues, (W, H))
+    write_vtt(paths['vtt'], cues)
+    write_data_files(paths, records, rate_hz)
+
+    print("\n▶️  Muxing subtitle tracks (stream copy)...")
+    mux_sidecar_tracks(video_path, paths)
+    progress_update(len(records), len(records))
+
+    print(f"\n✅ EXPORT COMPLETE!")
+    print(f"   • {len(records)} samples, {len(cues)} subtitle cues")
+    for kind in ('video', 'ass', 'vtt', 'json', 'csv'):
+        print(f"   • File: {paths[kind]}")
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+import data_handler
+from benchmark import write_synthetic_gpx
+from data_handler import DataHandler, telemetry_row
+
+# telemetry_row keys that are compared as floats / as exact values
+FLOAT_KEYS = ('lat', 'lon', 'ele', 'speed', 'grade', 'power', 'cum_dist', 'progress', 'heading')
+EXACT_KEYS = ('hr', 'cad', 'idx')
+
+
+@pytest.fixture(params=[
+    dict(minutes=2, sample_hz=1.0, seed=3),
+    dict(minutes=2, sample_hz=0.5, hr=False, cad=False, seed=4),
+], ids=['hr_cad_1hz', 'bare_0.5hz'])
+def gpx_path(request, tmp_path):
+    path = tmp_path / 'ride.gpx'
+    write_synthetic_gpx(str(path), **request.param)
+    return str(path)
+
+
+def test_get_data_batch_matches_get_data(gpx_path, monkeypatch):
+    monkeypatch.setattr(data_handler, 'ZAMAN_OFFSET_SANIYE', 12.5)
+    # Frame times at 30 fps from before the track start to past its end
+    times = np.arange(-20 * 30, 130 * 30) / 30.0
+
+    batch = DataHandler(gpx_path).get_data_batch(times)
+    # Power smoothing is sequential: query a fresh handler in render order
+    serial = DataHandler(gpx_path)
+    for i, t in enumerate(times):
+        want = serial.get_data(float(t))
+        got = telemetry_row(batch, i)
+        for key in EXACT_KEYS:
+            assert got[key] == want[key], (key, t)
+        for key in FLOAT_KEYS:
+            assert got[key] == pytest.approx(want[key], rel=1e-12, abs=1e-9), (key, t)
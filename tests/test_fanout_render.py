@@ -0,0 +1,30 @@
+import config
+from config import THEME_CACHE_CONFIG
+from fanout_render import plan_branches, BranchState
+from theme_compiler import get_compiled_theme
+
+
+def test_fanout_branches_same_size_get_their_own_theme(monkeypatch, tmp_path):
+    monkeypatch.setitem(THEME_CACHE_CONFIG, 'enabled', False)
+    outputs = [
+        {'suffix': '_classic', 'size': (640, 360), 'theme': 'classic'},
+        {'suffix': '_neon', 'size': (640, 360), 'theme': 'neon'},
+    ]
+    branches = plan_branches(outputs, (1920, 1080), str(tmp_path / 'out.mp4'))
+    state = BranchState(branches)
+    compiled = []
+    try:
+        for branch in branches:
+            state.activate(branch)
+            theme = get_compiled_theme(branch['size'])
+            assert dict(theme.colors) == config.COLORS
+            compiled.append(theme)
+        # Switching back hits the cache for the first branch
+        state.activate(branches[0])
+        assert get_compiled_theme(branches[0]['size']) is compiled[0]
+    finally:
+        state.restore()
+
+    assert compiled[0] is not compiled[1]
+    assert compiled[0].key != compiled[1].key
+    assert compiled[0].colors != compiled[1].colors
@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from ffmpeg_utils import FrameReader, FrameWriter, probe_frame_times
+
+SIZE = (64, 48)
+
+
+def test_timestamped_frames_keep_their_pts(tmp_path):
+    # Uneven (VFR) timestamps on the Matroska writer's microsecond scale
+    pts = [0.0, 0.04, 0.1, 0.333, 0.5, 1.25]
+    out = str(tmp_path / 'vfr.mkv')
+    with FrameWriter(out, SIZE, 30, preset='ultrafast', timestamps=True,
+                     extra_args=['-bf', '0', '-qp', '0']) as writer:
+        for i, t in enumerate(pts):
+            writer.write(np.full((SIZE[1], SIZE[0], 3), 40 * i, dtype=np.uint8), pts=t)
+    assert writer.frames_written == len(pts)
+
+    # .mkv stores milliseconds
+    assert probe_frame_times(out) == pytest.approx(pts, abs=1e-3)
+
+    reader = FrameReader(out, SIZE, passthrough=True)
+    frames = []
+    while True:
+        frame = reader.read()
+        if frame is None:
+            break
+        frames.append(frame)
+    reader.close()
+    assert len(frames) == len(pts)
+    # Same frames in the same order (yuv420p shifts grey levels slightly)
+    for i, frame in enumerate(frames):
+        assert abs(int(np.median(frame)) - 40 * i) <= 8
+
+
+def test_timestamped_writer_needs_pts(tmp_path):
+    with pytest.raises(ValueError):
+        with FrameWriter(str(tmp_path / 'x.mkv'), SIZE, 30, preset='ultrafast',
+                         timestamps=True) as writer:
+            writer.write(np.zeros((SIZE[1], SIZE[0], 3), dtype=np.uint8))
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+
+import hud_kernels
+from config import HUD_CONFIG
+from hud_kernels import (
+    hud_rgba_numpy, hud_rgba_numba, blend_numpy, blend_numba, pixel_kernel_backend,
+    _synthetic_hud
+)
+
+# bg_lum_threshold, fade_strength, base_bg_alpha as used by blend_hud
+PARAMS = (90, 0.9, 0.75)
+TOLERANCE = 1
+
+needs_numba = pytest.mark.skipif(not hud_kernels.has_numba, reason="numba is not installed")
+
+
+def _grids(W, H):
+    return np.meshgrid(np.arange(W), np.arange(H))
+
+
+def _max_diff(a, b):
+    return int(np.abs(a.astype(np.int16) - b.astype(np.int16)).max())
+
+
+# ================================================================
+#  NUMPY (VARSAYILAN / YEDEK)
+#  ================================================================
+
+def test_hud_rgba_numpy_empty_canvas():
+    hud = np.zeros((90, 160, 3), dtype=np.uint8)
+    assert hud_rgba_numpy(hud, *_grids(160, 90), *PARAMS) is None
+
+
+def test_hud_rgba_numpy_alpha_classes():
+    hud = np.zeros((90, 160, 3), dtype=np.uint8)
+    hud[10:20, 10:20] = (30, 30, 30)        # dark glass
+    hud[40:50, 70:90] = (255, 255, 255)     # text
+    rgba = hud_rgba_numpy(hud, *_grids(160, 90), *PARAMS)
+    assert rgba.shape == (90, 160, 4) and rgba.dtype == np.uint8
+    assert np.array_equal(rgba[:, :, :3], hud)
+    assert (rgba[40:50, 70:90, 3] == 255).all()
+    assert 0 < rgba[15, 15, 3] < 255
+    assert rgba[0, 0, 3] == 0 and rgba[80, 150, 3] == 0
+
+
+def test_blend_numpy_endpoints():
+    img = np.full((4, 4, 3), 200, dtype=np.uint8)
+    hud = np.full((4, 4, 3), 100, dtype=np.uint8)
+    alpha = np.zeros((4, 4), dtype=np.float32)
+    alpha[0] = 1.0
+    alpha[1] = 0.5
+    out = blend_numpy(img, hud, alpha)
+    assert (out[0] == 100).all()
+    assert (out[1] == 150).all()
+    assert (out[2:] == 200).all()
+
+
+@pytest.fixture
+def no_numba(monkeypatch):
+    monkeypatch.setattr(hud_kernels, 'has_numba', False)
+    monkeypatch.setattr(hud_kernels, '_warned', False)
+
+
+@pytest.mark.parametrize('choice', ['numpy', 'auto'])
+def test_backend_numpy_without_numba(no_numba, monkeypatch, capsys, choice):
+    monkeypatch.setitem(HUD_CONFIG, 'pixel_kernels', choice)
+    assert pixel_kernel_backend() == 'numpy'
+    assert capsys.readouterr().out == ''
+
+
+def test_backend_numba_missing_warns_once(no_numba, monkeypatch, capsys):
+    monkeypatch.setitem(HUD_CONFIG, 'pixel_kernels', 'numba')
+    assert pixel_kernel_backend() == 'numpy'
+    first = capsys.readouterr().out
+    assert 'numba' in first and first.count('⚠️') == 2
+    assert pixel_kernel_backend() == 'numpy'
+    assert capsys.readouterr().out == ''
+
+
+def test_backend_numpy_choice_wins_over_numba(monkeypatch):
+    monkeypatch.setattr(hud_kernels, 'has_numba', True)
+    monkeypatch.setitem(HUD_CONFIG, 'pixel_kernels', 'numpy')
+    assert pixel_kernel_backend() == 'numpy'
+
+
+# ================================================================
+#  NUMBA ↔ NUMPY EŞDEĞERLİĞİ
+#  ================================================================
+
+@needs_numba
+@pytest.mark.parametrize('W,H,seed', [(1280, 720, 0), (641, 359, 1), (1920, 1080, 2)])
+def test_hud_rgba_numba_matches_numpy(W, H, seed):
+    hud = _synthetic_hud(W, H, seed)
+    ref = hud_rgba_numpy(hud, *_grids(W, H), *PARAMS)
+    got = hud_rgba_numba(hud, *PARAMS)
+    assert got.shape == ref.shape and got.dtype == np.uint8
+    assert _max_diff(ref, got) <= TOLERANCE
+
+
+@needs_numba
+def test_hud_rgba_numba_empty_canvas():
+    assert hud_rgba_numba(np.zeros((90, 160, 3), dtype=np.uint8), *PARAMS) is None
+
+
+@needs_numba
+@pytest.mark.parametrize('W,H,seed', [(1280, 720, 0), (641, 359, 1)])
+def test_blend_numba_matches_numpy(W, H, seed):
+    hud = _synthetic_hud(W, H, seed)
+    frame = np.random.default_rng(seed + 1).integers(0, 256, size=(H, W, 3), dtype=np.uint8)
+    alpha = hud_rgba_numpy(hud, *_grids(W, H), *PARAMS)[:, :, 3].astype(np.float32) / 255.0
+    ref = blend_numpy(frame, hud, alpha)
+    got = blend_numba(frame, hud, alpha)
+    assert got.shape == ref.shape and got.dtype == np.uint8
+    assert _max_diff(ref, got) <= TOLERANCE
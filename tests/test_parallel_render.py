@@ -0,0 +1,59 @@
+import pytest
+
+from parallel_render import plan_chunks
+
+
+def _covers(chunks, total_frames):
+    # Contiguous, non-empty, no overlap, exactly [0, total_frames)
+    pos = 0
+    for first, count in chunks:
+        assert first == pos and count > 0
+        pos += count
+    return pos == total_frames
+
+
+@pytest.mark.parametrize('total_frames,fps,workers,keys', [
+    (1, 30.0, 4, []),
+    (299, 30.0, 1, []),
+    (3000, 30.0, 4, []),
+    (3001, 29.97, 3, [0.0, 2.0, 4.1, 8.3, 50.0]),
+    (1800, 60.0, 8, [i * 0.5 for i in range(200)]),
+])
+def test_chunks_cover_all_frames_once(total_frames, fps, workers, keys):
+    chunks = plan_chunks(total_frames, fps, 0.0, keys, workers, chunk_seconds=10)
+    assert chunks
+    assert _covers(chunks, total_frames)
+
+
+def test_empty_timeline():
+    assert plan_chunks(0, 30.0, 0.0, [1.0], 4, 10) == []
+    assert plan_chunks(-5, 30.0, 0.0, [1.0], 4, 10) == []
+
+
+def test_borders_snap_to_keyframes_within_half_a_chunk():
+    # target 300 frames at 30 fps: the 4 s keyframe is 180 frames from the
+    # border at 300 (kept), the 21 s one 30 frames from 600 (snapped)
+    chunks = plan_chunks(900, 30.0, 0.0, [4.0, 21.0], 1, chunk_seconds=10)
+    assert [first for first, _ in chunks] == [0, 300, 630]
+    assert _covers(chunks, 900)
+
+
+def test_keyframes_use_the_start_offset():
+    # Keyframe at 12.5 s of the source is frame 75 of a timeline starting at 10 s
+    chunks = plan_chunks(200, 30.0, 10.0, [12.5], 1, chunk_seconds=3)
+    assert chunks[1][0] == 75
+
+
+def test_snap_limit_is_inclusive():
+    # target 100: a keyframe exactly 50 frames away snaps, 51 does not
+    assert plan_chunks(300, 10.0, 0.0, [15.0], 1, 10)[1][0] == 150
+    assert plan_chunks(300, 10.0, 0.0, [15.1], 1, 10)[1][0] == 100
+
+
+def test_workers_shorten_the_chunks():
+    one = plan_chunks(600, 30.0, 0.0, [], 1, chunk_seconds=60)
+    four = plan_chunks(600, 30.0, 0.0, [], 4, chunk_seconds=60)
+    assert one == [(0, 600)]
+    assert four == [(0, 150), (150, 150), (300, 150), (450, 150)]
+    # Never fewer chunks than workers when there are enough frames
+    assert len(plan_chunks(601, 30.0, 0.0, [], 4, 60)) >= 4
@@ -0,0 +1,21 @@
+import pytest
+
+from config import ICON_CACHE_CONFIG, THEME_CACHE_CONFIG
+from segmented_render import config_fingerprint
+
+
+@pytest.mark.parametrize('key,value', [('speed_step', 2.0), ('enabled', False)])
+def test_icon_cache_settings_change_the_fingerprint(monkeypatch, tmp_path, key, value):
+    video = tmp_path / 'in.mp4'
+    video.write_bytes(b'')
+    before = config_fingerprint(str(video))
+    monkeypatch.setitem(ICON_CACHE_CONFIG, key, value)
+    assert config_fingerprint(str(video)) != before
+
+
+def test_theme_cache_dir_does_not_change_the_fingerprint(monkeypatch, tmp_path):
+    video = tmp_path / 'in.mp4'
+    video.write_bytes(b'')
+    before = config_fingerprint(str(video))
+    monkeypatch.setitem(THEME_CACHE_CONFIG, 'dir', str(tmp_path / 'themes'))
+    assert config_fingerprint(str(video)) == before
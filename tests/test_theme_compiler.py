@@ -0,0 +1,94 @@
+import os
+import pickle
+
+import numpy as np
+import pytest
+
+import theme_compiler
+from config import THEME_CACHE_CONFIG
+from themes import get_theme
+from theme_compiler import CompiledTheme, compile_theme, theme_key
+
+RESOLUTION = (640, 360)
+
+
+@pytest.fixture
+def disk_cache(monkeypatch, tmp_path):
+    monkeypatch.setitem(THEME_CACHE_CONFIG, 'enabled', True)
+    monkeypatch.setitem(THEME_CACHE_CONFIG, 'dir', str(tmp_path))
+    return tmp_path
+
+
+def _no_build(*args):
+    raise AssertionError("theme was rebuilt instead of loaded from disk")
+
+
+def _assert_same_theme(a, b):
+    assert isinstance(b, CompiledTheme)
+    assert (a.key, a.name, a.resolution, a.scale) == (b.key, b.name, b.resolution, b.scale)
+    assert dict(a.colors) == dict(b.colors)
+    assert np.array_equal(a.grade_lut, b.grade_lut)
+    assert np.array_equal(a.hr_zone_index, b.hr_zone_index)
+    assert a.hr_zones == b.hr_zones
+    assert dict(a.units) == dict(b.units)
+    assert a.fonts.keys() == b.fonts.keys()
+    for role, font in a.fonts.items():
+        other = b.fonts[role]
+        assert (font.face, font.size, font.thickness, font.height) == \
+            (other.face, other.size, other.thickness, other.height)
+        assert np.array_equal(font.advances, other.advances)
+    assert a.sprites.keys() == b.sprites.keys()
+    for k, (mask, ox, oy) in a.sprites.items():
+        other, oox, ooy = b.sprites[k]
+        assert (ox, oy) == (oox, ooy) and np.array_equal(mask, other)
+
+
+def test_second_compile_loads_from_disk(disk_cache, monkeypatch):
+    theme = get_theme('classic')
+    built = compile_theme(theme, RESOLUTION)
+    assert len(list(disk_cache.glob('*.pkl'))) == 1
+
+    monkeypatch.setattr(theme_compiler, '_build', _no_build)
+    loaded = compile_theme(theme, RESOLUTION)
+    assert loaded is not built
+    _assert_same_theme(built, loaded)
+    # Read-only tables survive the round trip
+    assert not loaded.grade_lut.flags.writeable
+    assert loaded.icon('compass') is not None
+
+
+@pytest.mark.parametrize('damage', ['garbage', 'truncated'])
+def test_corrupt_cache_file_is_rebuilt(disk_cache, damage):
+    theme = get_theme('classic')
+    built = compile_theme(theme, RESOLUTION)
+    path, = disk_cache.glob('*.pkl')
+    data = path.read_bytes()
+    path.write_bytes(b'not a pickle' if damage == 'garbage' else data[:len(data) // 2])
+
+    rebuilt = compile_theme(theme, RESOLUTION)
+    _assert_same_theme(built, rebuilt)
+    # ...and the cache file is written again
+    with open(path, 'rb') as f:
+        assert pickle.load(f).key == built.key
+
+
+def test_unwritable_cache_dir_still_compiles(monkeypatch, tmp_path):
+    blocker = tmp_path / 'file'
+    blocker.write_text('')
+    monkeypatch.setitem(THEME_CACHE_CONFIG, 'enabled', True)
+    monkeypatch.setitem(THEME_CACHE_CONFIG, 'dir', os.path.join(str(blocker), 'cache'))
+    assert isinstance(compile_theme(get_theme('classic'), RESOLUTION), CompiledTheme)
+
+
+def test_theme_key_tracks_colors_and_scale():
+    theme = get_theme('classic')
+    base = theme_key(theme, RESOLUTION, 1.0)
+    assert theme_key(get_theme('classic'), RESOLUTION, 1.0) == base
+
+    recolored = dict(theme, colors=dict(theme['colors']))
+    name = next(iter(recolored['colors']))
+    recolored['colors'][name] = (1, 2, 3)
+    assert theme_key(recolored, RESOLUTION, 1.0) != base
+
+    assert theme_key(theme, RESOLUTION, 0.5) != base
+    assert theme_key(theme, (1280, 720), 1.0) != base
@@ -0,0 +1,346 @@
+# ================================================================
+#  TTF METİN VE GLİF ATLASI MODÜLÜ (text_atlas.py)
+#  ================================================================
+#  Hershey fontları kontur için putText'i her yazıda onlarca kez
+#  damgalıyordu. FONT_CONFIG['use_freetype'] açıkken:
+#
+#  - TTF fontu FONT_CONFIG['font_path'] ya da font_family_preferred
+#    listesinden sistem font klasörlerinde aranır
+#  - Her glif (font, piksel boyutu) başına bir kez alfa maskesine
+#    çizilir; ASCII glifleri tek bir atlas dizisinde paketlenir
+#    (cv2.freetype varsa o, yoksa Pillow ile rasterize edilir)
+#  - Yazı = atlastan glif blit'i; kontur = maskenin dilate'i,
+#    gölge = kaydırılmış maske → hepsi tek bir sprite'ta birleşir
+#  - Sprite'lar (yazı, renk, kontur, gölge) anahtarıyla sınırlı LRU'da
+#    tutulur; progress 'text' önbelleği olarak sayılır
+#  - Font ya da rasterizer yoksa bir kez uyarıp Hershey'e döner
+#  ================================================================
+
+import os
+import threading
+
+import cv2
+import numpy as np
+
+from config import FONT_CONFIG
+from utils import blit_icon_sprite
+from icon_cache import IconSpriteCache
+
+try:
+    has_freetype = hasattr(cv2, 'freetype') and hasattr(cv2.freetype, 'createFreeType2')
+except Exception:
+    has_freetype = False
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+    has_pillow = True
+except ImportError:
+    has_pillow = False
+
+# Atlasa önceden çizilen karakterler (FontMetrics ile aynı aralık)
+ATLAS_CHARS = ''.join(chr(c) for c in range(32, 127))
+
+FONT_DIRS = [
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fonts'),
+    os.path.expanduser('~/.fonts'),
+    os.path.expanduser('~/.local/share/fonts'),
+    '/usr/share/fonts',
+    '/usr/local/share/fonts',
+    '/Library/Fonts',
+    '/System/Library/Fonts',
+    os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts'),
+]
+
+
+def find_font(names):
+    """First file in FONT_DIRS whose name matches one of `names` (case-insensitive)."""
+    wanted = [n.lower() for n in names or []]
+    if not wanted:
+        return None
+    found = {}
+    for root_dir in FONT_DIRS:
+        if not os.path.isdir(root_dir):
+            continue
+        for root, _, files in os.walk(root_dir):
+            for name in files:
+                found.setdefault(name.lower(), os.path.join(root, name))
+    for name in wanted:
+        if name in found:
+            return found[name]
+    return None
+
+
+# ================================================================
+#  RASTERIZER'LAR
+#  ================================================================
+
+class _PillowRaster:
+    """Glyph masks through Pillow's FreeType binding."""
+
+    backend = 'pillow'
+
+    def __init__(self, path):
+        self.path = path
+        self._fonts = {}
+
+    def glyph(self, px, ch):
+        font = self._fonts.get(px)
+        if font is None:
+            font = self._fonts[px] = ImageFont.truetype(self.path, px)
+        advance = font.getlength(ch)
+        l, t, r, b = font.getbbox(ch, anchor='ls')
+        if r <= l or b <= t:
+            return None, 0, 0, advance
+        im = Image.new('L', (r - l, b - t))
+        ImageDraw.Draw(im).text((-l, -t), ch, font=font, fill=255, anchor='ls')
+        return np.asarray(im, dtype=np.uint8), l, t, advance
+
+
+class _FreeTypeRaster:
+    """Glyph masks through cv2.freetype (opencv-contrib)."""
+
+    backend = 'cv2.freetype'
+
+    def __init__(self, path):
+        self.path = path
+        self._ft = cv2.freetype.createFreeType2()
+        self._ft.loadFontData(path, 0)
+        self._baselines = {}
+
+    def _draw(self, px, ch):
+        # Same pen origin for every glyph; the baseline row is taken from 'H'
+        canvas = np.zeros((3 * px, 3 * px), dtype=np.uint8)
+        self._ft.putText(canvas, ch, (px, 2 * px), px, 255, -1, cv2.LINE_AA, True)
+        return canvas
+
+    def glyph(self, px, ch):
+        if px not in self._baselines:
+            ys = np.nonzero(self._draw(px, 'H').max(axis=1))[0]
+            self._baselines[px] = int(ys.max()) + 1 if len(ys) else 2 * px
+        (advance, _), _ = self._ft.getTextSize(ch, px, -1)
+        mask = self._draw(px, ch)
+        ys, xs = np.nonzero(mask)
+        if len(xs) == 0:
+            return None, 0, 0, advance
+        x0, x1, y0, y1 = int(xs.min()), int(xs.max()) + 1, int(ys.min()), int(ys.max()) + 1
+        return np.ascontiguousarray(mask[y0:y1, x0:x1]), x0 - px, y0 - self._baselines[px], advance
+
+
+# ================================================================
+#  GLİF ATLASI
+#  ================================================================
+
+class GlyphAtlas:
+    """
+    Alpha masks of one font at one pixel size.
+
+    The printable ASCII glyphs are packed into a single uint8 atlas and
+    each glyph is a view into it; other characters are rasterized on
+    first use. A glyph is (mask, left, top, advance) with left/top the
+    mask corner relative to the pen on the baseline.
+    """
+
+    def __init__(self, raster, px):
+        self.px = px
+        self._raster = raster
+        self._lock = threading.Lock()
+        self.glyphs = {}
+        rendered = [(ch,) + tuple(raster.glyph(px, ch)) for ch in ATLAS_CHARS]
+        cell_w = max([1] + [m.shape[1] for _, m, _, _, _ in rendered if m is not None])
+        cell_h = max([1] + [m.shape[0] for _, m, _, _, _ in rendered if m is not None])
+        cols = 16
+        rows = (len(rendered) + cols - 1) // cols
+        self.atlas = np.zeros((rows * cell_h, cols * cell_w), dtype=np.uint8)
+        for i, (ch, mask, left, top, advance) in enumerate(rendered):
+            if mask is not None:
+                y, x = (i // cols) * cell_h, (i % cols) * cell_w
+                h, w = mask.shape
+                self.atlas[y:y + h, x:x + w] = mask
+                mask = self.atlas[y:y + h, x:x + w]
+            self.glyphs[ch] = (mask, left, top, advance)
+        self.atlas.setflags(write=False)
+        h_mask = self.glyphs['H'][0]
+        self.cap_height = h_mask.shape[0] if h_mask is not None else px
+        self.descent = max([0] + [m.shape[0] + t for m, _, t, _ in self.glyphs.values() if m is not None])
+
+    def glyph(self, ch):
+        g = self.glyphs.get(ch)
+        if g is None:
+            with self._lock:
+                g = self.glyphs.get(ch)
+                if g is None:
+                    g = self.glyphs[ch] = tuple(self._raster.glyph(self.px, ch))
+        return g
+
+    def width(self, text):
+        """Advance width of `text` in pixels."""
+        return int(round(sum(self.glyph(ch)[3] for ch in text)))
+
+    def compose(self, text):
+        """
+        Alpha mask of a whole string.
+
+        Returns:
+            tuple: (alpha, ox, oy) - pen origin on the baseline at (ox, oy) inside alpha
+        """
+        placed = []
+        pen = 0.0
+        for ch in text:
+            mask, left, top, advance = self.glyph(ch)
+            if mask is not None:
+                placed.append((mask, int(round(pen)) + left, top))
+            pen += advance
+        if not placed:
+            return np.zeros((1, 1), dtype=np.uint8), 0, 0
+        x0 = min(x for _, x, _ in placed)
+        y0 = min(y for _, _, y in placed)
+        x1 = max(x + m.shape[1] for m, x, _ in placed)
+        y1 = max(y + m.shape[0] for m, _, y in placed)
+        alpha = np.zeros((y1 - y0, x1 - x0), dtype=np.uint8)
+        for mask, x, y in placed:
+            h, w = mask.shape
+            dst = alpha[y - y0:y - y0 + h, x - x0:x - x0 + w]
+            # Overlapping glyph edges keep the stronger coverage
+            cv2.max(dst, mask, dst=dst)
+        return alpha, -x0, -y0
+
+
+# ================================================================
+#  DURUM
+#  ================================================================
+
+_raster = None
+_raster_checked = False
+_atlases = {}
+_pixel_sizes = {}
+_raster_lock = threading.Lock()
+_atlas_lock = threading.Lock()
+_sprites = IconSpriteCache(FONT_CONFIG.get('text_cache_entries', 1024), name='text')
+
+
+def _get_raster():
+    global _raster, _raster_checked
+    if _raster_checked:
+        return _raster
+    with _raster_lock:
+        if _raster_checked:
+            return _raster
+        path = FONT_CONFIG.get('font_path') or find_font(FONT_CONFIG.get('font_family_preferred'))
+        if not path or not os.path.isfile(path):
+            print("⚠️  TTF font bulunamadı; Hershey fontları kullanılıyor.")
+            print("⚠️  No TTF font found; using Hershey fonts.")
+        elif not (has_freetype or has_pillow):
+            print("⚠️  cv2.freetype / Pillow yok; Hershey fontları kullanılıyor.")
+            print("⚠️  Neither cv2.freetype nor Pillow available; using Hershey fonts.")
+        else:
+            try:
+                _raster = _FreeTypeRaster(path) if has_freetype else _PillowRaster(path)
+            except Exception as e:
+                print(f"⚠️  TTF font yüklenemedi ({path}): {e}")
+                print(f"⚠️  Could not load TTF font ({path}): {e}")
+        _raster_checked = True
+    return _raster
+
+
+def ttf_text_enabled():
+    """True when FONT_CONFIG asks for TTF text and a font + rasterizer were found."""
+    return bool(FONT_CONFIG.get('use_freetype')) and _get_raster() is not None
+
+
+def ttf_font_info():
+    """(font path, backend) of the active TTF rasterizer, or None."""
+    raster = _get_raster() if FONT_CONFIG.get('use_freetype') else None
+    return (raster.path, raster.backend) if raster is not None else None
+
+
+def get_atlas(px):
+    """Glyph atlas of the active font at `px` pixels (built once)."""
+    atlas = _atlases.get(px)
+    if atlas is None:
+        raster = _get_raster()
+        with _atlas_lock:
+            atlas = _atlases.get(px)
+            if atlas is None:
+                atlas = _atlases[px] = GlyphAtlas(raster, px)
+    return atlas
+
+
+def _atlas_for(face, font_scale):
+    # Pixel size whose cap height matches the Hershey face at this scale,
+    # so layouts tuned for Hershey keep their vertical spacing
+    key = (face, float(font_scale))
+    px = _pixel_sizes.get(key)
+    if px is None:
+        (_, cap), _ = cv2.getTextSize('H', face, font_scale, 1)
+        ref = get_atlas(64)
+        px = _pixel_sizes[key] = max(6, int(round(cap * 64.0 / max(1, ref.cap_height))))
+    return get_atlas(px)
+
+
+def _build_sprite(atlas, text, color, outline_radius, outline_color, shadow_offset, shadow_color):
+    alpha, ox, oy = atlas.compose(text)
+    sx, sy = shadow_offset or (0, 0)
+    pad = outline_radius + max(abs(sx), abs(sy))
+    if pad:
+        alpha = cv2.copyMakeBorder(alpha, pad, pad, pad, pad, cv2.BORDER_CONSTANT, value=0)
+    layers = []
+    halo = alpha
+    if outline_radius > 0:
+        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (2 * outline_radius + 1,) * 2)
+        halo = cv2.dilate(alpha, kernel)
+    if shadow_offset is not None:
+        shift = np.float32([[1, 0, sx], [0, 1, sy]])
+        layers.append((cv2.warpAffine(halo, shift, (halo.shape[1], halo.shape[0])), shadow_color))
+    if outline_radius > 0:
+        layers.append((halo, outline_color))
+    layers.append((alpha, color))
+
+    # Back to front "over", in the blit's own form: premultiplied BGR and
+    # inverse alpha, each layer applied like blit_icon_sprite would
+    bgr = np.zeros(alpha.shape + (3,), dtype=np.uint8)
+    inv_alpha = np.full_like(bgr, 255)
+    for mask, layer_color in layers:
+        mask3 = cv2.merge([mask, mask, mask])
+        inv3 = cv2.bitwise_not(mask3)
+        colored = cv2.multiply(mask3, tuple(float(c) for c in layer_color[:3]) + (0.0,), scale=1 / 255.0)
+        cv2.add(cv2.multiply(bgr, inv3, scale=1 / 255.0), colored, dst=bgr)
+        cv2.multiply(inv_alpha, inv3, dst=inv_alpha, scale=1 / 255.0)
+    bgr.setflags(write=False)
+    inv_alpha.setflags(write=False)
+    return bgr, inv_alpha, ox + pad, oy + pad
+
+
+# ================================================================
+#  ÇİZİM VE ÖLÇÜM
+#  ================================================================
+
+def draw_ttf_text(img, text, org, face, font_scale, color, outline_radius=0, outline_color=(0, 0, 0),
+                  shadow_offset=None, shadow_color=(0, 0, 0)):
+    """
+    Draw `text` with its baseline-left corner at `org`, like cv2.putText.
+
+    The string sprite (text, outline halo and shadow in one) is built
+    from the glyph atlas on first use and then only blitted.
+    """
+    atlas = _atlas_for(face, font_scale)
+    color = tuple(int(c) for c in color)
+    outline_color = tuple(int(c) for c in outline_color)
+    shadow_color = tuple(int(c) for c in shadow_color)
+    shadow_offset = tuple(int(v) for v in shadow_offset) if shadow_offset else None
+    key = (atlas.px, text, color, int(outline_radius), outline_color, shadow_offset, shadow_color)
+    sprite = _sprites.get(key, lambda: _build_sprite(atlas, text, color, int(outline_radius), outline_color,
+                                                     shadow_offset, shadow_color))
+    blit_icon_sprite(img, sprite, org[0], org[1])
+
+
+def text_size(text, face, font_scale, thickness):
+    """Drop-in for cv2.getTextSize that measures the TTF font when it is active."""
+    if not ttf_text_enabled():
+        return cv2.getTextSize(text, face, font_scale, thickness)
+    atlas = _atlas_for(face, font_scale)
+    return (atlas.width(text), atlas.cap_height), atlas.descent
+
+
+def clear_text_cache():
+    """Drop cached string sprites (the glyph atlases stay)."""
+    _sprites.clear()
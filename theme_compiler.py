@@ -0,0 +1,345 @@
+# ================================================================
+#  TEMA DERLEME MODÜLÜ (theme_compiler.py)
+#  ================================================================
+#  themes.get_theme düz sözlükler döndürür; widget'lar bunları her
+#  frame'de dallanan Python aramalarıyla okur. Derleme adımı bir
+#  tema + çözünürlük için her şeyi bir kez hazırlar:
+#
+#  - Eğim → renk ve nabız → (zone, renk, isim) tabloları (LUT)
+#  - Birim tablosu (çarpan, etiket, format) → format_value
+#  - Çözülmüş font yüzleri ve karakter genişlikleri (getTextSize yok)
+#  - Sabit ikonlar (dağ, rota, kadans, saat, yükseklik, pusula)
+#    hazır kaplama maskesi sprite'ları olarak; renk blit sırasında
+#  - Sonuç dondurulmuş bir nesne; tema hash'i ile diskte önbelleklenir
+#
+#    .vpro_theme_cache/
+#        <tema>_<W>x<H>_<anahtar>.pkl
+#  ================================================================
+
+import hashlib
+import json
+import os
+import pickle
+from types import MappingProxyType
+
+import cv2
+import numpy as np
+
+from config import (
+    THEME_CACHE_CONFIG, COLORS, OPACITY, FONT_CONFIG, HR_ZONES,
+    UNIT_SYSTEM, UNIT_CONVERSIONS, UNIT_LABELS, ADVANCED_CONFIG, current_theme
+)
+from themes import get_font_config
+from utils import (
+    draw_mountain_icon, draw_route_icon, draw_cadence_icon, draw_time_icon,
+    draw_elevation_icon, draw_compass_icon, render_icon_mask, blit_icon_mask
+)
+from progress import progress_cache
+
+# Bump when the compiled layout changes: old cache files are then ignored
+COMPILER_VERSION = 1
+
+# Grade LUT: 0.01 % steps up to 15 % (the last color band)
+GRADE_LUT_STEP = 0.01
+GRADE_LUT_MAX = 15.0
+
+# Icons drawn the same way every frame: compiled to sprites
+STATIC_ICONS = {
+    'mountain': draw_mountain_icon,
+    'route': draw_route_icon,
+    'cadence': draw_cadence_icon,
+    'time': draw_time_icon,
+    'elevation': draw_elevation_icon,
+    'compass': draw_compass_icon,
+}
+
+# Title icons of the map / elevation boxes and the progress bar clock
+_TITLE_ICON_SIZE = 7
+
+# Unit types formatted with int() instead of one decimal
+_INTEGER_UNITS = ('altitude',)
+
+# Compiled themes of this process, keyed by theme_key
+_compiled = {}
+
+
+class _Frozen:
+    """Attributes can be set in __init__ only."""
+
+    _frozen = False
+
+    def __setattr__(self, name, value):
+        if self._frozen:
+            raise AttributeError(f"{type(self).__name__} is read-only")
+        object.__setattr__(self, name, value)
+
+
+def _read_only(array):
+    array.setflags(write=False)
+    return array
+
+
+class FontMetrics(_Frozen):
+    """
+    A resolved Hershey font role (title / value / unit / small).
+
+    Hershey glyph advances add up: cv2.getTextSize width of a string equals
+    the sum of (single-character width - 1) plus 1, so widths of any ASCII
+    text come from a 95-entry table.
+    """
+
+    def __init__(self, face, size, thickness):
+        self.face = face
+        self.size = float(size)
+        self.thickness = float(thickness)
+        self.cv_thickness = max(1, int(round(thickness)))
+        (_, self.height), _ = cv2.getTextSize('0', face, self.size, self.cv_thickness)
+        self.advances = _read_only(np.array(
+            [cv2.getTextSize(chr(c), face, self.size, self.cv_thickness)[0][0] - 1 for c in range(32, 127)],
+            dtype=np.int32))
+        self._frozen = True
+
+    def text_width(self, text):
+        """Width in pixels, as cv2.getTextSize(text, ...)[0][0]."""
+        advances = self.advances
+        width = 1
+        for ch in text:
+            c = ord(ch) - 32
+            if not 0 <= c < 95:
+                return cv2.getTextSize(text, self.face, self.size, self.cv_thickness)[0][0]
+            width += advances[c]
+        return int(width)
+
+
+class CompiledTheme(_Frozen):
+    """
+    Ready-to-draw form of a theme for one HUD resolution. Built by
+    compile_theme; every table and sprite is read-only.
+    """
+
+    def __init__(self, key, name, resolution, scale, colors, grade_lut, hr_zone_index,
+                 hr_zones, units, fonts, sprites):
+        self.key = key
+        self.name = name
+        self.resolution = tuple(resolution)
+        self.scale = float(scale)
+        self.colors = MappingProxyType(dict(colors))
+        self.grade_lut = _read_only(grade_lut)
+        # Tuples for cv2 calls
+        self.grade_colors = tuple(tuple(int(c) for c in row) for row in grade_lut)
+        self.hr_zone_index = _read_only(hr_zone_index)
+        self.hr_zones = tuple(hr_zones)
+        self.units = MappingProxyType(dict(units))
+        self.fonts = MappingProxyType(dict(fonts))
+        self.sprites = MappingProxyType(dict(sprites))
+        self._icons = MappingProxyType({name: self._icon_drawer(name) for name in STATIC_ICONS})
+        self._frozen = True
+
+    # Mapping proxies and icon closures do not pickle: store plain dicts
+    _MAPPINGS = ('colors', 'units', 'fonts', 'sprites')
+
+    def __getstate__(self):
+        state = {k: v for k, v in self.__dict__.items() if k != '_icons'}
+        for name in self._MAPPINGS:
+            state[name] = dict(state[name])
+        return state
+
+    def __setstate__(self, state):
+        for name, value in state.items():
+            object.__setattr__(self, name, MappingProxyType(value) if name in self._MAPPINGS else value)
+        for array in [self.grade_lut, self.hr_zone_index] + [mask for mask, _, _ in self.sprites.values()]:
+            array.setflags(write=False)
+        object.__setattr__(self, '_icons',
+                           MappingProxyType({name: self._icon_drawer(name) for name in STATIC_ICONS}))
+
+    # ---------- tablolar ----------
+
+    def grade_color(self, grade):
+        """BGR color of a grade (%), as utils.get_gradient_color (0.01 % steps)."""
+        i = int(grade / GRADE_LUT_STEP) if grade > 0 else 0
+        return self.grade_colors[min(i, len(self.grade_colors) - 1)]
+
+    def hr_zone(self, hr):
+        """(zone_number, zone_color, zone_text), as data_handler.get_hr_zone."""
+        if not hr:
+            return self.hr_zones[0]
+        if 0 <= hr < len(self.hr_zone_index):
+            return self.hr_zones[self.hr_zone_index[int(hr)]]
+        return self.hr_zones[5]
+
+    def format_value(self, value, unit_type):
+        """(value text, unit label), as widgets.format_value."""
+        factor, unit, integer = self.units[unit_type]
+        if value is None:
+            return "--", unit
+        converted = value * factor
+        return (f"{int(converted)}" if integer else f"{converted:.1f}"), unit
+
+    # ---------- ikonlar ----------
+
+    def _icon_drawer(self, name):
+        draw = STATIC_ICONS[name]
+        sprites = self.sprites
+
+        def icon(img, cx, cy, size, color, val=None):
+            sprite = sprites.get((name, size))
+            if sprite is None:
+                draw(img, cx, cy, size, color)
+            else:
+                blit_icon_mask(img, sprite, cx, cy, color)
+
+        return icon
+
+    def icon(self, name):
+        """Drop-in for utils.draw_<name>_icon: blits the sprite compiled for that size."""
+        return self._icons[name]
+
+
+# ================================================================
+#  DERLEME
+#  ================================================================
+
+def _grade_lut(colors):
+    # Same bands and int() truncation as utils.get_gradient_color
+    low, mid, high = (np.array(colors[k], dtype=np.float64) for k in ('ele_low', 'ele_mid', 'ele_high'))
+    grades = np.arange(int(round(GRADE_LUT_MAX / GRADE_LUT_STEP)) + 1) * GRADE_LUT_STEP
+    lut = np.empty((len(grades), 3), dtype=np.float64)
+    lut[:] = low
+    band = (grades >= 3) & (grades < 8)
+    lut[band] = low + ((grades[band] - 3) / 5)[:, None] * (mid - low)
+    band = (grades >= 8) & (grades < 15)
+    lut[band] = mid + ((grades[band] - 8) / 7)[:, None] * (high - mid)
+    lut[grades >= 15] = high
+    return lut.astype(np.int64).astype(np.uint8)
+
+
+def _hr_tables(colors):
+    # Zone bounds are whole bpm, so int(hr) picks the zone exactly
+    zones = [(None, (128, 128, 128), "---")]
+    zones += [(z, tuple(colors[f'zone{z}']), HR_ZONES[z]['name']) for z in range(1, 6)]
+    top = int(HR_ZONES[5]['max'])
+    index = np.full(top, 5, dtype=np.uint8)
+    for z in range(5, 0, -1):
+        index[max(0, int(HR_ZONES[z]['min'])):min(top, int(HR_ZONES[z]['max']))] = z
+    return index, zones
+
+
+def _font_table(theme):
+    from widgets import _resolve_face
+    fonts = _theme_fonts(theme)
+    return {role: FontMetrics(_resolve_face(FONT_CONFIG.get(f'font_face_{role}')),
+                              fonts[f'{role}_size'], fonts[f'{role}_thickness'])
+            for role in ('title', 'value', 'unit', 'small')}
+
+
+def _icon_sizes(resolution):
+    from hud_layout import widget_geometry
+    from widgets import panel_icon_box
+    panel = panel_icon_box(widget_geometry(*resolution)['bh'])[2]
+    return {'mountain': panel, 'route': panel, 'cadence': panel,
+            'time': _TITLE_ICON_SIZE, 'elevation': _TITLE_ICON_SIZE, 'compass': _TITLE_ICON_SIZE}
+
+
+def _theme_fonts(theme):
+    return theme.get('fonts') or get_font_config(theme.get('font_style', 'modern'))
+
+
+def theme_key(theme, resolution, scale):
+    """Hash of everything a compiled theme is built from."""
+    from hud_layout import widget_geometry
+    payload = {
+        'version': COMPILER_VERSION,
+        'cv2': cv2.__version__,
+        'theme': theme,
+        'fonts': _theme_fonts(theme),
+        'faces': {k: v for k, v in FONT_CONFIG.items() if k.startswith('font_face_')},
+        'units': [UNIT_SYSTEM, UNIT_CONVERSIONS.get(UNIT_SYSTEM), UNIT_LABELS.get(UNIT_SYSTEM)],
+        'hr_zones': HR_ZONES,
+        'icon_size_ratio': ADVANCED_CONFIG.get('icon_size_ratio'),
+        'geometry': widget_geometry(*resolution),
+        'resolution': [int(resolution[0]), int(resolution[1])],
+        'scale': float(scale),
+    }
+    blob = json.dumps(payload, sort_keys=True, default=repr, ensure_ascii=True)
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()[:16]
+
+
+def _build(theme, resolution, scale, key):
+    colors = theme['colors']
+    hr_index, hr_zones = _hr_tables(colors)
+    labels, factors = UNIT_LABELS[UNIT_SYSTEM], UNIT_CONVERSIONS[UNIT_SYSTEM]
+    units = {u: (factors[u], labels[u], u in _INTEGER_UNITS) for u in labels}
+    sprites = {}
+    for name, size in _icon_sizes(resolution).items():
+        sprites[(name, size)] = render_icon_mask(STATIC_ICONS[name], size)
+    return CompiledTheme(key, theme.get('name', ''), resolution, scale, colors,
+                         _grade_lut(colors), hr_index, hr_zones, units, _font_table(theme), sprites)
+
+
+def get_theme_cache_dir():
+    """Cache directory from THEME_CACHE_CONFIG (default: .vpro_theme_cache in the working directory)."""
+    return THEME_CACHE_CONFIG.get('dir') or '.vpro_theme_cache'
+
+
+def compile_theme(theme, resolution, scale=1.0):
+    """
+    Compile `theme` (a themes.THEMES dict) for a HUD drawn at `resolution`
+    (W, H) with HUD downscale `scale`. Loaded from the disk cache when the
+    theme hash matches, built and stored otherwise.
+
+    Returns:
+        CompiledTheme
+    """
+    resolution = (int(resolution[0]), int(resolution[1]))
+    key = theme_key(theme, resolution, scale)
+    use_disk = THEME_CACHE_CONFIG.get('enabled', True)
+    path = None
+    if use_disk:
+        safe_name = ''.join(c if c.isalnum() else '_' for c in str(theme.get('name', 'theme')))
+        path = os.path.join(get_theme_cache_dir(), f"{safe_name}_{resolution[0]}x{resolution[1]}_{key}.pkl")
+        try:
+            with open(path, 'rb') as f:
+                compiled = pickle.load(f)
+            if isinstance(compiled, CompiledTheme) and compiled.key == key:
+                progress_cache('theme', True)
+                return compiled
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            pass
+    progress_cache('theme', False)
+
+    compiled = _build(theme, resolution, scale, key)
+    if path is not None:
+        try:
+            os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, 'wb') as f:
+                pickle.dump(compiled, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            # A read-only cache directory only costs the next run a rebuild
+            pass
+    return compiled
+
+
+def active_theme():
+    """The selected theme with the live config tables (COLORS, OPACITY, FONT_CONFIG)."""
+    theme = dict(current_theme)
+    theme['colors'] = COLORS
+    theme['opacity'] = OPACITY
+    theme['fonts'] = {k: FONT_CONFIG[k] for k in FONT_CONFIG if k.endswith(('_size', '_thickness'))}
+    return theme
+
+
+def get_compiled_theme(resolution, scale=1.0):
+    """
+    The active theme compiled for `resolution` (compiled once per process).
+
+    Keyed by theme_key, not by resolution alone: fan-out branches switch
+    the live theme tables in place and may share one HUD size.
+    """
+    theme = active_theme()
+    key = theme_key(theme, resolution, scale)
+    compiled = _compiled.get(key)
+    if compiled is None:
+        compiled = _compiled.setdefault(key, compile_theme(theme, resolution, scale))
+    return compiled
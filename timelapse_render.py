@@ -0,0 +1,147 @@
+# ================================================================
+#  TIMELAPSE RENDER MODÜLÜ (timelapse_render.py)
+#  ================================================================
+#  Uzun sürüşlerden hızlandırılmış (10×–30×) video:
+#
+#  - Çıkış frame'leri sabit adımla (hız katsayısı veya hedef süre)
+#    seçilir; sadece bu frame'ler dönüştürülür, HUD'lanır ve kodlanır
+#  - Kısa adımlarda tek decoder + ffmpeg `select` filtresi (atlanan
+#    frame'ler Python'a hiç gelmez), GOP'tan uzun adımlarda her frame
+#    için giriş seek'i (sadece bir GOP çözülür)
+#  - HUD telemetrisi gerçek sürüş saatine göre (kaynak zamanı) alınır
+#  ================================================================
+
+import math
+
+import numpy as np
+from tqdm import tqdm
+
+from config import TIMELAPSE_CONFIG
+from data_handler import telemetry_row
+from ffmpeg_utils import FrameReader, FrameWriter, probe_keyframe_times
+from progress import progress_update
+from utils import clear_gradient_cache
+from video_renderer import resolve_render_window, get_encoder_settings, new_hud_cache, compose_frame
+
+
+# ================================================================
+#  FRAME SEÇİMİ
+#  ================================================================
+
+def plan_timelapse(duration, start_offset, src_fps, out_fps, speed=None, target_seconds=None):
+    """
+    Return (speed, stride, times). Output frame k shows source frame
+    round(k * stride) of the window, where stride = speed * src_fps / out_fps
+    source frames; `times` are those frames' source times (the ride clock
+    the HUD uses).
+
+    `target_seconds` (output length) takes precedence over `speed`.
+    """
+    if target_seconds:
+        speed = duration / float(target_seconds)
+    stride = max(1.0, float(speed or 1.0) * src_fps / out_fps)
+    speed = stride * out_fps / src_fps
+    total = int(duration * src_fps)
+    count = max(1, int(math.ceil(total / stride - 1e-9)))
+    # Halves round down, matching the select expression in iter_timelapse_frames
+    times = [start_offset + math.ceil(k * stride - 0.5) / src_fps for k in range(count)]
+    return speed, stride, times
+
+
+def choose_decode_method(step, keyframe_times, method='auto'):
+    """
+    'select' decodes sequentially and lets ffmpeg's select filter keep the
+    output frames; 'seek' re-opens the decoder at every output frame.
+    Seeking pays off once the step is longer than about two GOPs.
+    """
+    if method in ('select', 'seek'):
+        return method
+    if len(keyframe_times) < 2:
+        return 'select'
+    gop = float(np.median(np.diff(keyframe_times)))
+    return 'seek' if step > 2.0 * gop else 'select'
+
+
+def iter_timelapse_frames(video_path, size, times, stride, method):
+    """Yield the BGR frame for each time in `times` (None if the video ended)."""
+    if method == 'seek':
+        for t in times:
+            with FrameReader(video_path, size, t, 1) as reader:
+                yield reader.read()
+        return
+    # Keep frame n when a slot k*stride rounds to it (same frames as plan_timelapse);
+    # the rest are dropped inside ffmpeg before pixel conversion
+    expr = f"gt(floor((n+0.5)/{stride:.9f})\\,floor((n-0.5)/{stride:.9f}))"
+    with FrameReader(video_path, size, times[0], len(times), passthrough=True,
+                     video_filter=f"select={expr}") as reader:
+        for _ in times:
+            yield reader.read()
+
+
+# ================================================================
+#  ANA TIMELAPSE RENDER
+#  ================================================================
+
+def render_video_timelapse(clip, data_handler, output_file):
+    """
+    Render a sped-up video, decoding only the frames that are output.
+
+    Args:
+        clip: MoviePy VideoFileClip object (closed after planning)
+        data_handler: DataHandler object
+        output_file: Output video file
+    """
+    W, H = int(clip.size[0]), int(clip.size[1])
+    start_offset, duration = resolve_render_window(clip)
+    video_path = clip.filename
+    out_fps = float(TIMELAPSE_CONFIG.get('output_fps') or clip.fps)
+
+    speed, stride, times = plan_timelapse(duration, start_offset, clip.fps, out_fps,
+                                          TIMELAPSE_CONFIG.get('speed', 20),
+                                          TIMELAPSE_CONFIG.get('target_seconds'))
+    step = stride / clip.fps
+
+    keyframes = []
+    if TIMELAPSE_CONFIG.get('method', 'auto') == 'auto':
+        try:
+            keyframes = probe_keyframe_times(video_path)
+        except Exception as e:
+            print(f"   ⚠️ Keyframe probe failed ({e}); decoding sequentially")
+    method = choose_decode_method(step, keyframes, TIMELAPSE_CONFIG.get('method', 'auto'))
+    clip.close()
+
+    print(f"\n📝 Opening output video:")
+    print(f"   • File: {output_file}")
+    print(f"   • Resolution: {W}x{H}")
+    print(f"   • FPS: {out_fps}")
+    print(f"   • Timelapse: {speed:.1f}× ({duration:.0f}s → {len(times) / out_fps:.1f}s), "
+          f"{len(times)} frames, decode by {method}")
+
+    print("\n📈 Interpolating telemetry at output frame times...")
+    telemetry = data_handler.get_data_batch(times)
+
+    print("\n▶️  Starting timelapse render...\n")
+
+    hud_cache = new_hud_cache()
+    ff_preset, ff_threads = get_encoder_settings()
+    frames_done = 0
+    try:
+        with FrameWriter(output_file, (W, H), out_fps, preset=ff_preset, threads=ff_threads) as writer:
+            frames = iter_timelapse_frames(video_path, (W, H), times, stride, method)
+            try:
+                for i, img_bgr in enumerate(tqdm(frames, total=len(times), unit='frame')):
+                    if img_bgr is None:
+                        break
+                    data = telemetry_row(telemetry, i)
+                    writer.write(compose_frame(img_bgr, data, data_handler, times[i], hud_cache))
+                    frames_done += 1
+                    progress_update(frames_done, len(times))
+            finally:
+                frames.close()
+    finally:
+        clear_gradient_cache()
+
+    print(f"\n✅ RENDER COMPLETE!")
+    print(f"   • {frames_done} frames processed")
+    print(f"   • Duration: {frames_done / out_fps:.1f}s")
+    print(f"   • File: {output_file}")
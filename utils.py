@@ -352,6 +352,108 @@ def draw_compass_icon(img, cx, cy, size, color):
     cv2.line(img, (cx, cy), (cx, cy + s - 2), color, 1, cv2.LINE_AA)
 
 
+# ================================================================
+#  İKON SPRITE'LARI
+#  ================================================================
+
+def render_icon_mask(draw_func, size, *args):
+    """
+    Rasterize an icon once as an 8-bit coverage mask.
+
+    The icon is drawn in white on black, so each pixel holds how much of
+    it the LINE_AA strokes cover. Blitting the mask approximates drawing
+    the icon directly in that color: overlapping anti-aliased strokes round
+    differently, so pixels may be off by up to ~5 levels per channel
+    (usually 3), and a few glass pixels whose luminance sits at the HUD's
+    bg_lum_threshold can flip between background and content alpha. The
+    cadence spokes come from truncated float endpoints, so drawing that
+    icon directly is not translation invariant either; its sprite may
+    differ from a direct draw by a one-pixel shift of a spoke.
+
+    Args:
+        draw_func: draw_*_icon(img, cx, cy, size, color, *args)
+        size: İkon boyutu
+
+    Returns:
+        tuple: (mask, ox, oy) - icon center at (ox, oy) inside the cropped mask
+    """
+    pad = 2 * int(size) + 8
+    canvas = np.zeros((2 * pad + 1, 2 * pad + 1, 3), dtype=np.uint8)
+    draw_func(canvas, pad, pad, int(size), (255, 255, 255), *args)
+    coverage = canvas[:, :, 0]
+    ys, xs = np.nonzero(coverage)
+    if len(xs) == 0:
+        return np.zeros((1, 1), dtype=np.uint8), 0, 0
+    x0, x1, y0, y1 = int(xs.min()), int(xs.max()) + 1, int(ys.min()), int(ys.max()) + 1
+    mask = np.ascontiguousarray(coverage[y0:y1, x0:x1])
+    mask.setflags(write=False)
+    return mask, pad - x0, pad - y0
+
+
+def blit_icon_mask(img, sprite, cx, cy, color):
+    """
+    Paint `color` through a render_icon_mask() sprite centered at (cx, cy),
+    clipped to img. Approximate; see render_icon_mask for the bound.
+    """
+    mask, ox, oy = sprite
+    mh, mw = mask.shape
+    x, y = int(cx) - ox, int(cy) - oy
+    x0, y0 = max(0, x), max(0, y)
+    x1, y1 = min(img.shape[1], x + mw), min(img.shape[0], y + mh)
+    if x1 <= x0 or y1 <= y0:
+        return
+    a = mask[y0 - y:y1 - y, x0 - x:x1 - x, None].astype(np.uint16)
+    roi = img[y0:y1, x0:x1]
+    col = np.asarray(color, dtype=np.uint16)
+    roi[:] = (roi * (255 - a) + col * a + 127) // 255
+
+
+def render_icon_sprite(draw_func, size, color, *args):
+    """
+    Rasterize a (possibly multi-colored) icon once as a BGRA sprite.
+
+    The icon is drawn on black and on white: the difference gives the
+    coverage (alpha) and the black pass the alpha-premultiplied color.
+    The sprite keeps both halves in blit-ready form: premultiplied BGR
+    and the 3-channel inverse alpha (255 - A).
+
+    Returns:
+        tuple: (bgr, inv_alpha, ox, oy) - icon center at (ox, oy) inside the cropped sprite
+    """
+    pad = 2 * int(size) + 8
+    dark = np.zeros((2 * pad + 1, 2 * pad + 1, 3), dtype=np.uint8)
+    light = np.full_like(dark, 255)
+    draw_func(dark, pad, pad, int(size), color, *args)
+    draw_func(light, pad, pad, int(size), color, *args)
+    alpha = 255 - (light.astype(np.int16) - dark).max(axis=2)
+    alpha = np.clip(alpha, 0, 255).astype(np.uint8)
+    ys, xs = np.nonzero(alpha)
+    if len(xs) == 0:
+        return np.zeros((1, 1, 3), dtype=np.uint8), np.full((1, 1, 3), 255, dtype=np.uint8), 0, 0
+    x0, x1, y0, y1 = int(xs.min()), int(xs.max()) + 1, int(ys.min()), int(ys.max()) + 1
+    bgr = np.ascontiguousarray(dark[y0:y1, x0:x1])
+    inv_alpha = np.ascontiguousarray(np.repeat(255 - alpha[y0:y1, x0:x1, None], 3, axis=2))
+    bgr.setflags(write=False)
+    inv_alpha.setflags(write=False)
+    return bgr, inv_alpha, pad - x0, pad - y0
+
+
+def blit_icon_sprite(img, sprite, cx, cy):
+    """Composite a render_icon_sprite() sprite centered at (cx, cy), clipped to img."""
+    bgr, inv_alpha, ox, oy = sprite
+    sh, sw = bgr.shape[:2]
+    x, y = int(cx) - ox, int(cy) - oy
+    x0, y0 = max(0, x), max(0, y)
+    x1, y1 = min(img.shape[1], x + sw), min(img.shape[0], y + sh)
+    if x1 <= x0 or y1 <= y0:
+        return
+    roi = img[y0:y1, x0:x1]
+    sx, sy = x0 - x, y0 - y
+    # dst = dst * (255 - A) / 255 + premultiplied color, in place
+    cv2.add(cv2.multiply(roi, inv_alpha[sy:sy + y1 - y0, sx:sx + x1 - x0], scale=1 / 255.0),
+            bgr[sy:sy + y1 - y0, sx:sx + x1 - x0], dst=roi)
+
+
 # ================================================================
 #  HARITA VE NAVİGASYON
 #  ================================================================
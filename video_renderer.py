@@ -25,6 +25,7 @@ import sys
 import os
 import shutil
 import tempfile
+import time
 
 # Modülleri import et
 from config import (
@@ -34,13 +35,21 @@ from config import (
     WIDGET_WIDTH_RATIO, WIDGET_HEIGHT_RATIO, WIDGET_MIN_WIDTH, WIDGET_MIN_HEIGHT,
     BOX_SIZE_RATIO, BOX_SIZE_MIN, PADDING_RATIO, PADDING_MIN, GAP_RATIO, GAP_MIN,
     PROGRESS_BAR_WIDTH_RATIO, PROGRESS_BAR_HEIGHT,
-    QUALITY_CONFIG, HUD_CONFIG
+    QUALITY_CONFIG, HUD_CONFIG, POWER_CONFIG, RENDER_MODE, DECODE_CONFIG, PROFILE_CONFIG
 )
-from data_handler import DataHandler, get_hr_zone
+from ffmpeg_utils import FrameReader, FrameWriter, probe_frame_times, is_variable_frame_rate
+import frame_cache
+from auto_cut import auto_cut_enabled, plan_moving_timeline
+from data_handler import DataHandler, get_hr_zone, telemetry_row
 from utils import clear_gradient_cache, draw_power_icon
 from hud_layout import render_unified_hud
+from hud_kernels import pixel_kernel_backend, blend_numpy, blend_numba
 from config import COLORS, WIDGETS_ENABLED
 from widgets import draw_panel_v2
+from messages import render_status
+from profiler import span, record, start_profiling, stop_profiling
+from progress import start_progress, progress_update, progress_cache, finish_progress, render_state
+from metrics import start_metrics, finish_metrics
 
 
 # ================================================================
@@ -133,25 +142,31 @@ def precompute_resources(W, H):
         _ = create_concave_gradient(box_test, box_test)
         print("   ✅ Gradient cache created")
 
+    # Compile the theme (LUTs, font metrics, icon sprites) before the first frame
+    from theme_compiler import get_compiled_theme
+    hud_scale = max(0.25, min(1.0, float(HUD_CONFIG.get('hud_downscale', 1.0))))
+    theme = get_compiled_theme((max(1, int(W * hud_scale)), max(1, int(H * hud_scale))), hud_scale)
+    print(f"   • Theme compiled: {theme.name} ({len(theme.sprites)} icon sprites)")
+
+    from hud_kernels import warm_up_kernels
+    print(f"   • Pixel kernels: {warm_up_kernels()}")
+
+    from text_atlas import ttf_font_info
+    font = ttf_font_info()
+    if font:
+        print(f"   • TTF font: {os.path.basename(font[0])} ({font[1]})")
+
 
 # ================================================================
 #  FRAME RENDER LOOP
 #  ================================================================
 
-def render_video(clip, data_handler, output_file):
+def resolve_render_window(clip):
     """
-    Render video and write to output file.
-    
-    Args:
-        clip: MoviePy VideoFileClip object
-        data_handler: DataHandler object
-        output_file: Output video file
+    Return (start_offset, duration) of the part of `clip` to render,
+    honouring demo mode settings.
     """
-    W, H = int(clip.size[0]), int(clip.size[1])
-    
-    # Limit video duration in demo mode
     duration = clip.duration
-    # Demo start offset handling
     start_offset = 0.0
     if DEMO_MODU:
         start_offset = float(DEMO_START_SECONDS)
@@ -161,10 +176,354 @@ def render_video(clip, data_handler, output_file):
             start_offset = 0.0
         duration = min(float(DEMO_MODE_SECONDS), max(0.0, duration - start_offset))
         print(f"\n🎬 Processing {int(duration)}s in demo mode (start: {int(start_offset)}s)")
+    return start_offset, duration
+
+
+class FrameSource:
+    """
+    BGR source frames on the render timeline: frame `n` is the source frame
+    at `n / fps + start_offset`.
+
+    With DECODE_CONFIG['fast_seek'] the decoder is opened with ffmpeg input
+    seeking at the first requested frame (see FrameReader), so a window
+    deep into a long video starts as fast as one at 0. Sequential requests
+    read the next frame from the pipe, short forward jumps are read
+    through and anything else re-opens the decoder at the new time.
+    Otherwise frames come from MoviePy's `clip.get_frame`.
+
+    With FRAME_CACHE_CONFIG enabled, frames [0, end_frame) are served from
+    the decoded-frame cache when present; a source read in order from frame
+    0 (`cache_record`) fills the cache for the next run.
+    """
+
+    def __init__(self, clip, fps, start_offset, end_frame=None, video_path=None, cache_record=True):
+        self.clip = clip
+        self.video_path = video_path or clip.filename
+        self.size = (int(clip.size[0]), int(clip.size[1]))
+        self.fps = fps
+        self.start_offset = start_offset
+        self.end_frame = end_frame
+        self.fast_seek = bool(DECODE_CONFIG.get('fast_seek', True))
+        self.max_skip = int(DECODE_CONFIG.get('max_skip_frames', 100))
+        self.reader = None
+        self.pos = None          # frame index the reader returns next
+        self.last_n = None
+        self.last = None
+        self.last_borrowed = False
+        self.cached = None
+        self.recorder = None
+        if end_frame and frame_cache.cache_enabled():
+            self.cached, self.recorder = frame_cache.open_window(
+                self.video_path, self.size, fps, start_offset, end_frame, record=cache_record)
+            progress_cache('frame_cache', self.cached is not None)
+            if self.cached is not None:
+                print(f"   ⚡ Frame cache hit: {end_frame} decoded frames")
+            elif self.recorder is not None:
+                print(f"   💾 Caching {end_frame} decoded frames for the next run")
+
+    def _open(self, n):
+        if self.reader is not None:
+            self.reader.close()
+        count = None if self.end_frame is None else max(1, self.end_frame - n)
+        self.reader = FrameReader(self.video_path, self.size, n / self.fps + self.start_offset, count)
+        self.pos = n
+
+    def get(self, n, out=None):
+        """
+        Return frame `n` as a BGR array (the last frame past the end).
+
+        With `out` the frame is written into that buffer (decoded straight
+        into it on the ffmpeg path) and `out` is returned; the caller may
+        then modify it freely.
+        """
+        if n == self.last_n:
+            return self._deliver(self._owned_last(), out)
+
+        borrowed = False
+        if self.cached is not None and 0 <= n < self.end_frame:
+            frame = self.cached[n]
+        elif not self.fast_seek:
+            src_t = n / self.fps + self.start_offset
+            frame = cv2.cvtColor(self.clip.get_frame(src_t), cv2.COLOR_RGB2BGR)
+        else:
+            if self.reader is None or n < self.pos or n - self.pos > self.max_skip:
+                self._open(n)
+            elif n > self.pos:
+                self.reader.skip(n - self.pos)
+            frame = self.reader.read(out)
+            borrowed = out is not None
+            self.pos = n + 1
+            if frame is None:
+                if self.last is None:
+                    raise RuntimeError(f"no video frame at {n / self.fps + self.start_offset:.3f}s "
+                                       f"in {self.video_path}")
+                # Like MoviePy: past the end, keep showing the last frame
+                return self._deliver(self._owned_last(), out)
+
+        if self.recorder is not None:
+            self.recorder.put(n, frame)
+        self.last_n = n
+        self.last = frame
+        self.last_borrowed = borrowed
+        return self._deliver(frame, out)
+
+    @staticmethod
+    def _deliver(frame, out):
+        if out is None or frame is out:
+            return frame
+        np.copyto(out, frame)
+        return out
+
+    def _owned_last(self):
+        # A frame read into a caller's buffer may have been changed since;
+        # decode it again once into an array of our own
+        if self.last_borrowed:
+            self._open(self.last_n)
+            frame = self.reader.read()
+            self.pos = self.last_n + 1
+            if frame is None:
+                raise RuntimeError(f"no video frame at {self.last_n / self.fps + self.start_offset:.3f}s "
+                                   f"in {self.video_path}")
+            self.last = frame
+            self.last_borrowed = False
+        return self.last
+
+    def close(self):
+        if self.reader is not None:
+            self.reader.close()
+            self.reader = None
+        if self.recorder is not None:
+            self.recorder.abort()
+            self.recorder = None
+        self.cached = None
+
+
+def get_encoder_settings():
+    """Return (preset, threads) for libx264 from QUALITY_CONFIG."""
+    ff_preset = QUALITY_CONFIG.get('ffmpeg_preset', 'medium') if isinstance(QUALITY_CONFIG, dict) else 'medium'
+    ff_threads = int(QUALITY_CONFIG.get('ffmpeg_threads', 4)) if isinstance(QUALITY_CONFIG, dict) else 4
+    return ff_preset, ff_threads
+
+
+def new_hud_cache():
+    """Empty HUD cache used to reuse the HUD between update-rate ticks."""
+    return {'t': -9999.0, 'bgr': None, 'alpha': None}
+
+
+def hud_update_interval():
+    """Seconds between HUD redraws, or None to redraw on every frame."""
+    hud_rate = HUD_CONFIG.get('hud_update_rate', None)
+    if not hud_rate:
+        return None
+    try:
+        return 1.0 / float(hud_rate)
+    except Exception:
+        return None
+
+
+def get_hud_layer(img_bgr, data, data_handler, src_t, hud_cache, proxy_scale=None):
+    """
+    Return (hud_bgr, hud_alpha) for `src_t`, redrawing the HUD only when the
+    configured update interval has elapsed since the cached one.
+    `proxy_scale` marks `img_bgr` as a downscaled proxy (see render_unified_hud).
+    """
+    interval = hud_update_interval()
+    if interval is not None and (src_t - hud_cache['t']) < interval and hud_cache['bgr'] is not None:
+        # reuse last HUD
+        progress_cache('hud', True)
+        return hud_cache['bgr'], hud_cache['alpha']
+    progress_cache('hud', False)
+
+    hud_bgr, hud_alpha = render_unified_hud(img_bgr, data, data_handler, src_t, proxy_scale)
+    hud_cache['bgr'] = hud_bgr
+    hud_cache['alpha'] = hud_alpha
+    hud_cache['t'] = src_t
+    return hud_bgr, hud_alpha
+
+
+def compose_frame(img_bgr, data, data_handler, src_t, hud_cache, proxy_scale=None):
+    """
+    Blend the (possibly cached) HUD onto a BGR source frame and return the
+    composed BGR frame.
+    """
+    if not HUD_CONFIG.get('unified_hud', True):
+        return img_bgr
+
+    with span('hud'):
+        hud_bgr, hud_alpha = get_hud_layer(img_bgr, data, data_handler, src_t, hud_cache, proxy_scale)
+    with span('composite'):
+        return blend_hud(img_bgr, hud_bgr, hud_alpha)
+
+
+def blend_hud(img_bgr, hud_bgr, hud_alpha):
+    """Alpha-blend a HUD layer (BGR + float alpha) onto a BGR frame."""
+    if hud_alpha is not None and hud_bgr is not None:
+        if pixel_kernel_backend() == 'numba':
+            return blend_numba(img_bgr, hud_bgr, hud_alpha)
+        return blend_numpy(img_bgr, hud_bgr, hud_alpha)
+    return img_bgr
+
+
+def last_hud_update_frame(frame_idx, fps, start_offset):
+    """
+    Replay the HUD update-rate schedule of a render starting at frame 0 and
+    return the index of the frame whose HUD is on screen at `frame_idx`.
+    """
+    interval = hud_update_interval()
+    if interval is None or not HUD_CONFIG.get('unified_hud', True):
+        return frame_idx
+    last_t = None
+    last_n = 0
+    for n in range(frame_idx + 1):
+        t = n / fps + start_offset
+        if last_t is None or not ((t - last_t) < interval):
+            last_t, last_n = t, n
+    return last_n
+
+
+def prime_render_state(data_handler, hud_cache, first_frame, fps, start_offset, frame_shape):
+    """
+    Bring a fresh DataHandler view and HUD cache to the state a render from
+    frame 0 has just before `first_frame`: the power smoothing window and
+    the cached HUD. A render starting mid-timeline then produces the same
+    pixels as the uninterrupted serial render.
+    """
+    if first_frame <= 0:
+        return
+
+    window = int(POWER_CONFIG.get('smoothing_window', 5))
+    u = last_hud_update_frame(first_frame, fps, start_offset)
+
+    for n in range(max(0, u - window), u):
+        data_handler.get_data(n / fps + start_offset)
+
+    if u < first_frame:
+        t_u = u / fps + start_offset
+        data = data_handler.get_data(t_u)
+        get_hud_layer(np.zeros(frame_shape, dtype=np.uint8), data, data_handler, t_u, hud_cache)
+        for n in range(u + 1, first_frame):
+            data_handler.get_data(n / fps + start_offset)
+
+
+def probe_vfr_timeline(video_path):
+    """
+    Return the source frame times (seconds) when the render should follow
+    them instead of a constant `clip.fps`, otherwise None.
+
+    DECODE_CONFIG['vfr']: 'auto' follows the timestamps only for variable
+    frame rate sources, True always, False never.
+    """
+    mode = DECODE_CONFIG.get('vfr', 'auto')
+    if not mode:
+        return None
+    try:
+        frame_times = probe_frame_times(video_path)
+    except Exception as e:
+        print(f"   ⚠️ Frame timestamp probe failed ({e}); assuming constant frame rate")
+        return None
+    if not frame_times:
+        return None
+    if mode == 'auto' and not is_variable_frame_rate(frame_times):
+        return None
+    return frame_times
+
+
+def render_video_vfr(clip, data_handler, output_file, frame_times):
+    """
+    Render following the source's own frame timestamps (VFR sources).
+
+    Every source frame in the render window is decoded exactly once,
+    telemetry is interpolated at its real presentation time (batched) and
+    the frame is encoded with that same time, so nothing is duplicated or
+    dropped to reach a constant rate.
+
+    Args:
+        clip: MoviePy VideoFileClip object
+        data_handler: DataHandler object
+        output_file: Output video file
+        frame_times: Source frame times from probe_frame_times
+    """
+    W, H = int(clip.size[0]), int(clip.size[1])
+    start_offset, duration = resolve_render_window(clip)
+    video_path = clip.filename
+    clip.close()
+
+    # Same rule as ffmpeg's accurate seek: first frame at or after the start
+    window = [t for t in frame_times if start_offset - 1e-6 <= t < start_offset + duration]
+    if not window:
+        raise RuntimeError(f"no video frames between {start_offset:.3f}s and {start_offset + duration:.3f}s")
+    avg_fps = (len(window) - 1) / (window[-1] - window[0]) if window[-1] > window[0] else clip.fps
+
+    print(f"\n📝 Opening output video:")
+    print(f"   • File: {output_file}")
+    print(f"   • Resolution: {W}x{H}")
+    print(f"   • FPS: variable (avg {avg_fps:.2f}, source timestamps kept)")
+    print(f"   • Codec: libx264 (MP4)")
+
+    print("\n📈 Interpolating telemetry at frame timestamps...")
+    telemetry = data_handler.get_data_batch(window)
+
+    print("\n▶️  Starting render...\n")
+
+    hud_cache = new_hud_cache()
+    ff_preset, ff_threads = get_encoder_settings()
+    frames_done = 0
+    try:
+        with FrameReader(video_path, (W, H), start_offset, len(window), passthrough=True) as reader, \
+                FrameWriter(output_file, (W, H), clip.fps, preset=ff_preset, threads=ff_threads,
+                            timestamps=True) as writer:
+            for i, src_t in enumerate(tqdm(window, unit='frame')):
+                img_bgr = reader.read()
+                if img_bgr is None:
+                    break
+                data = telemetry_row(telemetry, i)
+                composed = compose_frame(img_bgr, data, data_handler, src_t, hud_cache)
+                writer.write(composed, src_t - window[0])
+                frames_done += 1
+                progress_update(frames_done, len(window))
+    finally:
+        clear_gradient_cache()
+
+    print(f"\n✅ RENDER COMPLETE!")
+    print(f"   • {frames_done} frames processed")
+    print(f"   • Duration: {window[frames_done - 1] - window[0] if frames_done else 0.0:.1f}s")
+    print(f"   • File: {output_file}")
+
+
+def render_video(clip, data_handler, output_file):
+    """
+    Render video and write to output file.
+    
+    Args:
+        clip: MoviePy VideoFileClip object
+        data_handler: DataHandler object
+        output_file: Output video file
+    """
+    frame_times = probe_vfr_timeline(clip.filename)
+    if frame_times is not None:
+        print(f"\n⏱️  Variable frame rate source: following {len(frame_times)} frame timestamps")
+        if auto_cut_enabled():
+            print("   ⚠️ Auto-cut is not applied to variable frame rate sources")
+        return render_video_vfr(clip, data_handler, output_file, frame_times)
+
+    W, H = int(clip.size[0]), int(clip.size[1])
+    
+    # Limit video duration in demo mode
+    start_offset, duration = resolve_render_window(clip)
     
     # Use MoviePy to render MP4 via ffmpeg (libx264). This avoids cv2 VideoWriter
     # codec issues inside Docker and produces H.264 MP4 output.
     fps = clip.fps
+
+    # Stopped footage is left out: output frame k shows window frame timeline.frames[k]
+    timeline = None
+    out_duration = duration
+    if auto_cut_enabled():
+        timeline = plan_moving_timeline(data_handler, clip.duration, start_offset, duration, fps)
+        if len(timeline) == 0:
+            raise RuntimeError("auto-cut removed the whole render window")
+        out_duration = len(timeline) / fps
+
     print(f"\n📝 Opening output video:")
     print(f"   • File: {output_file}")
     print(f"   • Resolution: {W}x{H}")
@@ -174,64 +533,61 @@ def render_video(clip, data_handler, output_file):
     print("\n▶️  Starting render...\n")
 
     # Cache for HUD rendering to allow lower update rates (improves perf)
-    hud_cache = {'t': -9999.0, 'bgr': None, 'alpha': None}
+    hud_cache = new_hud_cache()
+    source = FrameSource(clip, fps, start_offset, end_frame=int(duration * fps))
+    total_out = int(out_duration * fps)
+    # MoviePy asks for frame 0 once to probe the size and again when writing;
+    # remember the last frame so the repeat does not advance render state.
+    last_frame = {'n': None, 'rgb': None, 'returned': None}
 
     # make_frame must return an RGB image (H, W, 3) as float [0..255] or uint8
     def make_frame(t_sec):
-        # Map local timeline t_sec to source clip time if demo start offset is used
-        src_t = t_sec + start_offset if DEMO_MODU else t_sec
+        n = int(round(t_sec * fps))
+        if n == last_frame['n']:
+            return last_frame['rgb']
+        t_start = time.perf_counter()
+        # MoviePy pipes the previous frame to ffmpeg between our calls
+        if last_frame['returned'] is not None:
+            record('encode', last_frame['returned'], t_start)
 
-        # Get source frame (RGB)
-        frame_rgb = clip.get_frame(src_t)
+        # Output frame → window frame (differs only when stops are cut)
+        src_n = n
+        if timeline is not None:
+            src_n = int(timeline.frames[min(n, len(timeline) - 1)])
+
+        # Map local timeline t_sec to source clip time if demo start offset is used
+        src_t = src_n / fps + start_offset
 
-        # Convert to BGR for OpenCV-based HUD rendering
-        img_bgr = cv2.cvtColor(frame_rgb, cv2.COLOR_RGB2BGR)
+        # Get source frame (BGR, decoder opened at the window start)
+        with span('decode'):
+            img_bgr = source.get(src_n)
 
         # Interpolate GPX data for this source time
-        data = data_handler.get_data(src_t)
+        with span('get_data'):
+            data = data_handler.get_data(src_t)
+        if timeline is not None:
+            data['moving_time'] = timeline.moving_time(src_t)
 
         # Compose HUD (with optional update-rate caching)
-        if HUD_CONFIG.get('unified_hud', True):
-            hud_rate = HUD_CONFIG.get('hud_update_rate', None)
-            do_update = True
-            if hud_rate:
-                try:
-                    interval = 1.0 / float(hud_rate)
-                except Exception:
-                    interval = None
-                if interval is not None and (src_t - hud_cache['t']) < interval and hud_cache['bgr'] is not None:
-                    # reuse last HUD
-                    hud_bgr = hud_cache['bgr']
-                    hud_alpha = hud_cache['alpha']
-                    do_update = False
-
-            if do_update:
-                hud_bgr, hud_alpha = render_unified_hud(img_bgr, data, data_handler, src_t)
-                hud_cache['bgr'] = hud_bgr
-                hud_cache['alpha'] = hud_alpha
-                hud_cache['t'] = src_t
-
-            if hud_alpha is not None and hud_bgr is not None:
-                a3 = np.dstack([hud_alpha, hud_alpha, hud_alpha])
-                composed = (img_bgr.astype(np.float32) * (1.0 - a3) + hud_bgr.astype(np.float32) * a3)
-                composed = np.clip(composed, 0, 255).astype(np.uint8)
-            else:
-                composed = img_bgr
-        else:
-            composed = img_bgr
+        composed = compose_frame(img_bgr, data, data_handler, src_t, hud_cache)
 
         # Convert back to RGB for MoviePy
-        out_rgb = cv2.cvtColor(composed, cv2.COLOR_BGR2RGB)
+        with span('rgb_convert'):
+            out_rgb = cv2.cvtColor(composed, cv2.COLOR_BGR2RGB)
+        last_frame['n'] = n
+        last_frame['rgb'] = out_rgb
+        last_frame['returned'] = time.perf_counter()
+        record('frame', t_start, last_frame['returned'])
+        progress_update(n + 1, total_out)
         return out_rgb
 
     # Create a MoviePy VideoClip from our frame function
-    video_clip_out = VideoClip(make_frame, duration=duration)
+    video_clip_out = VideoClip(make_frame, duration=out_duration)
 
     # Write the file using H.264 (requires ffmpeg). Disable audio to avoid ffmpeg audio issues.
     written_path = None
     # Allow ffmpeg preset selection via config for quality/perf tradeoff
-    ff_preset = QUALITY_CONFIG.get('ffmpeg_preset', 'medium') if isinstance(QUALITY_CONFIG, dict) else 'medium'
-    ff_threads = int(QUALITY_CONFIG.get('ffmpeg_threads', 4)) if isinstance(QUALITY_CONFIG, dict) else 4
+    ff_preset, ff_threads = get_encoder_settings()
 
     try:
         video_clip_out.write_videofile(output_file, codec='libx264', fps=fps, audio=False, threads=ff_threads, preset=ff_preset)
@@ -267,13 +623,14 @@ def render_video(clip, data_handler, output_file):
             video_clip_out.close()
         except Exception:
             pass
+        source.close()
         try:
             clip.close()
         except Exception:
             pass
         clear_gradient_cache()
         # MoviePy prints progress; count estimate based on duration*fps
-        frame_count = int(duration * fps)
+        frame_count = int(out_duration * fps)
     
     print(f"\n✅ RENDER COMPLETE!")
     print(f"   • {frame_count} frames processed")
@@ -304,17 +661,75 @@ if __name__ == "__main__":
         W, H = int(clip.size[0]), int(clip.size[1])
         precompute_resources(W, H)
         
+        if auto_cut_enabled() and RENDER_MODE != 'serial':
+            print(f"   ⚠️ AUTO_CUT_CONFIG applies to the serial render only; '{RENDER_MODE}' keeps stops")
+
+        profile = None
+        if PROFILE_CONFIG.get('enabled', False):
+            # Stage timers cover this process only (not parallel/segment worker processes)
+            render_status.start_render(0)
+            profile = start_profiling()
+            # Frame counts come from the shared state every mode reports to
+            render_state()
+        start_progress(RENDER_MODE, out_file)
+        start_metrics(out_file)
+
         # Render (out_file already validated above)
-        render_video(clip, data_handler, out_file)
+        if RENDER_MODE == 'parallel':
+            from parallel_render import render_video_parallel
+            render_video_parallel(clip, data_handler, out_file)
+        elif RENDER_MODE == 'pipeline':
+            from pipeline_render import render_video_pipelined
+            render_video_pipelined(clip, data_handler, out_file)
+        elif RENDER_MODE == 'shm':
+            from shm_render import render_video_shm
+            render_video_shm(clip, data_handler, out_file)
+        elif RENDER_MODE == 'segmented':
+            from segmented_render import render_video_segmented
+            render_video_segmented(clip, data_handler, out_file)
+        elif RENDER_MODE == 'timelapse':
+            from timelapse_render import render_video_timelapse
+            render_video_timelapse(clip, data_handler, out_file)
+        elif RENDER_MODE == 'highlights':
+            from highlights_render import render_video_highlights
+            render_video_highlights(clip, data_handler, out_file)
+        elif RENDER_MODE == 'fanout':
+            from fanout_render import render_video_fanout
+            render_video_fanout(clip, data_handler, out_file)
+        elif RENDER_MODE == 'proxy':
+            from proxy_render import render_video_proxy
+            render_video_proxy(clip, data_handler, out_file)
+        elif RENDER_MODE == 'overlay':
+            from overlay_render import render_video_overlay
+            render_video_overlay(clip, data_handler, out_file)
+        elif RENDER_MODE == 'composite':
+            from composite_render import render_video_composite
+            render_video_composite(clip, data_handler, out_file)
+        elif RENDER_MODE == 'sidecar':
+            from telemetry_export import render_video_sidecar
+            render_video_sidecar(clip, data_handler, out_file)
+        else:
+            render_video(clip, data_handler, out_file)
+
+        if profile is not None:
+            stop_profiling()
+            render_status.current_frame = render_state().frames_done
+            render_status.finish_render(out_file, profile=profile)
+        finish_progress('done')
+        finish_metrics('done')
         
         print("\n" + "="*60)
         print("  ✨ PROCESSING COMPLETE ✨")
         print("="*60 + "\n")
         
     except KeyboardInterrupt:
+        finish_progress('canceled')
+        finish_metrics('canceled')
         print("\n\n⚠️  Process canceled by user")
         sys.exit(1)
     except Exception as e:
+        finish_progress('error', e)
+        finish_metrics('error')
         print(f"\n\n❌ UNEXPECTED ERROR: {e}")
         import traceback
         traceback.print_exc()
@@ -19,11 +19,13 @@ from config import (
 )
 from utils import (
     draw_concave_rect_fast, draw_mountain_icon, draw_route_icon,
-    draw_speed_icon, draw_gradient_icon, draw_heart_icon,
+    draw_speed_icon, draw_gradient_icon,
     draw_cadence_icon, draw_time_icon, draw_elevation_icon,
     draw_compass_icon, draw_cyclist_arrow, get_gradient_color
 )
 from data_handler import get_hr_zone
+from icon_cache import cached_heart_icon
+from text_atlas import ttf_text_enabled, draw_ttf_text, text_size
 
 def format_value(value, unit_type):
     """Format value according to unit system"""
@@ -50,11 +52,6 @@ def format_value(value, unit_type):
 # ---------------------
 # Text rendering helper
 # ---------------------
-try:
-    has_freetype = hasattr(cv2, 'freetype') and hasattr(cv2.freetype, 'createFreeType2')
-except Exception:
-    has_freetype = False
-
 def _resolve_face(name):
     # name may be a cv2 constant name string like 'FONT_HERSHEY_SIMPLEX'
     if isinstance(name, int):
@@ -73,9 +70,11 @@ def draw_text(img, text, org, face_name, font_scale, color, thickness_float, lin
     - Accepts float `thickness_float` for finer control; it is rounded
       when calling OpenCV which requires integer thickness.
     - Draws an outline/stroke behind the main text for readability on
-      varying backgrounds (white/black/grey).
-    - If FreeType is configured and available, widgets may opt-in to
-      use TTF rendering (not automatic here).
+      varying backgrounds (white/black/grey), and an optional drop
+      shadow (FONT_CONFIG['shadow_enabled']).
+    - With FONT_CONFIG['use_freetype'] the TTF font is used instead: the
+      string is composed from the glyph atlas (text_atlas.py) and the
+      outline/shadow come from the same mask, so it is a single blit.
     """
     if line_type is None:
         line_type = cv2.LINE_AA
@@ -91,11 +90,24 @@ def draw_text(img, text, org, face_name, font_scale, color, thickness_float, lin
     if outline_color is None:
         oc = FONT_CONFIG.get('outline_color', (0, 0, 0))
         outline_color = oc
+    shadow_offset = FONT_CONFIG.get('shadow_offset', (2, 2)) if FONT_CONFIG.get('shadow_enabled') else None
+    shadow_color = FONT_CONFIG.get('shadow_color', (0, 0, 0))
+
+    # Outline thickness as multiplier of user thickness (float)
+    out_mul = float(FONT_CONFIG.get('outline_strength', 1.4))
+    out_th = max(1, int(round(thickness_float * out_mul)))
+
+    if ttf_text_enabled():
+        draw_ttf_text(img, text, org, face, font_scale, color,
+                      outline_radius=min(3, out_th) if outline else 0, outline_color=outline_color,
+                      shadow_offset=shadow_offset, shadow_color=shadow_color)
+        return
+
+    if shadow_offset is not None:
+        cv2.putText(img, text, (org[0] + shadow_offset[0], org[1] + shadow_offset[1]), face, font_scale,
+                    shadow_color, max(1, eff_th), line_type)
 
     if outline and eff_th >= 0:
-        # Outline thickness as multiplier of user thickness (float)
-        out_mul = float(FONT_CONFIG.get('outline_strength', 1.4))
-        out_th = max(1, int(round(thickness_float * out_mul)))
         # Draw a stamped outline by offsetting the text a few pixels in a
         # small grid. This produces a visible halo/stroke even for small
         # font sizes and makes fractional thickness perceptible.
@@ -112,11 +124,28 @@ def draw_text(img, text, org, face_name, font_scale, color, thickness_float, lin
     cv2.putText(img, text, org, face, font_scale, color, eff_th, line_type)
 
 
+def _value_text_width(text, theme):
+    # Compiled font metrics give the same width as cv2.getTextSize without the call
+    if theme is not None and not ttf_text_enabled():
+        return theme.fonts['value'].text_width(text)
+    (vw, _), _ = text_size(text, _resolve_face(FONT_CONFIG.get('font_face_value')),
+                                 FONT_CONFIG['value_size'],
+                                 max(1, int(round(FONT_CONFIG['value_thickness']))))
+    return vw
+
+
 # ================================================================
 #  TEMEL PANEL
 #  ================================================================
 
-def draw_panel_v2(img, x, y, w, h, title, value, unit_type, icon_func, icon_color):
+def panel_icon_box(h):
+    """(icon_margin, icon_box_size, icon_size) of a data panel `h` pixels tall."""
+    icon_margin = max(6, int(h * 0.12))
+    icon_box_size = max(12, h - 2 * icon_margin)
+    return icon_margin, icon_box_size, int(icon_box_size * ADVANCED_CONFIG['icon_size_ratio'])
+
+
+def draw_panel_v2(img, x, y, w, h, title, value, unit_type, icon_func, icon_color, theme=None):
     """
     Standart veri paneli çiz (yükseklik, mesafe, hız vb.).
     
@@ -135,14 +164,14 @@ def draw_panel_v2(img, x, y, w, h, title, value, unit_type, icon_func, icon_colo
         unit_type: Birim tipi (örn: "altitude", "speed")
         icon_func: İkon çizme fonksiyonu
         icon_color: İkon rengi
+        theme: CompiledTheme (birim tablosu ve font metrikleri; None = config'den)
     """
     # İçbükey arka plan
     draw_concave_rect_fast(img, x, y, w, h, BORDER_RADIUS['panel_corner'], 
                           OPACITY['panel_bg_alpha'])
 
     # Icon sizing and margins now relative to panel height (avoid fixed offsets)
-    icon_margin = max(6, int(h * 0.12))
-    icon_box_size = max(12, h - 2 * icon_margin)
+    icon_margin, icon_box_size, icon_size = panel_icon_box(h)
     icon_x = x + icon_margin
     icon_y = y + icon_margin
 
@@ -150,11 +179,11 @@ def draw_panel_v2(img, x, y, w, h, title, value, unit_type, icon_func, icon_colo
     # Try passing the panel value as an extra argument to icon functions that accept it
     try:
         icon_func(img, icon_x + icon_box_size // 2, icon_y + icon_box_size // 2,
-                  int(icon_box_size * ADVANCED_CONFIG['icon_size_ratio']), icon_color, value)
+                  icon_size, icon_color, value)
     except TypeError:
         # Fallback for icon functions that don't accept a value parameter
         icon_func(img, icon_x + icon_box_size // 2, icon_y + icon_box_size // 2,
-                  int(icon_box_size * ADVANCED_CONFIG['icon_size_ratio']), icon_color)
+                  icon_size, icon_color)
 
     # Text positions computed from panel height for better scaling
     text_x = icon_x + icon_box_size + max(8, int(h * 0.08))
@@ -171,13 +200,11 @@ def draw_panel_v2(img, x, y, w, h, title, value, unit_type, icon_func, icon_colo
     draw_text(img, title, (text_x, title_y), FONT_CONFIG.get('font_face_title'), title_size_local, title_color_local, title_thickness_local, line_type=cv2.LINE_AA)
 
     # Format value according to unit system
-    val_str, unit = format_value(value, unit_type)
+    val_str, unit = theme.format_value(value, unit_type) if theme is not None else format_value(value, unit_type)
     draw_text(img, val_str, (text_x, value_y), FONT_CONFIG.get('font_face_value'), FONT_CONFIG['value_size'], COLORS['text_main'], FONT_CONFIG['value_thickness'], line_type=cv2.LINE_AA)
 
     # Birim metni (place to the right of value)
-    (vw, vh), _ = cv2.getTextSize(val_str, _resolve_face(FONT_CONFIG.get('font_face_value')), 
-                                  FONT_CONFIG['value_size'], 
-                                  max(1, int(round(FONT_CONFIG['value_thickness']))))
+    vw = _value_text_width(val_str, theme)
     draw_text(img, unit, (text_x + vw + max(4, int(h * 0.03)), value_y), FONT_CONFIG.get('font_face_unit'), unit_size_local, title_color_local if title_color_local == COLORS['text_main'] else COLORS['text_sub'], unit_thickness_local, line_type=cv2.LINE_AA)
 
 
@@ -185,7 +212,7 @@ def draw_panel_v2(img, x, y, w, h, title, value, unit_type, icon_func, icon_colo
 #  KALP ATIŞI PANELİ - ZONE SİSTEMİ İLE
 #  ================================================================
 
-def draw_heart_panel(img, x, y, w, h, hr_value, beat_phase=0):
+def draw_heart_panel(img, x, y, w, h, hr_value, beat_phase=0, theme=None):
     """
     Kalp atış paneli - Zone göstergesi ve animasyon ile.
     
@@ -202,13 +229,14 @@ def draw_heart_panel(img, x, y, w, h, hr_value, beat_phase=0):
         w, h: Boyut
         hr_value: Kalp atış hızı (bpm)
         beat_phase: Animasyon fazı (0-2π)
+        theme: CompiledTheme (zone tablosu; None = get_hr_zone)
     """
     # İçbükey arka plan
     draw_concave_rect_fast(img, x, y, w, h, BORDER_RADIUS['panel_corner'], 
                           OPACITY['panel_bg_alpha'])
 
     # Zone bilgisini al
-    zone_num, zone_color, zone_text = get_hr_zone(hr_value)
+    zone_num, zone_color, zone_text = theme.hr_zone(hr_value) if theme is not None else get_hr_zone(hr_value)
 
     # Icon sizes relative to panel height
     icon_margin = max(6, int(h * 0.12))
@@ -221,7 +249,7 @@ def draw_heart_panel(img, x, y, w, h, hr_value, beat_phase=0):
     heart_scale_max = ADVANCED_CONFIG['heart_beat_scale_max']
     heart_scale = heart_scale_min + int((heart_scale_max - heart_scale_min) * (1 + math.sin(beat_phase)) / 2)
 
-    draw_heart_icon(img, icon_cx, icon_cy, heart_scale, zone_color, filled=True)
+    cached_heart_icon(img, icon_cx, icon_cy, heart_scale, zone_color, filled=True)
 
     # Başlık and value positions (relative) - adjusted for better spacing
     text_x = x + icon_margin + icon_size + max(8, int(h * 0.08))
@@ -233,9 +261,7 @@ def draw_heart_panel(img, x, y, w, h, hr_value, beat_phase=0):
     hr_str = str(int(hr_value)) if hr_value else "--"
     draw_text(img, hr_str, (text_x, value_y), FONT_CONFIG.get('font_face_value'), FONT_CONFIG['value_size'], COLORS['text_main'], FONT_CONFIG['value_thickness'], line_type=cv2.LINE_AA)
 
-    (vw, _), _ = cv2.getTextSize(hr_str, _resolve_face(FONT_CONFIG.get('font_face_value')), 
-                                 FONT_CONFIG['value_size'], 
-                                 max(1, int(round(FONT_CONFIG['value_thickness']))))
+    vw = _value_text_width(hr_str, theme)
     draw_text(img, "bpm", (text_x + vw + max(4, int(h * 0.03)), value_y), FONT_CONFIG.get('font_face_unit'), FONT_CONFIG['unit_size'], COLORS['text_sub'], FONT_CONFIG['unit_thickness'], line_type=cv2.LINE_AA)
 
     # Zone indicator (top right corner) - pill shaped (büyütülmüş)
@@ -271,7 +297,7 @@ def draw_heart_panel(img, x, y, w, h, hr_value, beat_phase=0):
 #  HARITA VE ELEVASİON PROFİLİ
 #  ================================================================
 
-def draw_pro_map(img, data, x, y, size, points_list):
+def draw_pro_map(img, data, x, y, size, points_list, theme=None):
     """
     Dönen harita çiz (bisikletçi merkez, rota ön/geri).
     
@@ -284,6 +310,7 @@ def draw_pro_map(img, data, x, y, size, points_list):
         x, y: Harita sol üst köşesi
         size: Harita kutusu boyutu
         points_list: Tüm waypoint'ler
+        theme: CompiledTheme (ikon sprite'ları)
     """
     if not WIDGETS_ENABLED.get('route_map'):
         return
@@ -293,7 +320,7 @@ def draw_pro_map(img, data, x, y, size, points_list):
                           OPACITY['panel_bg_alpha_large'])
     
     # Başlık
-    draw_compass_icon(img, x + 18, y + 16, 7, COLORS['accent'])
+    (theme.icon('compass') if theme is not None else draw_compass_icon)(img, x + 18, y + 16, 7, COLORS['accent'])
     draw_text(img, "ROUTE MAP", (x + 32, y + 20), FONT_CONFIG.get('font_face_title'), FONT_CONFIG['title_size'], COLORS['text_main'], FONT_CONFIG['title_thickness'], line_type=cv2.LINE_AA)
     
     # Harita merkezi
@@ -370,7 +397,7 @@ def draw_pro_map(img, data, x, y, size, points_list):
 #  EĞİM PROFİLİ GRAFİĞİ
 #  ================================================================
 
-def draw_elevation_profile(img, data, x, y, w, h, points_list):
+def draw_elevation_profile(img, data, x, y, w, h, points_list, theme=None):
     """
     Yükseklik profili grafik çiz.
     
@@ -383,6 +410,7 @@ def draw_elevation_profile(img, data, x, y, w, h, points_list):
         x, y: Sol üst köşe
         w, h: Boyut
         points_list: Tüm waypoint'ler
+        theme: CompiledTheme (eğim renk tablosu, ikon sprite'ları)
     """
     if not WIDGETS_ENABLED.get('elevation_profile'):
         return
@@ -392,7 +420,7 @@ def draw_elevation_profile(img, data, x, y, w, h, points_list):
                           OPACITY['panel_bg_alpha_large'])
     
     # Başlık
-    draw_elevation_icon(img, x + 18, y + 16, 7, COLORS['altitude'])
+    (theme.icon('elevation') if theme is not None else draw_elevation_icon)(img, x + 18, y + 16, 7, COLORS['altitude'])
     draw_text(img, "ELEVATION", (x + 32, y + 20), FONT_CONFIG.get('font_face_title'), FONT_CONFIG['title_size'], COLORS['text_main'], FONT_CONFIG['title_thickness'], line_type=cv2.LINE_AA)
     
     # Grafik alanı
@@ -418,6 +446,8 @@ def draw_elevation_profile(img, data, x, y, w, h, points_list):
     max_ele = max(ele_values) + 5
     ele_range = max_ele - min_ele if max_ele > min_ele else 1
     
+    grade_color = theme.grade_color if theme is not None else get_gradient_color
+
     # Grafik noktalarını hesapla
     graph_pts = []
     colors_at_pts = []
@@ -459,7 +489,7 @@ def draw_elevation_profile(img, data, x, y, w, h, points_list):
         else:
             grade = 0
         
-        colors_at_pts.append(get_gradient_color(grade))
+        colors_at_pts.append(grade_color(grade))
     
     # Grafiği çiz
     if len(graph_pts) > 2:
@@ -505,7 +535,7 @@ def draw_elevation_profile(img, data, x, y, w, h, points_list):
 #  İLERLEME ÇUBUĞU
 #  ================================================================
 
-def draw_progress_bar(img, x, y, w, h, progress, time_str):
+def draw_progress_bar(img, x, y, w, h, progress, time_str, theme=None):
     """
     İlerleme çubuğu çiz (bottom center).
     
@@ -515,6 +545,7 @@ def draw_progress_bar(img, x, y, w, h, progress, time_str):
         w, h: Boyut
         progress: İlerleme % (0-100)
         time_str: Zaman string (HH:MM:SS formatı)
+        theme: CompiledTheme (ikon sprite'ları)
     """
     if not WIDGETS_ENABLED.get('progress_bar'):
         return
@@ -530,7 +561,7 @@ def draw_progress_bar(img, x, y, w, h, progress, time_str):
         cv2.rectangle(img, (x + 2, y + 2), (x + 2 + fill_w, y + h - 2), COLORS['accent'], -1)
     
     # Zaman display
-    draw_time_icon(img, x + w//2 - 45, y - 18, 7, COLORS['text_sub'])
+    (theme.icon('time') if theme is not None else draw_time_icon)(img, x + w//2 - 45, y - 18, 7, COLORS['text_sub'])
     draw_text(img, time_str, (x + w//2 - 30, y - 13), FONT_CONFIG.get('font_face_title'), FONT_CONFIG['title_size'] + 0.1, COLORS['text_main'], FONT_CONFIG['title_thickness'], line_type=cv2.LINE_AA)
     
     # Yüzde göstergesi